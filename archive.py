@@ -0,0 +1,46 @@
+"""날짜별 발행본 아카이브 (백필 재렌더링용)
+
+실행마다 archive/YYYY-MM-DD.json에 그날 수집한 모든 기사(1단계 제외 기사 포함)의 메타데이터,
+1단계 점수, 2단계 번역/요약/카테고리와 AI Summary, 급상승 트렌드를 저장합니다.
+본문은 렌더링에 쓰지 않으므로 넣지 않습니다 (백필은 아카이브만으로 다시 렌더링).
+"""
+import json
+import os
+
+ARCHIVE_DIR = os.getenv('ARCHIVE_DIR', 'archive')
+ARCHIVE_EXCLUDED_FIELDS = {'body'}
+
+
+def archive_path(day, root=ARCHIVE_DIR):
+    return os.path.join(root, f'{day}.json')
+
+
+def load_edition(day, root=ARCHIVE_DIR):
+    """아카이브 로드 (없으면 None)"""
+    try:
+        with open(archive_path(day, root), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def save_edition(now_kst, articles, daily_summary, rising_trends, root=ARCHIVE_DIR):
+    """그날 아카이브 저장 (하루 여러 번 실행하면 URL 기준으로 병합, 나중 실행 결과 우선)"""
+    day = now_kst.strftime('%Y-%m-%d')
+    edition = load_edition(day, root) or {'day': day, 'articles': []}
+    merged = {a['url']: a for a in edition['articles']}
+    for article in articles:
+        entry = {k: v for k, v in article.items() if k not in ARCHIVE_EXCLUDED_FIELDS}
+        merged[article['url']] = entry
+
+    edition.update({
+        'day': day,
+        'edition_at': now_kst.strftime('%Y-%m-%d %H:%M'),
+        'daily_summary': daily_summary,
+        'rising_trends': rising_trends,
+        'articles': list(merged.values())
+    })
+    os.makedirs(root, exist_ok=True)
+    with open(archive_path(day, root), 'w', encoding='utf-8') as f:
+        json.dump(edition, f, ensure_ascii=False, indent=1)
+    return archive_path(day, root)
@@ -0,0 +1,141 @@
+"""뉴스레터 렌더링용 열 기반 기사 테이블 (NumPy 벡터 연산, 미설치 시 리스트로 동일 동작)
+
+아카이브 백필이나 여러 날 다이제스트처럼 기사가 수만 개일 때 필터링, HOT TREND 제외,
+카테고리 분류를 기사 dict를 반복 조회하지 않고 배열 연산으로 처리합니다.
+"""
+try:
+    import numpy as np
+except ImportError:  # NumPy 미설치 시 순수 Python으로 처리
+    np = None
+
+CATEGORY_NAMES = [
+    '규제 & 이슈',
+    '게임 출시 & 발표',
+    '매출 & 성과',
+    '업데이트 & 패치',
+    'IP & 콜라보',
+    '커뮤니티 & 이벤트'
+]
+CATEGORY_CODES = {name: code for code, name in enumerate(CATEGORY_NAMES)}  # 그 외 카테고리는 -1
+
+RELEVANCE_THRESHOLD = 0.5
+IMPORTANCE_THRESHOLD = 0.4
+
+
+def _number(value, default=0):
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else default
+
+
+def stage1_scores(article):
+    """(관련성, 중요도) 1단계 점수
+
+    로컬 모델이 판정한 기사는 Claude 점수가 없으므로 판정이 보장하는 하한으로 대신함
+    (로컬 통과면 통과 기준값, 로컬 제외면 0). 분류기 확률은 local_p_*에 따로 있음.
+    """
+    if 'game_relevance' in article or 'importance' in article:
+        return _number(article.get('game_relevance')), _number(article.get('importance'))
+    if article.get('stage1_passed'):
+        return RELEVANCE_THRESHOLD, IMPORTANCE_THRESHOLD
+    return 0, 0
+
+
+def build_article_table(articles):
+    """기사 목록 → 열 dict (relevance, importance, comments, category, date)
+
+    date는 'YYYY-MM-DD HH:MM' 문자열을 분 단위 datetime64로 변환 (형식이 다르면 NaT, NumPy 미설치 시 문자열 그대로).
+    """
+    scores = [stage1_scores(a) for a in articles]
+    relevance = [r for r, _ in scores]
+    importance = [i for _, i in scores]
+    comments = [_number(a.get('comments')) for a in articles]
+    category = [CATEGORY_CODES.get(a.get('category'), -1) for a in articles]
+    dates = [a.get('date') or '' for a in articles]
+
+    if np is None:
+        return {
+            'articles': articles,
+            'relevance': relevance,
+            'importance': importance,
+            'comments': comments,
+            'category': category,
+            'date': dates
+        }
+
+    try:
+        date_column = np.array(dates, dtype='datetime64[m]')  # 빈 문자열은 NaT
+    except ValueError:
+        # 일부 형식이 어긋나면 개별 변환
+        date_column = np.array([_parse_date(d) for d in dates], dtype='datetime64[m]')
+    return {
+        'articles': articles,
+        'relevance': np.asarray(relevance, dtype=np.float64),
+        'importance': np.asarray(importance, dtype=np.float64),
+        'comments': np.asarray(comments, dtype=np.int64),
+        'category': np.asarray(category, dtype=np.int8),
+        'date': date_column
+    }
+
+
+def _parse_date(value):
+    try:
+        return np.datetime64(value, 'm')
+    except ValueError:
+        return np.datetime64('NaT')
+
+
+def rows(table, indices):
+    """인덱스 → 기사 dict 목록"""
+    articles = table['articles']
+    return [articles[i] for i in indices]
+
+
+def mask_count(mask):
+    """마스크가 참인 개수"""
+    if np is None:
+        return sum(1 for flag in mask if flag)
+    return int(np.count_nonzero(mask))
+
+
+def filter_mask(table, min_relevance=RELEVANCE_THRESHOLD, min_importance=IMPORTANCE_THRESHOLD):
+    """game_relevance >= 0.5 AND importance >= 0.4 (백필에서는 기준을 바꿔 다시 렌더링)"""
+    if np is None:
+        return [r >= min_relevance and i >= min_importance
+                for r, i in zip(table['relevance'], table['importance'])]
+    return (table['relevance'] >= min_relevance) & (table['importance'] >= min_importance)
+
+
+def mask_indices(mask):
+    """마스크가 참인 인덱스 (원래 순서)"""
+    if np is None:
+        return [i for i, flag in enumerate(mask) if flag]
+    return np.flatnonzero(mask)
+
+
+def exclude(mask, indices):
+    """마스크에서 주어진 인덱스 제외 (HOT TREND에 들어간 기사 빼기)"""
+    if np is None:
+        excluded = set(indices)
+        return [flag and i not in excluded for i, flag in enumerate(mask)]
+    mask = mask.copy()
+    mask[np.asarray(indices, dtype=np.int64)] = False
+    return mask
+
+
+def group_by_category(table, mask):
+    """카테고리명 → 인덱스 목록 (각 카테고리 안은 원래 순서)"""
+    codes = table['category']
+    if np is None:
+        groups = {name: [] for name in CATEGORY_NAMES}
+        for i, flag in enumerate(mask):
+            if flag and codes[i] >= 0:
+                groups[CATEGORY_NAMES[codes[i]]].append(i)
+        return groups
+
+    indices = np.flatnonzero(mask & (codes >= 0))
+    order = np.argsort(codes[indices], kind='stable')
+    sorted_indices = indices[order]
+    boundaries = np.searchsorted(codes[sorted_indices], np.arange(len(CATEGORY_NAMES) + 1))
+    return {
+        name: sorted_indices[boundaries[code]:boundaries[code + 1]]
+        for code, name in enumerate(CATEGORY_NAMES)
+    }
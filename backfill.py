@@ -0,0 +1,140 @@
+"""과거 발행본 재생성 (아카이브에 저장된 기사와 Claude 결과만 사용)
+
+    python backfill.py --from 2025-01-01 --to 2025-12-31
+    python backfill.py --from 2025-06-01 --to 2025-06-30 --min-relevance 0.6 --out backfill_strict
+
+날짜마다 archive/YYYY-MM-DD.json을 읽어 현재 템플릿과 필터 기준으로 렌더링합니다.
+원본 페이지는 보관하지 않으므로(CI 실행 환경에 남지 않음) 본문을 다시 파싱하지 않고, 아카이브의
+점수/번역/썸네일 URL만 사용합니다. 날짜 단위로 프로세스를 나눠 병렬 처리하며, 크롤링/Claude 호출은
+하지 않습니다 (썸네일도 캐시에 있는 것만 사용).
+새 기준으로 통과했지만 2단계 번역 캐시가 없는 기사는 제외하고 개수를 보고합니다.
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+
+from archive import ARCHIVE_DIR, load_edition
+
+BACKFILL_OUTPUT_DIR = 'backfill'
+
+
+def date_range(start, end):
+    """YYYY-MM-DD 문자열 목록 (양 끝 포함)"""
+    day = datetime.strptime(start, '%Y-%m-%d')
+    last = datetime.strptime(end, '%Y-%m-%d')
+    days = []
+    while day <= last:
+        days.append(day.strftime('%Y-%m-%d'))
+        day += timedelta(days=1)
+    return days
+
+
+def has_translation(article):
+    return bool(article.get('title_kr') and article.get('content_summary_kr') and article.get('category'))
+
+
+def rebuild_day(day, output_dir, thresholds, archive_root=ARCHIVE_DIR):
+    """하루치 발행본 재생성 (워커 프로세스) → 통계 dict"""
+    import thumbnails
+    from generate_html import filter_articles, render_within_budget
+
+    started = time.perf_counter()
+    edition = load_edition(day, archive_root)
+    if edition is None:
+        return {'day': day, 'status': 'missing'}
+
+    thumbnails.THUMBNAIL_OFFLINE = True  # 캐시에 없는 썸네일은 받지 않고 원본 URL 사용
+    articles = edition['articles']
+
+    # 새 기준으로 통과한 기사 중 2단계 결과가 없는 기사는 제외 (Claude를 다시 부르지 않음)
+    passed = filter_articles(articles, thresholds)
+    untranslated = {a['url'] for a in passed if not has_translation(a)}
+    data = {
+        'edition_at': edition['edition_at'],
+        'daily_summary': edition.get('daily_summary', ''),
+        'rising_trends': edition.get('rising_trends', []),
+        'thresholds': thresholds,
+        'articles': [a for a in articles if a['url'] not in untranslated]
+    }
+    with contextlib.redirect_stdout(io.StringIO()):
+        html = render_within_budget(data)
+
+    path = os.path.join(output_dir, f'{day}.html')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(html)
+    return {
+        'day': day,
+        'status': 'ok',
+        'articles': len(articles),
+        'passed': len(passed) - len(untranslated),
+        'untranslated': len(untranslated),
+        'bytes': len(html.encode('utf-8')),
+        'seconds': time.perf_counter() - started
+    }
+
+
+def run_backfill(days, output_dir, thresholds, workers):
+    """날짜별 병렬 재생성 + 결과 보고"""
+    os.makedirs(output_dir, exist_ok=True)
+    print(f'>> 백필: {days[0]} ~ {days[-1]} ({len(days)}일, 워커 {workers}개)')
+    if thresholds:
+        print(f'   필터 기준: {thresholds}')
+    sys.stdout.flush()
+
+    started = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(rebuild_day, day, output_dir, thresholds): day for day in days}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {'day': futures[future], 'status': f'failed: {str(e)[:80]}'}
+            results.append(result)
+
+    results.sort(key=lambda r: r['day'])
+    for r in results:
+        if r['status'] != 'ok':
+            print(f'   {r["day"]}: {"아카이브 없음" if r["status"] == "missing" else r["status"]}')
+            continue
+        note = f', 번역 캐시 없음 {r["untranslated"]}개 제외' if r['untranslated'] else ''
+        print(f'   {r["day"]}: 기사 {r["articles"]}개 중 {r["passed"]}개 게재, '
+              f'{r["bytes"]:,}B ({r["seconds"]:.2f}초){note}')
+
+    done = [r for r in results if r['status'] == 'ok']
+    elapsed = time.perf_counter() - started
+    print(f'\n>> 백필 완료: {len(done)}/{len(days)}일 재생성, {elapsed:.1f}초 → {output_dir}/')
+    untranslated = sum(r['untranslated'] for r in done)
+    if untranslated:
+        print(f'   ⚠️ 새 기준으로 통과했지만 2단계 결과가 없는 기사 {untranslated}개는 제외됨')
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='과거 발행본 재생성 (네트워크/Claude 호출 없음)')
+    parser.add_argument('--from', dest='start', required=True, help='시작 날짜 (YYYY-MM-DD)')
+    parser.add_argument('--to', dest='end', required=True, help='끝 날짜 (YYYY-MM-DD, 포함)')
+    parser.add_argument('--out', default=BACKFILL_OUTPUT_DIR, help='HTML 저장 폴더')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='동시 처리할 날짜 수')
+    parser.add_argument('--min-relevance', type=float, help='게임 관련성 기준 (기본 0.5)')
+    parser.add_argument('--min-importance', type=float, help='중요도 기준 (기본 0.4)')
+    args = parser.parse_args()
+
+    days = date_range(args.start, args.end)
+    if not days:
+        parser.error('--from이 --to보다 늦습니다')
+    thresholds = {}
+    if args.min_relevance is not None:
+        thresholds['min_relevance'] = args.min_relevance
+    if args.min_importance is not None:
+        thresholds['min_importance'] = args.min_importance
+    run_backfill(days, args.out, thresholds, max(1, args.workers))
+
+
+if __name__ == '__main__':
+    main()
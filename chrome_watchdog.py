@@ -0,0 +1,158 @@
+"""Chrome 프로세스 감시 (메모리/페이지 수 기준 드라이버 재시작 + 사이트별 최대 메모리 보고)
+
+헤드리스 Chrome 하나로 상세 페이지를 계속 열면 무거운 페이지(IGN 등)에서 메모리가 계속 늘어납니다.
+WatchedDriver는 드라이버를 감싸 페이지 로드 수와 chromedriver/Chrome 프로세스 트리의 RSS 합계를
+기록하고, 크롤러가 checkpoint()를 부르는 안전한 시점(상세 페이지 사이)에 기준을 넘었으면
+드라이버를 새로 띄웁니다. 호출 측은 같은 객체를 계속 쓰면 됩니다.
+크롤링 마감이 지나도 멈춘 호출(driver.get 등)에서 돌아오지 않는 소스는 kill()로 프로세스를 종료해
+막힌 호출이 연결 오류로 바로 반환되게 합니다.
+"""
+import os
+import sys
+import threading
+
+try:
+    import psutil
+except ImportError:  # psutil 미설치 시 페이지 수 기준으로만 재시작
+    psutil = None
+
+CHROME_MAX_RSS_MB = float(os.getenv('CHROME_MAX_RSS_MB', '1536'))
+CHROME_MAX_PAGES = int(os.getenv('CHROME_MAX_PAGES', '40'))  # 재시작 전 최대 페이지 로드 수 (0은 무제한)
+
+_stats_lock = threading.Lock()
+site_stats = {}  # 사이트명 → {'pages', 'peak_rss_mb', 'restarts'}
+
+
+def process_tree_rss_mb(driver):
+    """chromedriver와 하위 Chrome 프로세스 RSS 합계 (MB, 측정 불가면 None)"""
+    if psutil is None:
+        return None
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+    except Exception:
+        return None
+    total = 0
+    for process in processes:
+        try:
+            total += process.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return total / (1024 * 1024)
+
+
+def kill_process_tree(driver):
+    """chromedriver와 하위 Chrome 프로세스 강제 종료 (psutil이 없으면 chromedriver만)"""
+    try:
+        process = driver.service.process
+    except AttributeError:
+        return
+    children = []
+    if psutil is not None:
+        try:
+            children = psutil.Process(process.pid).children(recursive=True)
+        except psutil.Error:
+            pass
+    for child in children:
+        try:
+            child.kill()
+        except psutil.Error:
+            pass
+    try:
+        process.kill()
+    except OSError:
+        pass
+
+
+class WatchedDriver:
+    """드라이버 프록시 (get 횟수/메모리 기록, checkpoint에서 필요하면 재시작)"""
+
+    def __init__(self, factory, site, max_rss_mb=CHROME_MAX_RSS_MB, max_pages=CHROME_MAX_PAGES):
+        self._factory = factory
+        self._site = site
+        self._max_rss_mb = max_rss_mb
+        self._max_pages = max_pages
+        self._pages = 0  # 현재 드라이버로 로드한 페이지 수
+        self._last_rss_mb = None
+        self._killed = False
+        self._driver = factory()
+        with _stats_lock:
+            site_stats.setdefault(site, {'pages': 0, 'peak_rss_mb': 0.0, 'restarts': 0})
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+    def get(self, url):
+        try:
+            return self._driver.get(url)
+        finally:
+            self._pages += 1
+            self._sample()
+
+    def _sample(self):
+        rss = process_tree_rss_mb(self._driver)
+        self._last_rss_mb = rss
+        with _stats_lock:
+            stats = site_stats[self._site]
+            stats['pages'] += 1
+            if rss is not None and rss > stats['peak_rss_mb']:
+                stats['peak_rss_mb'] = rss
+
+    def checkpoint(self):
+        """안전한 시점에 호출: 메모리 또는 페이지 수 기준을 넘었으면 드라이버 재시작"""
+        if self._killed:
+            return False
+        over_pages = self._max_pages and self._pages >= self._max_pages
+        over_memory = self._last_rss_mb is not None and self._last_rss_mb >= self._max_rss_mb
+        if not (over_pages or over_memory):
+            return False
+        reason = f'페이지 {self._pages}개' if over_pages else f'메모리 {self._last_rss_mb:.0f}MB'
+        print(f'   ♻️  [{self._site}] Chrome 재시작 ({reason})')
+        sys.stdout.flush()
+        self.restart()
+        return True
+
+    def restart(self):
+        if self._killed:
+            return
+        try:
+            self._driver.quit()
+        except Exception:
+            pass
+        self._driver = self._factory()
+        self._pages = 0
+        self._last_rss_mb = None
+        with _stats_lock:
+            site_stats[self._site]['restarts'] += 1
+
+    def quit(self):
+        try:
+            self._driver.quit()
+        except Exception:
+            if not self._killed:
+                raise
+
+    def kill(self):
+        """멈춘 드라이버 강제 종료 (다른 스레드에서 호출, 이후 재시작하지 않음)"""
+        self._killed = True
+        kill_process_tree(self._driver)
+
+
+def checkpoint(driver):
+    """감시 드라이버면 재시작 여부 확인 (일반 드라이버는 무시)"""
+    if isinstance(driver, WatchedDriver):
+        return driver.checkpoint()
+    return False
+
+
+def print_memory_report():
+    """사이트별 페이지 수, 최대 메모리, 재시작 횟수"""
+    if not site_stats:
+        return
+    print('\n>> Chrome 메모리 (사이트별)')
+    if psutil is None:
+        print('   psutil 미설치 - 메모리 측정 없이 페이지 수 기준으로만 재시작')
+    for site, stats in site_stats.items():
+        peak = f'{stats["peak_rss_mb"]:.0f}MB' if psutil is not None else '-'
+        print(f'   {site}: 페이지 {stats["pages"]}개, 최대 {peak}, 재시작 {stats["restarts"]}회')
+    sys.stdout.flush()
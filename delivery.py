@@ -0,0 +1,267 @@
+"""뉴스레터 웹훅 전송 (수신 측과 협상한 gzip 압축, 재시도, 멱등성 키, 동시 전송)
+
+본문은 {'html': ...} 그대로 보내고 멱등성 키는 Idempotency-Key 헤더로만 보냅니다.
+압축은 수신 측이 응답의 Accept-Encoding 헤더(RFC 7694)로 gzip을 받는다고 알린 웹훅에만 쓰며,
+알게 된 결과는 webhook_encodings.json에 웹훅 URL 해시별로 저장해 다음 실행부터 적용합니다.
+
+단독 실행하면 크롤링 없이 기존 daily_newsletter.html만 다시 전송합니다.
+    python delivery.py [YYYY-MM-DD]
+    python delivery.py --check   # 로컬 수신 서버로 재시도(5xx/429)와 압축 협상/비압축 재전송 확인
+"""
+import argparse
+import gzip
+import hashlib
+import http.server
+import json
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytz
+import requests
+from requests.adapters import HTTPAdapter
+
+WEBHOOK_TIMEOUT = int(os.getenv('WEBHOOK_TIMEOUT', '30'))
+WEBHOOK_MAX_RETRIES = int(os.getenv('WEBHOOK_MAX_RETRIES', '4'))
+WEBHOOK_BACKOFF_BASE = float(os.getenv('WEBHOOK_BACKOFF_BASE', '2'))  # 재시도 대기: base * 2^n 초 + 지터
+WEBHOOK_GZIP = os.getenv('WEBHOOK_GZIP', 'auto')  # auto: 수신 측이 알린 경우만 압축, 1: 항상 압축, 0: 압축 안 함
+WEBHOOK_ENCODING_FILE = os.getenv('WEBHOOK_ENCODING_FILE', 'webhook_encodings.json')
+
+RETRY_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+
+
+def make_idempotency_key(run_date, html_content):
+    """실행 날짜 + 본문 해시로 멱등성 키 생성 (같은 날 같은 내용 재전송은 같은 키)"""
+    content_hash = hashlib.sha256(html_content.encode('utf-8')).hexdigest()
+    return hashlib.sha256(f'{run_date}:{content_hash}'.encode('utf-8')).hexdigest()[:32]
+
+
+def webhook_id(url):
+    """인코딩 저장용 웹훅 식별자 (URL에 비밀값이 들어 있으므로 해시만 저장)"""
+    return hashlib.sha256(url.encode('utf-8')).hexdigest()[:16]
+
+
+def load_encodings():
+    """{웹훅 식별자: 'gzip' / 'identity'}"""
+    try:
+        with open(WEBHOOK_ENCODING_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_encodings(encodings):
+    with open(WEBHOOK_ENCODING_FILE, 'w', encoding='utf-8') as f:
+        json.dump(encodings, f, ensure_ascii=False, indent=1)
+
+
+def advertised_gzip(response):
+    """응답의 Accept-Encoding으로 알린 요청 본문 gzip 지원 여부 (헤더가 없으면 None)"""
+    value = response.headers.get('Accept-Encoding')
+    if value is None:
+        return None
+    for part in value.split(','):
+        coding, _, params = part.partition(';')
+        if coding.strip().lower() in ('gzip', 'x-gzip', '*'):
+            quality = params.strip().lower().replace(' ', '')
+            return quality not in ('q=0', 'q=0.', 'q=0.0', 'q=0.00', 'q=0.000')
+    return False
+
+
+def should_gzip(url, encodings):
+    if WEBHOOK_GZIP == '1':
+        return True
+    if WEBHOOK_GZIP == '0':
+        return False
+    return encodings.get(webhook_id(url)) == 'gzip'
+
+
+def create_session(pool_size=4):
+    """여러 수신처에 재사용할 커넥션 풀 세션"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def _backoff_delay(attempt, response=None):
+    """지수 백오프 + 지터 (Retry-After 헤더가 있으면 우선)"""
+    if response is not None:
+        retry_after = response.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            return int(retry_after)
+    return WEBHOOK_BACKOFF_BASE * (2 ** attempt) + random.uniform(0, 1)
+
+
+def deliver(session, url, html_content, idempotency_key, encodings=None, use_gzip=None):
+    """웹훅 한 곳에 전송 (타임아웃/5xx/429는 재시도), 성공 여부 반환
+
+    encodings: 웹훅별 협상 결과 (응답의 Accept-Encoding과 gzip 거부 응답으로 갱신)
+    """
+    encodings = {} if encodings is None else encodings
+    use_gzip = should_gzip(url, encodings) if use_gzip is None else use_gzip
+    body = json.dumps({'html': html_content}, ensure_ascii=False).encode('utf-8')
+    label = url.split('?')[0][-40:]
+
+    for attempt in range(WEBHOOK_MAX_RETRIES + 1):
+        headers = {'Content-Type': 'application/json; charset=utf-8', 'Idempotency-Key': idempotency_key}
+        data = body
+        if use_gzip:
+            headers['Content-Encoding'] = 'gzip'
+            data = gzip.compress(body)
+
+        response = None
+        try:
+            response = session.post(url, data=data, headers=headers, timeout=WEBHOOK_TIMEOUT)
+            accepts_gzip = advertised_gzip(response)
+            if accepts_gzip is not None:
+                encodings[webhook_id(url)] = 'gzip' if accepts_gzip else 'identity'
+            if 200 <= response.status_code < 300:
+                print(f'✅ 웹훅 전송 성공! ({label}, 응답: {response.status_code}, {len(data):,}B{" gzip" if use_gzip else ""})')
+                return True
+            if use_gzip and response.status_code in (400, 415):
+                # 수신 측이 gzip을 받지 않음 → 압축 없이 바로 다시 보냄 (재시도 횟수 차감 없음, 다음 실행부터 비압축)
+                print(f'   웹훅이 gzip을 거부 ({response.status_code}) - 압축 없이 재전송')
+                if not accepts_gzip:
+                    encodings[webhook_id(url)] = 'identity'
+                return deliver(session, url, html_content, idempotency_key, encodings, use_gzip=False)
+            if response.status_code not in RETRY_STATUS_CODES:
+                print(f'❌ 웹훅 응답: {response.status_code} ({label}) - 재시도 불가')
+                return False
+            print(f'   웹훅 응답 {response.status_code} ({label})')
+        except requests.RequestException as e:
+            print(f'   웹훅 전송 오류 ({label}): {str(e)[:100]}')
+
+        if attempt < WEBHOOK_MAX_RETRIES:
+            delay = _backoff_delay(attempt, response)
+            print(f'   {delay:.1f}초 후 재시도 ({attempt + 1}/{WEBHOOK_MAX_RETRIES})')
+            sys.stdout.flush()
+            time.sleep(delay)
+
+    print(f'❌ 웹훅 전송 최종 실패 ({label})')
+    return False
+
+
+def deliver_all(urls, html_content, run_date):
+    """모든 수신처(에디션/수신자별 웹훅)에 동시 전송, {url: 성공 여부} 반환"""
+    idempotency_key = make_idempotency_key(run_date, html_content)
+    print(f'   멱등성 키: {idempotency_key}')
+    encodings = load_encodings()
+    session = create_session(pool_size=max(1, len(urls)))
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, len(urls))) as executor:
+            results = executor.map(lambda url: deliver(session, url, html_content, idempotency_key, encodings), urls)
+            return dict(zip(urls, results))
+    finally:
+        session.close()
+        save_encodings(encodings)
+
+
+def parse_webhook_urls(value):
+    """쉼표로 구분된 웹훅 URL 목록"""
+    return [url.strip() for url in value.split(',') if url.strip()]
+
+
+class _SinkHandler(http.server.BaseHTTPRequestHandler):
+    """--check용 로컬 수신 서버 (server.script의 응답 코드를 차례로 돌려주고 요청을 server.received에 기록)"""
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        data = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        encoding = self.headers.get('Content-Encoding', 'identity')
+        if encoding == 'gzip':
+            data = gzip.decompress(data)
+        self.server.received.append({
+            'path': self.path,
+            'encoding': encoding,
+            'idempotency_key': self.headers.get('Idempotency-Key'),
+            'body': json.loads(data.decode('utf-8'))
+        })
+        script = self.server.script.get(self.path)
+        status, headers = script.pop(0) if script else (200, {})
+        if encoding == 'gzip' and self.path == '/identity-only':
+            status, headers = 415, {}
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def run_check():
+    """로컬 수신 서버로 재시도(5xx/429), gzip 거부 시 비압축 재전송, Accept-Encoding 협상 확인"""
+    global WEBHOOK_BACKOFF_BASE, WEBHOOK_GZIP
+    WEBHOOK_BACKOFF_BASE = 0.05
+    WEBHOOK_GZIP = 'auto'
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _SinkHandler)
+    server.received = []
+    server.script = {
+        '/flaky': [(503, {}), (429, {'Retry-After': '0'}), (200, {})],
+        '/negotiate': [(200, {'Accept-Encoding': 'gzip'}), (200, {'Accept-Encoding': 'gzip'})],
+    }
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{server.server_port}'
+    html = '<html><body>' + '뉴스레터 ' * 2000 + '</body></html>'
+    key = make_idempotency_key('2000-01-01', html)
+    failures = []
+
+    def expect(name, condition):
+        print(f'   {name}: {"OK" if condition else "실패"}')
+        if not condition:
+            failures.append(name)
+
+    session = create_session()
+    try:
+        print('>> 재시도 (503 → 429 → 200)')
+        ok = deliver(session, base + '/flaky', html, key)
+        attempts = [r for r in server.received if r['path'] == '/flaky']
+        expect('세 번째 시도에 성공', ok and len(attempts) == 3)
+        expect('모든 시도에 같은 Idempotency-Key', {r['idempotency_key'] for r in attempts} == {key})
+        expect('본문은 html만', all(r['body'] == {'html': html} for r in attempts))
+
+        print('>> gzip 거부 (415) → 비압축 재전송')
+        encodings = {}
+        ok = deliver(session, base + '/identity-only', html, key, encodings, use_gzip=True)
+        attempts = [r['encoding'] for r in server.received if r['path'] == '/identity-only']
+        expect('비압축으로 성공', ok and attempts == ['gzip', 'identity'])
+        expect('다음 실행부터 비압축', not should_gzip(base + '/identity-only', encodings))
+
+        print('>> Accept-Encoding 협상')
+        encodings = {}
+        deliver(session, base + '/negotiate', html, key, encodings)
+        deliver(session, base + '/negotiate', html, key, encodings)
+        attempts = [r['encoding'] for r in server.received if r['path'] == '/negotiate']
+        expect('알리기 전엔 비압축, 알린 뒤엔 gzip', attempts == ['identity', 'gzip'])
+        expect('URL은 해시로만 저장', base not in json.dumps(encodings))
+    finally:
+        session.close()
+        server.shutdown()
+    sys.stdout.flush()
+    return not failures
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='daily_newsletter.html 웹훅 재전송')
+    parser.add_argument('run_date', nargs='?', help='멱등성 키에 쓸 날짜 (기본: 오늘, KST)')
+    parser.add_argument('--check', action='store_true', help='로컬 수신 서버로 재시도/압축 협상 확인 (실제 웹훅 전송 안 함)')
+    args = parser.parse_args()
+    if args.check:
+        sys.exit(0 if run_check() else 1)
+
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    run_date = args.run_date or datetime.now(pytz.timezone('Asia/Seoul')).strftime('%Y-%m-%d')
+    with open('daily_newsletter.html', 'r', encoding='utf-8') as f:
+        html = f.read()
+    results = deliver_all(parse_webhook_urls(os.getenv('WEBHOOK_URL', '')), html, run_date)
+    sys.exit(0 if results and all(results.values()) else 1)
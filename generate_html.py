@@ -1,7 +1,18 @@
 """JSON 데이터를 HTML 뉴스레터로 변환"""
 import json
+import os
+import re
 from datetime import datetime
 import pytz
+from article_table import (
+    build_article_table, exclude, filter_mask, group_by_category, mask_count, mask_indices, rows,
+    stage1_scores
+)
+from ranking import rank_hot_articles
+from thumbnails import finalize_cache, get_thumbnail_url
+
+# Gmail은 약 102KB를 넘는 메일을 잘라서 표시하므로 그보다 작게 유지
+NEWSLETTER_MAX_BYTES = int(os.getenv('NEWSLETTER_MAX_BYTES', '100000'))
 
 def load_articles():
     """collected_articles.json 로드"""
@@ -18,34 +29,22 @@ def load_articles():
         print("[ERROR] collected_articles.json 파일을 찾을 수 없습니다.")
         return {'daily_summary': '', 'articles': []}
 
-def filter_articles(articles):
-    """game_relevance 0.5 이상 AND importance 0.4 이상만 필터링"""
-    return [a for a in articles 
-            if a.get('game_relevance', 0) >= 0.5 
-            and a.get('importance', 0) >= 0.4]
-
-def get_hot_trend_articles(articles):
-    """댓글 10개 이상인 기사를 댓글 수 내림차순으로 정렬"""
-    hot = [a for a in articles if a.get('comments', 0) >= 10]
-    return sorted(hot, key=lambda x: x.get('comments', 0), reverse=True)
-
-def categorize_articles(articles):
-    """카테고리별로 기사 분류"""
-    categories = {
-        '규제 & 이슈': [],
-        '게임 출시 & 발표': [],
-        '매출 & 성과': [],
-        '업데이트 & 패치': [],
-        'IP & 콜라보': [],
-        '커뮤니티 & 이벤트': []
-    }
-    
-    for article in articles:
-        cat = article.get('category', '기타')
-        if cat in categories:
-            categories[cat].append(article)
-    
-    return categories
+def filter_articles(articles, thresholds=None):
+    """game_relevance 0.5 이상 AND importance 0.4 이상만 필터링 (thresholds로 기준 변경)"""
+    table = build_article_table(articles)
+    return rows(table, mask_indices(filter_mask(table, **(thresholds or {}))))
+
+def edition_time(data):
+    """발행 시각 (백필 데이터는 edition_at 'YYYY-MM-DD HH:MM' KST, 없으면 현재 시각)"""
+    kst = pytz.timezone('Asia/Seoul')
+    if isinstance(data, dict) and data.get('edition_at'):
+        return kst.localize(datetime.strptime(data['edition_at'], '%Y-%m-%d %H:%M'))
+    return datetime.now(kst)
+
+def comment_badge(article):
+    """댓글 수 표시 (댓글 수를 제공하지 않는 매체는 생략)"""
+    comments = article.get('comments', 0)
+    return f" · 💬 {comments}" if comments else ""
 
 def escape_html(text):
     """HTML 특수문자 이스케이프"""
@@ -57,6 +56,10 @@ def escape_html(text):
                 .replace('"', '&quot;')
                 .replace("'", '&#39;'))
 
+def thumbnail_src(article, size_name):
+    """img src용 썸네일 URL (축소 캐시가 켜져 있으면 표시 크기 버전)"""
+    return escape_html(get_thumbnail_url(article.get('thumbnail', ''), size_name))
+
 def format_date(date_str):
     """날짜 포맷팅 (YYYY-MM-DD HH:MM -> MM.DD)"""
     try:
@@ -99,7 +102,7 @@ def generate_hot_section(hot_articles):
                                             <tr>
                                                 <td style="padding: 0;">
                                                     <a href="{escape_html(a1.get('url', '#'))}" style="text-decoration: none;">
-                                                        <img src="{escape_html(a1.get('thumbnail', ''))}" width="100%" height="200" style="display: block;" alt="{escape_html(a1.get('media', ''))}">
+                                                        <img src="{thumbnail_src(a1, 'hot_large')}" width="100%" height="200" style="display: block;" alt="{escape_html(a1.get('media', ''))}">
                                                     </a>
                                                 </td>
                                             </tr>
@@ -113,7 +116,7 @@ def generate_hot_section(hot_articles):
                                                             <font face="Malgun Gothic, Arial, sans-serif" style="font-size: 13px; font-weight: 400; color: #666666; line-height: 1.5;">{escape_html(summary1)}</font>
                                                         </div>
                                                         <div>
-                                                            <font face="Malgun Gothic, Arial, sans-serif" style="font-size: 11px; font-weight: 500; color: #999999;">{escape_html(a1.get('media', ''))} · {format_date(a1.get('date', ''))} · 💬 {a1.get('comments', 0)}</font>
+                                                            <font face="Malgun Gothic, Arial, sans-serif" style="font-size: 11px; font-weight: 500; color: #999999;">{escape_html(a1.get('media', ''))} · {format_date(a1.get('date', ''))}{comment_badge(a1)}</font>
                                                         </div>
                                                     </a>
                                                 </td>
@@ -125,7 +128,7 @@ def generate_hot_section(hot_articles):
                                             <tr>
                                                 <td style="padding: 0;">
                                                     <a href="{escape_html(a2.get('url', '#'))}" style="text-decoration: none;">
-                                                        <img src="{escape_html(a2.get('thumbnail', ''))}" width="100%" height="200" style="display: block;" alt="{escape_html(a2.get('media', ''))}">
+                                                        <img src="{thumbnail_src(a2, 'hot_large')}" width="100%" height="200" style="display: block;" alt="{escape_html(a2.get('media', ''))}">
                                                     </a>
                                                 </td>
                                             </tr>
@@ -139,7 +142,7 @@ def generate_hot_section(hot_articles):
                                                             <font face="Malgun Gothic, Arial, sans-serif" style="font-size: 13px; font-weight: 400; color: #666666; line-height: 1.5;">{escape_html(summary2)}</font>
                                                         </div>
                                                         <div>
-                                                            <font face="Malgun Gothic, Arial, sans-serif" style="font-size: 11px; font-weight: 500; color: #999999;">{escape_html(a2.get('media', ''))} · {format_date(a2.get('date', ''))} · 💬 {a2.get('comments', 0)}</font>
+                                                            <font face="Malgun Gothic, Arial, sans-serif" style="font-size: 11px; font-weight: 500; color: #999999;">{escape_html(a2.get('media', ''))} · {format_date(a2.get('date', ''))}{comment_badge(a2)}</font>
                                                         </div>
                                                     </a>
                                                 </td>
@@ -156,7 +159,7 @@ def generate_hot_section(hot_articles):
                                         <tr>
                                             <td style="padding: 0;">
                                                 <a href="{escape_html(a1.get('url', '#'))}" style="text-decoration: none; display: block;">
-                                                    <img src="{escape_html(a1.get('thumbnail', ''))}" width="100%" style="display: block; width: 100%; height: 200px; object-fit: cover;" alt="{escape_html(a1.get('media', ''))}">
+                                                    <img src="{thumbnail_src(a1, 'hot_large')}" width="100%" style="display: block; width: 100%; height: 200px; object-fit: cover;" alt="{escape_html(a1.get('media', ''))}">
                                                 </a>
                                             </td>
                                         </tr>
@@ -176,7 +179,7 @@ def generate_hot_section(hot_articles):
                                                         </tr>
                                                         <tr>
                                                             <td>
-                                                                <font face="'Malgun Gothic', '맑은 고딕', Arial, sans-serif" style="font-size: 11px; font-weight: 500; color: #999999;">{escape_html(a1.get('media', ''))} · {format_date(a1.get('date', ''))} · 💬 {a1.get('comments', 0)}</font>
+                                                                <font face="'Malgun Gothic', '맑은 고딕', Arial, sans-serif" style="font-size: 11px; font-weight: 500; color: #999999;">{escape_html(a1.get('media', ''))} · {format_date(a1.get('date', ''))}{comment_badge(a1)}</font>
                                                             </td>
                                                         </tr>
                                                     </table>
@@ -190,7 +193,7 @@ def generate_hot_section(hot_articles):
                                         <tr>
                                             <td style="padding: 0;">
                                                 <a href="{escape_html(a2.get('url', '#'))}" style="text-decoration: none; display: block;">
-                                                    <img src="{escape_html(a2.get('thumbnail', ''))}" width="100%" style="display: block; width: 100%; height: 200px; object-fit: cover;" alt="{escape_html(a2.get('media', ''))}">
+                                                    <img src="{thumbnail_src(a2, 'hot_large')}" width="100%" style="display: block; width: 100%; height: 200px; object-fit: cover;" alt="{escape_html(a2.get('media', ''))}">
                                                 </a>
                                             </td>
                                         </tr>
@@ -210,7 +213,7 @@ def generate_hot_section(hot_articles):
                                                         </tr>
                                                         <tr>
                                                             <td>
-                                                                <font face="'Malgun Gothic', '맑은 고딕', Arial, sans-serif" style="font-size: 11px; font-weight: 500; color: #999999;">{escape_html(a2.get('media', ''))} · {format_date(a2.get('date', ''))} · 💬 {a2.get('comments', 0)}</font>
+                                                                <font face="'Malgun Gothic', '맑은 고딕', Arial, sans-serif" style="font-size: 11px; font-weight: 500; color: #999999;">{escape_html(a2.get('media', ''))} · {format_date(a2.get('date', ''))}{comment_badge(a2)}</font>
                                                             </td>
                                                         </tr>
                                                     </table>
@@ -239,7 +242,7 @@ def generate_hot_section(hot_articles):
                                 <tr>
                                     <td width="250" style="padding: 0; vertical-align: top;">
                                         <a href="{escape_html(a.get('url', '#'))}" style="text-decoration: none; display: block;">
-                                            <img src="{escape_html(a.get('thumbnail', ''))}" width="250" style="display: block; width: 250px; height: 100%; object-fit: cover; min-height: 200px;" alt="{escape_html(a.get('media', ''))}">
+                                            <img src="{thumbnail_src(a, 'hot_row')}" width="250" style="display: block; width: 250px; height: 100%; object-fit: cover; min-height: 200px;" alt="{escape_html(a.get('media', ''))}">
                                         </a>
                                     </td>
                                     <td style="padding: 25px; vertical-align: top;">
@@ -257,7 +260,7 @@ def generate_hot_section(hot_articles):
                                                 </tr>
                                                 <tr>
                                                     <td>
-                                                        <font face="'Malgun Gothic', '맑은 고딕', Arial, sans-serif" style="font-size: 11px; font-weight: 500; color: #999999;">{escape_html(a.get('media', ''))} · {format_date(a.get('date', ''))} · 💬 {a.get('comments', 0)}</font>
+                                                        <font face="'Malgun Gothic', '맑은 고딕', Arial, sans-serif" style="font-size: 11px; font-weight: 500; color: #999999;">{escape_html(a.get('media', ''))} · {format_date(a.get('date', ''))}{comment_badge(a)}</font>
                                                     </td>
                                                 </tr>
                                             </table>
@@ -271,8 +274,11 @@ def generate_hot_section(hot_articles):
     
     return ''.join(html)
 
-def generate_category_section(category_name, articles, english_name):
-    """카테고리 섹션 생성 (모든 기사 표시) - 작은 썸네일 + 첫 문장만"""
+def generate_category_section(category_name, articles, english_name, demoted_urls=frozenset()):
+    """카테고리 섹션 생성 (모든 기사 표시) - 작은 썸네일 + 첫 문장만
+
+    demoted_urls: 용량 예산 초과로 리스트형 한 줄(generate_compact_row)로 강등할 기사 URL
+    """
     if not articles:
         return ""
     
@@ -299,6 +305,10 @@ def generate_category_section(category_name, articles, english_name):
     
     # 모든 기사 표시 - 작은 썸네일 + 첫 문장
     for idx, a in enumerate(articles):
+        if a.get('url') in demoted_urls:
+            html.append(generate_compact_row(a, idx == len(articles) - 1))
+            continue
+        
         padding_bottom = "25px" if idx < len(articles) - 1 else "40px"
         first_sentence = get_first_sentence(a.get('content_summary_kr', ''))
         
@@ -310,7 +320,7 @@ def generate_category_section(category_name, articles, english_name):
                                 <tr>
                                     <td width="120" valign="top" style="padding-right: 15px;">
                                         <a href="{escape_html(a.get('url', '#'))}" style="text-decoration: none;">
-                                            <img src="{escape_html(a.get('thumbnail', ''))}" width="120" height="80" style="display: block; width: 120px; height: 80px;" alt="{escape_html(a.get('media', ''))}">
+                                            <img src="{thumbnail_src(a, 'list')}" width="120" height="80" style="display: block; width: 120px; height: 80px;" alt="{escape_html(a.get('media', ''))}">
                                         </a>
                                     </td>
                                     <td valign="top">
@@ -334,7 +344,7 @@ def generate_category_section(category_name, articles, english_name):
                                 <tr>
                                     <td class="news-thumbnail" width="120" style="padding-right: 15px; vertical-align: top;">
                                         <a href="{escape_html(a.get('url', '#'))}" style="text-decoration: none; display: block;">
-                                            <img src="{escape_html(a.get('thumbnail', ''))}" width="120" style="display: block; width: 120px; height: 80px; object-fit: cover; background-color: #f0f0f0;" alt="{escape_html(a.get('media', ''))}">
+                                            <img src="{thumbnail_src(a, 'list')}" width="120" style="display: block; width: 120px; height: 80px; object-fit: cover; background-color: #f0f0f0;" alt="{escape_html(a.get('media', ''))}">
                                         </a>
                                     </td>
                                     <td style="vertical-align: top;">
@@ -430,6 +440,41 @@ def generate_ai_summary_section(summary_text):
                     </tr>
 """
 
+def generate_rising_section(rising_trends):
+    """RISING THIS WEEK 섹션 생성 (최근 7일 언급이 30일 기준보다 급증한 게임/회사)"""
+    if not rising_trends:
+        return ""
+    
+    rows_html = []
+    for i, entity in enumerate(rising_trends):
+        border_style = "border-bottom: 1px solid #e0e0e0;" if i < len(rising_trends) - 1 else ""
+        rows_html.append(f"""
+                                        <tr>
+                                            <td style="padding: 10px 0; {border_style}">
+                                                <font face="'Malgun Gothic', '맑은 고딕', Arial, sans-serif" style="font-size: 14px; font-weight: 700; color: #000000;">{escape_html(entity['name'])}</font>
+                                            </td>
+                                            <td align="right" style="padding: 10px 0; {border_style}">
+                                                <font face="'Malgun Gothic', '맑은 고딕', Arial, sans-serif" style="font-size: 12px; color: #666666;">7일 {entity['count_7d']}건 · 평소 주 {entity['baseline_7d']}건</font>
+                                            </td>
+                                        </tr>""")
+    
+    return f"""
+                    <!-- Rising This Week Section -->
+                    <tr>
+                        <td class="mobile-padding" style="padding: 10px 50px 10px 50px;">
+                            <font face="'Malgun Gothic', '맑은 고딕', Arial, sans-serif" style="font-size: 13px; font-weight: 700; color: #000000; letter-spacing: 2px;">RISING THIS WEEK</font>
+                        </td>
+                    </tr>
+                    
+                    <tr>
+                        <td class="mobile-padding" style="padding: 10px 50px 30px 50px;">
+                            <table width="100%" cellpadding="0" cellspacing="0" border="0">
+{''.join(rows_html)}
+                            </table>
+                        </td>
+                    </tr>
+"""
+
 def get_category_icon(english_name):
     """카테고리별 SVG 아이콘 반환 (검은색)"""
     icons = {
@@ -443,39 +488,13 @@ def get_category_icon(english_name):
     }
     return icons.get(english_name, '<circle cx="12" cy="12" r="8" fill="#000000"/>')
 
-def generate_compact_category_section(category_name, articles, english_name):
-    """간결한 카테고리 섹션 생성 (리스트 형태, 모든 기사 표시)"""
-    if not articles:
-        return ""
-    
-    html = []
-    html.append(f"""
-                    <!-- Divider -->
-                    <tr>
-                        <td class="mobile-padding" style="padding: 0 50px;">
-                            <table width="100%" cellpadding="0" cellspacing="0" border="0">
-                                <tr>
-                                    <td style="height: 2px; background-color: #e0e0e0;"></td>
-                                </tr>
-                            </table>
-                        </td>
-                    </tr>
-
-                    <!-- Category: {category_name} -->
-                    <tr>
-                        <td class="mobile-padding" style="padding: 40px 50px 20px 50px;">
-                            <font face="'Malgun Gothic', '맑은 고딕', Arial, sans-serif" style="font-size: 13px; font-weight: 700; color: #000000; letter-spacing: 2px;">{english_name}</font>
-                        </td>
-                    </tr>
-""")
+def generate_compact_row(a, is_last):
+    """리스트형 기사 한 줄 (간결한 카테고리 섹션 / 예산 초과 시 강등된 기사)"""
+    border_style = "border-bottom: 1px solid #e0e0e0;" if not is_last else ""
+    padding_bottom = "10px" if not is_last else "40px"
+    first_sentence = get_first_sentence(a.get('content_summary_kr', ''))
     
-    # 모든 기사 표시
-    for idx, a in enumerate(articles):
-        border_style = "border-bottom: 1px solid #e0e0e0;" if idx < len(articles) - 1 else ""
-        padding_bottom = "10px" if idx < len(articles) - 1 else "40px"
-        first_sentence = get_first_sentence(a.get('content_summary_kr', ''))
-        
-        html.append(f"""
+    return f"""
                     <tr>
                         <td class="mobile-padding" style="padding: 0 50px {padding_bottom} 50px;">
                             <!--[if mso]>
@@ -518,41 +537,159 @@ def generate_compact_category_section(category_name, articles, english_name):
                             <!--<![endif]-->
                         </td>
                     </tr>
+"""
+
+def generate_compact_category_section(category_name, articles, english_name):
+    """간결한 카테고리 섹션 생성 (리스트 형태, 모든 기사 표시)"""
+    if not articles:
+        return ""
+    
+    html = []
+    html.append(f"""
+                    <!-- Divider -->
+                    <tr>
+                        <td class="mobile-padding" style="padding: 0 50px;">
+                            <table width="100%" cellpadding="0" cellspacing="0" border="0">
+                                <tr>
+                                    <td style="height: 2px; background-color: #e0e0e0;"></td>
+                                </tr>
+                            </table>
+                        </td>
+                    </tr>
+
+                    <!-- Category: {category_name} -->
+                    <tr>
+                        <td class="mobile-padding" style="padding: 40px 50px 20px 50px;">
+                            <font face="'Malgun Gothic', '맑은 고딕', Arial, sans-serif" style="font-size: 13px; font-weight: 700; color: #000000; letter-spacing: 2px;">{english_name}</font>
+                        </td>
+                    </tr>
 """)
     
+    # 모든 기사 표시
+    for idx, a in enumerate(articles):
+        html.append(generate_compact_row(a, idx == len(articles) - 1))
+    
     return ''.join(html)
 
-def generate_html(data):
-    """전체 HTML 생성"""
+def minify_html(html):
+    """메일 전송용 HTML 축소 (Outlook 안전)
+
+    - 일반 주석 제거, MSO 조건부 주석(<!--[if mso]>, <!--[if !mso]><!-->, <!--<![endif]-->)은 유지
+    - 템플릿 들여쓰기/줄바꿈 제거 (한 줄 안의 공백은 그대로 두어 인라인 텍스트 간격 유지)
+    - 인라인 style 선언의 불필요한 공백 제거
+    """
+    html = re.sub(r'<!--(?!\[if|<!\[endif\]|>)(?:(?!-->).)*-->', '', html, flags=re.S)
+    html = re.sub(r'>\s*\n\s*<', '><', html)
+    html = re.sub(r'\s*\n\s*', ' ', html)
+    return re.sub(r'style="([^"]*)"', lambda m: 'style="' + compact_style(m.group(1)) + '"', html)
+
+def compact_style(style):
+    """인라인 style 압축 ("font-size: 14px; color: #000;" -> "font-size:14px;color:#000")"""
+    declarations = []
+    for declaration in style.split(';'):
+        if ':' not in declaration:
+            continue
+        prop, value = declaration.split(':', 1)
+        declarations.append(f'{prop.strip()}:{value.strip()}')
+    return ';'.join(declarations)
+
+def byte_size(html):
+    """축소 후 UTF-8 바이트 수"""
+    return len(minify_html(html).encode('utf-8'))
+
+def render_within_budget(data, max_bytes=NEWSLETTER_MAX_BYTES):
+    """용량 예산 안에 들어올 때까지 중요도 낮은 기사를 리스트형 한 줄로 강등하며 렌더링
+
+    썸네일이 붙는 카테고리(규제 & 이슈, 게임 출시 & 발표) 기사만 강등 대상.
+    모두 강등해도 넘으면 경고만 출력하고 그대로 반환.
+    """
+    section_sizes = {}
+    html = minify_html(generate_html(data, section_sizes=section_sizes))
+    articles = data.get('articles', []) if isinstance(data, dict) else data
+    thresholds = data.get('thresholds') if isinstance(data, dict) else None
+    candidates = sorted(
+        [a for a in filter_articles(articles, thresholds) if a.get('category') in ('규제 & 이슈', '게임 출시 & 발표')],
+        key=lambda a: stage1_scores(a)[1]
+    )
+
+    demoted_urls = set()
+    while len(html.encode('utf-8')) > max_bytes and len(demoted_urls) < len(candidates):
+        demoted_urls.add(candidates[len(demoted_urls)].get('url'))
+        section_sizes = {}
+        html = minify_html(generate_html(data, demoted_urls=frozenset(demoted_urls), section_sizes=section_sizes, verbose=False))
+
+    size = len(html.encode('utf-8'))
+    if demoted_urls:
+        print(f">> 용량 예산 {max_bytes:,}B 초과로 {len(demoted_urls)}개 기사를 리스트형으로 강등")
+    if size > max_bytes:
+        print(f"[WARN] 모든 강등 후에도 {size:,}B로 예산 {max_bytes:,}B 초과 (Gmail에서 잘릴 수 있음)")
+
+    print(f">> 섹션별 크기 (축소 후)")
+    for name, section_size in section_sizes.items():
+        print(f"   {name}: {section_size:,}B")
+    print(f"   전체: {size:,}B / 예산 {max_bytes:,}B")
+    return html
+
+def generate_html(data, demoted_urls=frozenset(), section_sizes=None, verbose=True):
+    """전체 HTML 생성
+
+    section_sizes: dict를 넘기면 섹션별 축소 후 바이트 수를 채움
+    """
     # 데이터 구조 확인
     if isinstance(data, dict):
         daily_summary = data.get('daily_summary', '')
+        rising_trends = data.get('rising_trends', [])
         articles = data.get('articles', [])
+        thresholds = data.get('thresholds') or {}
     else:
         daily_summary = ''
+        rising_trends = []
         articles = data
+        thresholds = {}
     
-    # 필터링
-    filtered = filter_articles(articles)
-    print(f">> game_relevance >= 0.5 AND importance >= 0.4 필터링: {len(filtered)}개 기사")
+    # 열 기반 테이블로 필터링/상위 선택/분류를 한 번에 처리
+    table = build_article_table(articles)
     
-    # HOT TREND
-    hot_articles = get_hot_trend_articles(filtered)
-    print(f">> HOT TREND (댓글 10개 이상): {len(hot_articles)}개 기사")
+    # 필터링
+    passed = filter_mask(table, **thresholds)
+    if verbose:
+        print(f">> game_relevance >= {thresholds.get('min_relevance', 0.5)} AND importance >= "
+              f"{thresholds.get('min_importance', 0.4)} 필터링: {mask_count(passed)}개 기사")
     
-    # HOT TREND에 포함된 기사 제외
-    hot_urls = {a['url'] for a in hot_articles[:5]}
-    remaining = [a for a in filtered if a['url'] not in hot_urls]
+    # HOT TREND (가중 합 점수 상위 5개)
+    now = edition_time(data)
+    hot_indices, hot_scores = rank_hot_articles(table, passed, now.replace(tzinfo=None), k=5)
+    hot_articles = rows(table, hot_indices)
+    if verbose:
+        print(f">> HOT TREND: {len(hot_articles)}개 기사")
+        for a, (score, parts) in zip(hot_articles, hot_scores):
+            detail = ', '.join(f"{name} {value:.2f}" for name, value in parts.items())
+            print(f"   {score:.3f} [{a.get('media', '')}] {a.get('title', '')[:40]} ({detail})")
     
-    # 카테고리 분류
-    categories = categorize_articles(remaining)
+    # HOT TREND에 포함된 기사 제외 후 카테고리 분류
+    remaining = exclude(passed, hot_indices)
+    categories = {name: rows(table, indices) for name, indices in group_by_category(table, remaining).items()}
     
     # 현재 날짜
-    kst = pytz.timezone('Asia/Seoul')
-    now = datetime.now(kst)
     date_str = now.strftime('%Y.%m.%d')
     day_str = now.strftime('%A')
     
+    # 섹션 렌더링
+    sections = {
+        'AI SUMMARY': generate_ai_summary_section(daily_summary),
+        'RISING THIS WEEK': generate_rising_section(rising_trends),
+        'HOT TREND': generate_hot_section(hot_articles),
+        'REGULATION & ISSUES': generate_category_section('규제 & 이슈', categories['규제 & 이슈'], 'REGULATION & ISSUES', demoted_urls),
+        'NEW RELEASES': generate_category_section('게임 출시 & 발표', categories['게임 출시 & 발표'], 'NEW RELEASES', demoted_urls),
+        'REVENUE & PERFORMANCE': generate_compact_category_section('매출 & 성과', categories['매출 & 성과'], 'REVENUE & PERFORMANCE'),
+        'UPDATES & PATCHES': generate_compact_category_section('업데이트 & 패치', categories['업데이트 & 패치'], 'UPDATES & PATCHES'),
+        'IP & COLLABORATIONS': generate_compact_category_section('IP & 콜라보', categories['IP & 콜라보'], 'IP & COLLABORATIONS'),
+        'COMMUNITY & EVENTS': generate_compact_category_section('커뮤니티 & 이벤트', categories['커뮤니티 & 이벤트'], 'COMMUNITY & EVENTS'),
+    }
+    if section_sizes is not None:
+        for name, section_html in sections.items():
+            section_sizes[name] = byte_size(section_html)
+    
     # HTML 생성
     html = f"""<!DOCTYPE html>
 <html lang="ko">
@@ -621,7 +758,9 @@ def generate_html(data):
                         </td>
                     </tr>
 
-{generate_ai_summary_section(daily_summary)}
+{sections['AI SUMMARY']}
+
+{sections['RISING THIS WEEK']}
 
                     <!-- HOT TREND Section -->
                     <tr>
@@ -630,19 +769,19 @@ def generate_html(data):
                         </td>
                     </tr>
 
-{generate_hot_section(hot_articles[:5])}
+{sections['HOT TREND']}
 
-{generate_category_section('규제 & 이슈', categories['규제 & 이슈'], 'REGULATION & ISSUES')}
+{sections['REGULATION & ISSUES']}
 
-{generate_category_section('게임 출시 & 발표', categories['게임 출시 & 발표'], 'NEW RELEASES')}
+{sections['NEW RELEASES']}
 
-{generate_compact_category_section('매출 & 성과', categories['매출 & 성과'], 'REVENUE & PERFORMANCE')}
+{sections['REVENUE & PERFORMANCE']}
 
-{generate_compact_category_section('업데이트 & 패치', categories['업데이트 & 패치'], 'UPDATES & PATCHES')}
+{sections['UPDATES & PATCHES']}
 
-{generate_compact_category_section('IP & 콜라보', categories['IP & 콜라보'], 'IP & COLLABORATIONS')}
+{sections['IP & COLLABORATIONS']}
 
-{generate_compact_category_section('커뮤니티 & 이벤트', categories['커뮤니티 & 이벤트'], 'COMMUNITY & EVENTS')}
+{sections['COMMUNITY & EVENTS']}
 
                     <!-- Footer -->
                     <tr>
@@ -700,8 +839,9 @@ def main():
         articles = data
         print(f">> 총 {len(articles)}개 기사 로드")
     
-    # HTML 생성
-    html_content = generate_html(data)
+    # HTML 생성 (축소 + 용량 예산 적용)
+    html_content = render_within_budget(data)
+    finalize_cache()
     
     # 파일 저장
     output_file = 'daily_newsletter.html'
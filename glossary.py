@@ -0,0 +1,91 @@
+"""번역 용어집 (Gamelook 등 중국어 기사에 자주 나오는 회사/게임명의 표기 통일)
+
+프롬프트에는 해당 묶음 기사에 실제로 등장한 항목만 넣습니다.
+"""
+
+# 중국어 표기 → 뉴스레터 표기 (게임/회사명은 영문 공식 명칭 유지)
+ZH_GLOSSARY = {
+    # 회사
+    '腾讯': 'Tencent',
+    '网易': 'NetEase',
+    '米哈游': 'miHoYo',
+    '莉莉丝': 'Lilith Games',
+    '鹰角网络': 'Hypergryph',
+    '鹰角': 'Hypergryph',
+    '叠纸': 'Papergames',
+    '完美世界': 'Perfect World',
+    '三七互娱': '37 Interactive',
+    '世纪华通': 'Century Huatong',
+    '巨人网络': 'Giant Network',
+    '字节跳动': 'ByteDance',
+    '朝夕光年': 'Nuverse',
+    '游戏科学': 'Game Science',
+    '库洛': 'Kuro Games',
+    '散爆': 'Sunborn',
+    '西山居': 'Seasun',
+    '心动': 'XD',
+    '拉瑞安': 'Larian',
+    '索尼': 'Sony',
+    '任天堂': 'Nintendo',
+    '微软': 'Microsoft',
+    '育碧': 'Ubisoft',
+    '动视暴雪': 'Activision Blizzard',
+    '暴雪': 'Blizzard',
+    '卡普空': 'Capcom',
+    '万代南梦宫': 'Bandai Namco',
+    '史克威尔艾尼克斯': 'Square Enix',
+    '拳头': 'Riot Games',
+    '维尔福': 'Valve',
+    '克拉夫顿': 'Krafton',
+    '恩希软件': 'NCSoft',
+    '网石': 'Netmarble',
+    '尼克森': 'Nexon',
+    # 게임
+    '原神': 'Genshin Impact',
+    '崩坏：星穹铁道': 'Honkai: Star Rail',
+    '星穹铁道': 'Honkai: Star Rail',
+    '绝区零': 'Zenless Zone Zero',
+    '王者荣耀': 'Honor of Kings',
+    '和平精英': 'Game for Peace',
+    '三角洲行动': 'Delta Force',
+    '无畏契约': 'Valorant',
+    '英雄联盟': 'League of Legends',
+    '逆水寒': 'Justice',
+    '燕云十六声': 'Where Winds Meet',
+    '蛋仔派对': 'Eggy Party',
+    '永劫无间': 'Naraka: Bladepoint',
+    '明日方舟': 'Arknights',
+    '明日方舟：终末地': 'Arknights: Endfield',
+    '鸣潮': 'Wuthering Waves',
+    '恋与深空': 'Love and Deepspace',
+    '无限暖暖': 'Infinity Nikki',
+    '黑神话：悟空': 'Black Myth: Wukong',
+    '黑神话': 'Black Myth',
+    '博德之门3': "Baldur's Gate 3",
+    '神界': 'Divinity',
+    '万国觉醒': 'Rise of Kingdoms',
+    '剑与远征': 'AFK Arena',
+    '我的世界': 'Minecraft',
+    '宝可梦': 'Pokémon',
+    # 업계 용어
+    '版号': '판호',
+    '流水': '매출(流水)',
+    '公测': '오픈 베타',
+    '二次元': '서브컬처',
+    '出海': '해외 진출',
+}
+
+
+def glossary_for(texts, glossary=ZH_GLOSSARY):
+    """텍스트들에 등장하는 용어만 골라 반환 (긴 표기 우선, 짧은 표기가 긴 표기에 포함되면 제외)"""
+    joined = '\n'.join(texts)
+    matched = {}
+    for source in sorted(glossary, key=len, reverse=True):
+        if source in joined and not any(source in longer for longer in matched):
+            matched[source] = glossary[source]
+    return matched
+
+
+def format_glossary(entries):
+    """프롬프트용 용어집 텍스트"""
+    return '\n'.join(f'- {source} → {target}' for source, target in entries.items())
@@ -0,0 +1,64 @@
+"""목록 페이지 조건부 요청 (ETag/Last-Modified + 카드 링크 목록 해시)
+
+소스마다 목록 첫 페이지를 Chrome 없이 HTTP로 먼저 요청합니다. 서버가 304를 주거나, 200이어도
+카드 링크 목록의 해시가 지난 성공 실행과 같으면 목록이 바뀌지 않은 것으로 판단합니다.
+광고/시각 표시처럼 매번 달라지는 부분은 무시하도록 원본 HTML이 아니라 링크 목록을 해시합니다.
+"""
+import hashlib
+import os
+import re
+
+import requests
+
+LISTING_CACHE = os.getenv('LISTING_CACHE', '1') == '1'
+LISTING_TIMEOUT = 10
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+
+def card_list_hash(html, pattern):
+    """목록 HTML에서 카드 링크를 순서대로 뽑아 해시 (링크가 없으면 None)"""
+    links = []
+    seen = set()
+    for link in re.findall(pattern, html):
+        if link not in seen:
+            seen.add(link)
+            links.append(link)
+    if not links:
+        return None
+    return hashlib.sha1('\n'.join(links).encode('utf-8')).hexdigest()
+
+
+def check_listing(url, pattern, cached=None):
+    """조건부 GET으로 목록 변경 여부 확인 → (unchanged, 저장할 캐시 항목)
+
+    cached: 지난 성공 실행의 {'url', 'etag', 'last_modified', 'card_hash'}.
+    요청 실패/링크 추출 실패 시 (False, None) - 판단할 수 없으므로 평소대로 크롤링.
+    """
+    cached = cached if cached and cached.get('url') == url else None
+    headers = {'User-Agent': USER_AGENT}
+    if cached and cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    if cached and cached.get('last_modified'):
+        headers['If-Modified-Since'] = cached['last_modified']
+
+    try:
+        response = requests.get(url, headers=headers, timeout=LISTING_TIMEOUT)
+    except requests.RequestException as e:
+        print(f'   목록 조건부 요청 실패: {url} ({str(e)[:50]})')
+        return False, None
+
+    if response.status_code == 304 and cached:
+        return True, cached
+    if response.status_code != 200:
+        return False, None
+
+    card_hash = card_list_hash(response.text, pattern)
+    if card_hash is None:
+        return False, None
+    entry = {
+        'url': url,
+        'etag': response.headers.get('ETag', ''),
+        'last_modified': response.headers.get('Last-Modified', ''),
+        'card_hash': card_hash
+    }
+    return bool(cached and cached.get('card_hash') == card_hash), entry
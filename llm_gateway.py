@@ -0,0 +1,306 @@
+"""Claude 호출 게이트웨이 (비동기 클라이언트 + 모델별 RPM/TPM 토큰 버킷 + 우선순위 레인 + 지터 재시도)
+
+1단계 필터, 2단계 번역, AI Summary가 모두 이 게이트웨이 하나를 거칩니다.
+- 모델별로 요청 수, 입력 토큰, 출력 토큰 버킷을 두고 분당 한도만큼 연속 충전
+  (초기값은 LLM_RPM/LLM_INPUT_TPM/LLM_OUTPUT_TPM, 응답의 anthropic-ratelimit-* 헤더로 한도와 잔량 보정)
+- 출력 토큰은 모델/레인별 실제 출력 토큰의 평균(max_tokens 이하, 첫 호출은 max_tokens)만큼 미리 차감하고
+  응답을 받으면 실제 사용량과의 차이를 정산
+- 대기열은 레인 우선순위 순 (summary > translate > filter): 필터 호출이 밀려 있어도 요약이 먼저 나감
+- 429/5xx/연결 오류는 지터를 넣은 지수 백오프로 재시도 (retry-after 헤더 우선, 429면 해당 모델 전체 일시 정지)
+
+호출 측은 동기 코드 그대로 gateway.lane('filter').messages.create(...)를 여러 스레드에서 부르면 되고,
+실제 요청은 게이트웨이 전용 이벤트 루프에서 비동기로 실행됩니다.
+"""
+import asyncio
+import heapq
+import inspect
+import itertools
+import math
+import os
+import random
+import sys
+import threading
+import time
+
+from anthropic import APIConnectionError, APIStatusError, AsyncAnthropic
+
+from token_budget import estimate_tokens
+
+LLM_RPM = int(os.getenv('LLM_RPM', '50'))
+LLM_INPUT_TPM = int(os.getenv('LLM_INPUT_TPM', '30000'))
+LLM_OUTPUT_TPM = int(os.getenv('LLM_OUTPUT_TPM', '8000'))
+LLM_MAX_CONCURRENCY = int(os.getenv('LLM_MAX_CONCURRENCY', '8'))  # 동시에 진행 중인 요청 수 상한
+LLM_MAX_RETRIES = int(os.getenv('LLM_MAX_RETRIES', '4'))
+RETRY_BASE_SECONDS = 1.0
+RETRY_MAX_SECONDS = 30.0
+TOOL_OVERHEAD_TOKENS = 350  # tool 정의/시스템 토큰 추정치
+
+LANES = {'summary': 0, 'translate': 1, 'filter': 2, 'speculate': 2}  # 숫자가 작을수록 먼저 (같으면 요청 순)
+RETRYABLE_STATUS = {408, 409, 429}
+RATE_LIMIT_HEADERS = {
+    'requests': 'anthropic-ratelimit-requests',
+    'input_tokens': 'anthropic-ratelimit-input-tokens',
+    'output_tokens': 'anthropic-ratelimit-output-tokens',
+}
+
+
+class TokenBucket:
+    """분당 한도 버킷 (용량 = 분당 한도, 초당 한도/60씩 충전)"""
+
+    def __init__(self, per_minute):
+        self.capacity = float(per_minute)
+        self.level = float(per_minute)
+        self.updated = time.monotonic()
+
+    def refill(self, now):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.capacity / 60)
+        self.updated = now
+
+    def wait_time(self, amount, now):
+        """amount만큼 쓸 수 있을 때까지 남은 초 (한도보다 큰 요청은 가득 찼을 때 통과)"""
+        self.refill(now)
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) * 60 / self.capacity
+
+    def take(self, amount):
+        self.level -= min(amount, self.capacity)
+
+    def give(self, amount):
+        self.level = min(self.capacity, self.level + amount)
+
+    def sync(self, limit, remaining, now):
+        """응답 헤더의 한도/잔량으로 보정 (잔량은 더 보수적인 값을 따름)"""
+        self.refill(now)
+        if limit:
+            self.level = self.level * limit / self.capacity
+            self.capacity = float(limit)
+        if remaining is not None:
+            self.level = min(self.level, float(remaining))
+
+
+def _header_int(headers, name):
+    try:
+        return int(headers.get(name))
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_after(headers):
+    try:
+        return float(headers.get('retry-after'))
+    except (TypeError, ValueError):
+        return None
+
+
+def estimate_request_tokens(kwargs):
+    """요청 입력 토큰 추정 (메시지 텍스트 + tool 정의)"""
+    total = TOOL_OVERHEAD_TOKENS if kwargs.get('tools') else 0
+    for message in kwargs.get('messages', []):
+        content = message.get('content')
+        if isinstance(content, str):
+            total += estimate_tokens(content)
+        elif isinstance(content, list):
+            total += sum(estimate_tokens(block.get('text', '')) for block in content if isinstance(block, dict))
+    return total
+
+
+class LLMGateway:
+    def __init__(self, api_key, base_url=None, max_concurrency=LLM_MAX_CONCURRENCY):
+        self._api_key = api_key
+        self._base_url = base_url
+        self._max_concurrency = max_concurrency
+        self._buckets = {}       # 모델 → {'requests', 'input_tokens', 'output_tokens'}
+        self._paused_until = {}  # 모델 → 429 이후 재개 시각 (monotonic)
+        self._waiters = []       # (우선순위, 순번, 모델, 비용, future)
+        self._sequence = itertools.count()
+        self._in_flight = 0
+        self._output_usage = {}  # (모델, 레인) → [실제 출력 토큰 합계, 응답 수]
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='llm-gateway', daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+
+    async def _start(self):
+        # SDK 재시도는 끄고 게이트웨이에서 한도/지터를 반영해 재시도
+        self._client = AsyncAnthropic(api_key=self._api_key, base_url=self._base_url, max_retries=0)
+        self._wakeup = asyncio.Event()
+        self._dispatcher = asyncio.ensure_future(self._dispatch())
+
+    def _model_buckets(self, model):
+        if model not in self._buckets:
+            self._buckets[model] = {
+                'requests': TokenBucket(LLM_RPM),
+                'input_tokens': TokenBucket(LLM_INPUT_TPM),
+                'output_tokens': TokenBucket(LLM_OUTPUT_TPM),
+            }
+        return self._buckets[model]
+
+    def _record(self, lane, key, amount=1):
+        with self._stats_lock:
+            stats = self._stats.setdefault(lane, {'calls': 0, 'retries': 0, 'rate_limited': 0, 'wait_seconds': 0.0})
+            stats[key] += amount
+
+    async def _dispatch(self):
+        """대기열 맨 앞(가장 높은 우선순위) 요청에 버킷이 허용하는 시점에 순서대로 권한 부여"""
+        while True:
+            self._wakeup.clear()
+            if not self._waiters or self._in_flight >= self._max_concurrency:
+                await self._wakeup.wait()
+                continue
+            _, _, model, cost, future = self._waiters[0]
+            if future.cancelled():
+                heapq.heappop(self._waiters)
+                continue
+
+            now = time.monotonic()
+            buckets = self._model_buckets(model)
+            delay = max(self._paused_until.get(model, 0) - now,
+                        max(buckets[name].wait_time(amount, now) for name, amount in cost.items()))
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._waiters)
+            for name, amount in cost.items():
+                buckets[name].take(amount)
+            self._in_flight += 1
+            future.set_result(None)
+
+    async def _acquire(self, lane, model, cost):
+        future = self._loop.create_future()
+        heapq.heappush(self._waiters, (LANES.get(lane, 1), next(self._sequence), model, cost, future))
+        self._wakeup.set()
+        await future
+
+    def _sync_headers(self, model, headers):
+        now = time.monotonic()
+        buckets = self._model_buckets(model)
+        for name, prefix in RATE_LIMIT_HEADERS.items():
+            limit = _header_int(headers, f'{prefix}-limit')
+            remaining = _header_int(headers, f'{prefix}-remaining')
+            if limit or remaining is not None:
+                buckets[name].sync(limit, remaining, now)
+
+    def _estimate_output(self, model, lane, max_tokens):
+        """미리 차감할 출력 토큰 (지금까지 실제 출력 토큰 평균, max_tokens 이하)"""
+        total, count = self._output_usage.get((model, lane), (0, 0))
+        if not count:
+            return max_tokens
+        return min(max_tokens, math.ceil(total / count))
+
+    def _settle(self, model, lane, cost, usage):
+        """미리 차감한 토큰을 실제 사용량으로 정산하고 출력 토큰 평균 갱신"""
+        if usage is None:
+            return
+        observed = self._output_usage.setdefault((model, lane), [0, 0])
+        observed[0] += usage.output_tokens or 0
+        observed[1] += 1
+        buckets = self._model_buckets(model)
+        for name, actual in (('input_tokens', usage.input_tokens), ('output_tokens', usage.output_tokens)):
+            difference = cost[name] - (actual or 0)
+            if difference > 0:
+                buckets[name].give(difference)
+            elif difference < 0:
+                buckets[name].take(-difference)
+
+    async def _create(self, lane, kwargs):
+        model = kwargs['model']
+        cost = {
+            'requests': 1,
+            'input_tokens': estimate_request_tokens(kwargs),
+            'output_tokens': self._estimate_output(model, lane, kwargs.get('max_tokens', 1024)),
+        }
+        for attempt in range(LLM_MAX_RETRIES + 1):
+            queued_at = time.monotonic()
+            await self._acquire(lane, model, cost)
+            self._record(lane, 'wait_seconds', time.monotonic() - queued_at)
+            self._record(lane, 'calls')
+            try:
+                raw = await self._client.messages.with_raw_response.create(**kwargs)
+                self._sync_headers(model, raw.headers)
+                message = raw.parse()
+                if inspect.isawaitable(message):  # SDK 버전에 따라 parse()가 동기/비동기
+                    message = await message
+                self._settle(model, lane, cost, getattr(message, 'usage', None))
+                return message
+            except (APIStatusError, APIConnectionError) as e:
+                status = getattr(e, 'status_code', None)
+                headers = e.response.headers if isinstance(e, APIStatusError) else {}
+                if headers:
+                    self._sync_headers(model, headers)
+                retryable = status is None or status in RETRYABLE_STATUS or status >= 500
+                if not retryable or attempt == LLM_MAX_RETRIES:
+                    raise
+
+                # 지수 백오프 + 전체 지터, retry-after가 있으면 그 이후로
+                delay = random.uniform(0, min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * 2 ** attempt))
+                retry_after = _retry_after(headers)
+                if retry_after is not None:
+                    delay = retry_after + random.uniform(0, 1)
+                if status == 429:
+                    self._record(lane, 'rate_limited')
+                    self._paused_until[model] = max(self._paused_until.get(model, 0), time.monotonic() + delay)
+                self._record(lane, 'retries')
+                print(f'   [재시도] {lane} {status or "연결 오류"} - {delay:.1f}초 후 ({attempt + 1}/{LLM_MAX_RETRIES})')
+                sys.stdout.flush()
+            finally:
+                self._in_flight -= 1
+                self._wakeup.set()
+            await asyncio.sleep(delay)
+
+    def create(self, lane, **kwargs):
+        """동기 호출 (어느 스레드에서나 호출 가능, 응답 Message 반환)"""
+        return asyncio.run_coroutine_threadsafe(self._create(lane, kwargs), self._loop).result()
+
+    def lane(self, name):
+        """anthropic 클라이언트처럼 .messages.create(...)를 제공하는 레인별 클라이언트"""
+        return LaneClient(self, name)
+
+    def close(self):
+        """디스패처와 이벤트 루프 정리 (실행 마지막에 호출)"""
+        async def _stop():
+            self._dispatcher.cancel()
+            await self._client.close()
+
+        if self._loop.is_running():
+            asyncio.run_coroutine_threadsafe(_stop(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+
+    def print_stats(self):
+        """레인별 호출/재시도/429/대기 시간 + 모델별 현재 한도"""
+        with self._stats_lock:
+            snapshot = {lane: dict(stats) for lane, stats in self._stats.items()}
+        if not snapshot:
+            return
+        print('\n>> Claude 게이트웨이 통계')
+        for lane in sorted(snapshot, key=lambda name: LANES.get(name, 1)):
+            stats = snapshot[lane]
+            print(f'   {lane}: 호출 {stats["calls"]}회, 재시도 {stats["retries"]}회 (429 {stats["rate_limited"]}회), '
+                  f'대기 {stats["wait_seconds"]:.1f}초')
+        for model, buckets in self._buckets.items():
+            limits = ', '.join(f'{name} {bucket.capacity:,.0f}/분' for name, bucket in buckets.items())
+            print(f'   {model}: {limits}')
+        sys.stdout.flush()
+
+
+class _LaneMessages:
+    def __init__(self, gateway, lane):
+        self._gateway = gateway
+        self._lane = lane
+
+    def create(self, **kwargs):
+        return self._gateway.create(self._lane, **kwargs)
+
+
+class LaneClient:
+    def __init__(self, gateway, lane):
+        self.messages = _LaneMessages(gateway, lane)
@@ -0,0 +1,268 @@
+"""1단계 로컬 점수 모델 (해시 n-gram 특징 + 로지스틱 회귀, CPU)
+
+quick_filter가 Claude로 평가한 결과를 stage1_labels.jsonl에 쌓아 두고, 실행 시작 시
+관련성(>= 0.5)과 중요도(>= 0.4) 통과 여부를 예측하는 분류기 두 개를 학습합니다.
+확신 구간 밖(임계값 근처)의 기사만 Claude로 올려 보내고, 보류 데이터로 측정한 정확도가
+기준에 못 미치면 그 실행은 전부 Claude로 평가합니다.
+학습은 NumPy로 작은 미니배치 SGD를 돌리고, NumPy가 없으면 같은 SGD를 dict 희소 벡터로 처리합니다.
+"""
+import json
+import math
+import os
+import random
+import re
+import threading
+import zlib
+from datetime import datetime
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 미설치 시 순수 Python으로 처리
+    np = None
+
+LOCAL_SCORER = os.getenv('LOCAL_SCORER', '1') == '1'
+LABELS_FILE = os.getenv('STAGE1_LABELS_FILE', 'stage1_labels.jsonl')
+LOCAL_MIN_LABELS = int(os.getenv('LOCAL_MIN_LABELS', '200'))  # 이보다 라벨이 적으면 학습하지 않음
+LOCAL_MAX_LABELS = 5000  # 최근 라벨만 유지
+LOCAL_CONFIDENCE = float(os.getenv('LOCAL_CONFIDENCE', '0.85'))  # p >= 0.85 또는 p <= 0.15면 로컬 판정
+LOCAL_MIN_ACCURACY = 0.9  # 보류 데이터의 확신 구간 정확도가 이보다 낮으면 로컬 판정 끔
+LOCAL_AUDIT_RATE = float(os.getenv('LOCAL_AUDIT_RATE', '0.05'))  # 로컬 판정 기사 중 Claude로도 평가할 비율
+
+RELEVANCE_THRESHOLD = 0.5
+IMPORTANCE_THRESHOLD = 0.4
+
+HASH_DIM = 2 ** 18
+TRAIN_EPOCHS = 8
+LEARNING_RATE = 0.5
+L2 = 1e-4
+SGD_BATCH_SIZE = 8  # NumPy 학습의 미니배치 크기 (작게 유지해 기사별 SGD와 비슷하게 수렴)
+
+_labels_lock = threading.Lock()  # 1단계 평가가 여러 스레드에서 동시에 기록
+
+WORD_PATTERN = re.compile(r"[a-z0-9][a-z0-9'\-]*")
+CJK_RUN_PATTERN = re.compile(r'[぀-ヿ㐀-䶿一-鿿가-힯]+')
+
+
+def _hash(token):
+    return zlib.crc32(token.encode('utf-8')) % HASH_DIM
+
+
+def _tokens(text, prefix):
+    """영문은 단어 1~2-gram, 중국어/한국어는 글자 2~3-gram"""
+    text = text.lower()
+    words = WORD_PATTERN.findall(text)
+    tokens = [prefix + w for w in words]
+    tokens += [f'{prefix}{a}_{b}' for a, b in zip(words, words[1:])]
+    for run in CJK_RUN_PATTERN.findall(text):
+        for n in (2, 3):
+            tokens += [prefix + run[i:i + n] for i in range(len(run) - n + 1)]
+    return tokens
+
+
+def featurize(title, text):
+    """제목/본문 미리보기를 L2 정규화된 희소 벡터 {인덱스: 값}로 변환"""
+    vector = {}
+    for token in _tokens(title, 't:') + _tokens(text, 'b:'):
+        index = _hash(token)
+        vector[index] = vector.get(index, 0.0) + 1.0
+    norm = math.sqrt(sum(v * v for v in vector.values())) or 1.0
+    return {i: v / norm for i, v in vector.items()}
+
+
+def _sigmoid(z):
+    if z < -35:
+        return 0.0
+    if z > 35:
+        return 1.0
+    return 1.0 / (1.0 + math.exp(-z))
+
+
+def predict_proba(model, x):
+    """통과 확률"""
+    weights = model['weights']
+    if np is None:
+        return _sigmoid(model['bias'] + sum(weights.get(i, 0.0) * v for i, v in x.items()))
+    indices = np.fromiter(x.keys(), dtype=np.int64, count=len(x))
+    values = np.fromiter(x.values(), dtype=np.float64, count=len(x))
+    return _sigmoid(model['bias'] + float(weights[indices] @ values))
+
+
+def train_logistic(samples, labels, epochs=TRAIN_EPOCHS, seed=0):
+    """희소 SGD 로지스틱 회귀 (등장한 특징에만 L2 감쇠 적용)"""
+    if np is not None:
+        return _train_logistic_numpy(samples, labels, epochs, seed)
+    model = {'weights': {}, 'bias': 0.0}
+    weights = model['weights']
+    order = list(range(len(samples)))
+    rng = random.Random(seed)
+    for epoch in range(epochs):
+        rng.shuffle(order)
+        lr = LEARNING_RATE / (1 + epoch)
+        for j in order:
+            x = samples[j]
+            error = predict_proba(model, x) - labels[j]
+            model['bias'] -= lr * error
+            for i, v in x.items():
+                w = weights.get(i, 0.0)
+                weights[i] = w - lr * (error * v + L2 * w)
+    return model
+
+
+def _train_logistic_numpy(samples, labels, epochs, seed):
+    """train_logistic의 NumPy 버전 (CSR 배열 + SGD_BATCH_SIZE개씩 미니배치, 배치 안의 갱신은 합산)"""
+    lengths = np.array([len(x) for x in samples], dtype=np.int64)
+    indptr = np.concatenate(([0], np.cumsum(lengths)))
+    indices = np.fromiter((i for x in samples for i in x), dtype=np.int64, count=int(indptr[-1]))
+    values = np.fromiter((v for x in samples for v in x.values()), dtype=np.float64, count=int(indptr[-1]))
+    targets = np.asarray(labels, dtype=np.float64)
+    weights = np.zeros(HASH_DIM)
+    bias = 0.0
+    rng = np.random.default_rng(seed)
+    for epoch in range(epochs):
+        lr = LEARNING_RATE / (1 + epoch)
+        order = rng.permutation(len(samples))
+        # 섞은 순서대로 CSR 재배열 → 미니배치가 연속 구간
+        order_lengths = lengths[order]
+        order_ptr = np.concatenate(([0], np.cumsum(order_lengths)))
+        gather = np.repeat(indptr[order] - order_ptr[:-1], order_lengths) + np.arange(order_ptr[-1])
+        epoch_indices, epoch_values, epoch_targets = indices[gather], values[gather], targets[order]
+        for start in range(0, len(samples), SGD_BATCH_SIZE):
+            stop = min(start + SGD_BATCH_SIZE, len(samples))
+            lo, hi = order_ptr[start], order_ptr[stop]
+            cols, vals = epoch_indices[lo:hi], epoch_values[lo:hi]
+            rows = np.repeat(np.arange(stop - start), order_lengths[start:stop])
+            w = weights[cols]
+            z = np.clip(bias + np.bincount(rows, weights=w * vals, minlength=stop - start), -35, 35)
+            error = 1.0 / (1.0 + np.exp(-z)) - epoch_targets[start:stop]
+            bias -= lr * float(error.sum())
+            np.add.at(weights, cols, -lr * (error[rows] * vals + L2 * w))
+    return {'weights': weights, 'bias': bias}
+
+
+def record_label(title, preview, game_relevance, importance, media='', url=''):
+    """Claude 1단계 결과를 학습 라벨로 추가 (매체/URL은 투기 실행의 통과율 계산용)"""
+    entry = {
+        'title': title,
+        'preview': preview,
+        'game_relevance': game_relevance,
+        'importance': importance,
+        'labeled_at': datetime.now().strftime('%Y-%m-%d')
+    }
+    if media:
+        entry['media'] = media
+        entry['url'] = url
+    with _labels_lock, open(LABELS_FILE, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+
+def sample_for_audit(rate=LOCAL_AUDIT_RATE):
+    """로컬 판정 기사를 Claude 평가로 돌릴지 무작위 결정
+
+    에스컬레이션된 기사(임계값 근처)만 라벨로 쌓이면 확신 구간의 라벨이 사라져 모델이 치우치므로,
+    로컬 판정 기사의 일부도 Claude로 평가해 라벨로 남김.
+    """
+    return random.random() < rate
+
+
+def load_labels():
+    """라벨 로드 (깨진 줄은 건너뜀)"""
+    labels = []
+    try:
+        with open(LABELS_FILE, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    labels.append(json.loads(line))
+                except ValueError:
+                    continue
+    except FileNotFoundError:
+        pass
+    return labels
+
+
+def prune_labels(max_labels=LOCAL_MAX_LABELS):
+    """최근 라벨만 남기고 파일 재작성"""
+    labels = load_labels()
+    if len(labels) <= max_labels:
+        return
+    with open(LABELS_FILE, 'w', encoding='utf-8') as f:
+        for entry in labels[-max_labels:]:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+
+def calibration_stats(model, samples, labels, confidence=LOCAL_CONFIDENCE):
+    """보류 데이터 기준 Brier 점수, 구간별 예측/실제 통과율, 확신 구간 정확도와 비율"""
+    probs = [predict_proba(model, x) for x in samples]
+    brier = sum((p - y) ** 2 for p, y in zip(probs, labels)) / len(labels)
+    bins = []
+    for low in (0.0, 0.2, 0.4, 0.6, 0.8):
+        members = [(p, y) for p, y in zip(probs, labels) if low <= p < low + 0.2 or (low == 0.8 and p == 1.0)]
+        if members:
+            bins.append((low, len(members),
+                         sum(p for p, _ in members) / len(members),
+                         sum(y for _, y in members) / len(members)))
+    confident = [(p, y) for p, y in zip(probs, labels) if p >= confidence or p <= 1 - confidence]
+    correct = sum(1 for p, y in confident if (p >= 0.5) == (y == 1))
+    return {
+        'brier': brier,
+        'bins': bins,
+        'coverage': len(confident) / len(labels),
+        'confident_accuracy': correct / len(confident) if confident else 0.0
+    }
+
+
+def build_local_scorer(labels=None):
+    """라벨로 관련성/중요도 분류기 학습 + 보류 데이터로 보정 통계 측정
+
+    라벨이 부족하거나 한 클래스뿐이거나 정확도가 기준 미달이면 None 반환 (전부 Claude 평가).
+    """
+    if not LOCAL_SCORER:
+        return None
+    labels = load_labels() if labels is None else labels
+    if len(labels) < LOCAL_MIN_LABELS:
+        print(f'   로컬 모델: 라벨 {len(labels)}개 (최소 {LOCAL_MIN_LABELS}개 필요) - 전부 Claude 평가')
+        return None
+
+    samples = [featurize(e['title'], e['preview']) for e in labels]
+    targets = {
+        'relevance': [1 if e['game_relevance'] >= RELEVANCE_THRESHOLD else 0 for e in labels],
+        'importance': [1 if e['importance'] >= IMPORTANCE_THRESHOLD else 0 for e in labels],
+    }
+
+    # 최근 20%를 보류 데이터로 사용
+    split = int(len(samples) * 0.8)
+    scorer = {'models': {}, 'calibration': {}}
+    for name, y in targets.items():
+        if len(set(y[:split])) < 2:
+            print(f'   로컬 모델: {name} 라벨이 한 종류뿐 - 전부 Claude 평가')
+            return None
+        held_out = train_logistic(samples[:split], y[:split])
+        stats = calibration_stats(held_out, samples[split:], y[split:])
+        scorer['calibration'][name] = stats
+        print(f'   로컬 모델 [{name}] Brier {stats["brier"]:.3f}, 확신 구간 {stats["coverage"] * 100:.0f}% '
+              f'(정확도 {stats["confident_accuracy"] * 100:.1f}%)')
+        for low, count, predicted, actual in stats['bins']:
+            print(f'      p {low:.1f}~{low + 0.2:.1f}: {count}건, 예측 {predicted:.2f} / 실제 {actual:.2f}')
+        if stats['confident_accuracy'] < LOCAL_MIN_ACCURACY:
+            print(f'   로컬 모델: {name} 정확도 기준({LOCAL_MIN_ACCURACY * 100:.0f}%) 미달 - 전부 Claude 평가')
+            return None
+        # 보정 확인 후 전체 라벨로 다시 학습
+        scorer['models'][name] = train_logistic(samples, y)
+    return scorer
+
+
+def local_decision(scorer, title, preview, confidence=LOCAL_CONFIDENCE):
+    """로컬 판정 (p_relevance, p_importance, decision)
+
+    decision: True(로컬 통과) / False(로컬 제외) / None(임계값 근처 → Claude로 에스컬레이션)
+    """
+    x = featurize(title, preview)
+    p_relevance = predict_proba(scorer['models']['relevance'], x)
+    p_importance = predict_proba(scorer['models']['importance'], x)
+    low = 1 - confidence
+    if p_relevance <= low or p_importance <= low:
+        decision = False
+    elif p_relevance >= confidence and p_importance >= confidence:
+        decision = True
+    else:
+        decision = None
+    return p_relevance, p_importance, decision
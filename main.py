@@ -7,6 +7,9 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 import pytz
 import requests
@@ -14,8 +17,36 @@ import time
 import re
 import sys
 import json
+import xml.etree.ElementTree as ET
 from dateutil import parser as date_parser
 from anthropic import Anthropic
+from archive import save_edition
+from article_table import stage1_scores
+from chrome_watchdog import WatchedDriver, checkpoint, print_memory_report
+from delivery import deliver_all, parse_webhook_urls
+from fingerprints import FINGERPRINTS, load_fingerprints, match_previous, remember_results, save_fingerprints
+from glossary import format_glossary, glossary_for
+from listing_cache import LISTING_CACHE, check_listing
+from llm_gateway import LLM_MAX_CONCURRENCY, LLMGateway
+from page_parser import parse_html
+from token_budget import (
+    apply_token_budget, detect_language, estimate_tokens, select_informative_text, stage2_cost,
+    total_stage2_tokens, trim_to_tokens
+)
+from structured_output import (
+    StructuredOutputError, make_tool, parse_message, print_parse_stats,
+    record_external_result, request_structured, validate
+)
+from local_scorer import build_local_scorer, load_labels, local_decision, prune_labels, record_label, sample_for_audit
+from speculation import (
+    SPECULATIVE_STAGE2, print_speculation_report, record_speculation, should_speculate, source_pass_rates
+)
+from trends import (
+    format_trend_signals, get_rising_entities, load_trend_state, save_trend_state, update_trend_state
+)
+from translation_memory import (
+    apply_translation_memory, entity_glossary, find_similar, has_exact, remember_translations
+)
 import os
 from dotenv import load_dotenv
 
@@ -23,18 +54,123 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # 설정
+# WEBHOOK_URL: 쉼표로 여러 수신처 지정 가능
 WEBHOOK_URL = os.getenv('WEBHOOK_URL', 'https://hook.us2.make.com/x66njlvg1dx6jxethzuy4n92w4xrgua5')
 CLAUDE_API_KEY = os.getenv('CLAUDE_API_KEY')
-MAX_PAGE = 2
+MAX_PAGE = int(os.getenv('MAX_PAGE', '2'))
+RAW_BODY_MAX_CHARS = 6000  # 크롤링 시 보관하는 본문 길이 (2단계 전에 token_budget으로 토큰 예산만큼 선별)
+QUICK_FILTER_PREVIEW_TOKENS = 150  # 1단계에 보내는 본문 토큰 수
 KST = pytz.timezone('Asia/Seoul')
+IMPLICIT_WAIT_SECONDS = 10  # 요소 조회 기본 대기 (없을 수도 있는 요소는 no_implicit_wait로 0초)
+
+# 수집 윈도우 설정
+# - window: 실행 시각 기준 최근 CRAWL_WINDOW_HOURS 시간
+# - since_last_run: 마지막 성공 실행 시각(워터마크) 이후 (하루 여러 번 실행용)
+CRAWL_MODE = os.getenv('CRAWL_MODE', 'window')
+CRAWL_WINDOW_HOURS = float(os.getenv('CRAWL_WINDOW_HOURS', '24'))
+CRAWL_MAX_LOOKBACK_HOURS = float(os.getenv('CRAWL_MAX_LOOKBACK_HOURS', '72'))  # 워터마크가 오래된 경우 최대 소급 범위
+WATERMARK_OVERLAP_MINUTES = 30  # 발행 지연/시계 오차 보정 (중복은 seen_urls로 제거)
+CRAWL_STATE_FILE = os.getenv('CRAWL_STATE_FILE', 'crawl_state.json')
+
+# IGN 목록 단계에서 발행 시각을 먼저 확보해 수집 윈도우 밖 카드는 상세 페이지를 열지 않음
+IGN_LISTING_FAST_PATH = os.getenv('IGN_LISTING_FAST_PATH', '1') == '1'
+IGN_FEED_URL = os.getenv('IGN_FEED_URL', 'https://feeds.feedburner.com/ign/news')
+IGN_BODY_SELECTOR = 'main p'
+
+# 소스 동시 크롤링 설정 (소스마다 전용 Chrome 드라이버 사용)
+CRAWL_WORKERS = int(os.getenv('CRAWL_WORKERS', '3'))
+SOURCE_TIMEOUT = int(os.getenv('SOURCE_TIMEOUT', '600'))  # 소스별 시간 예산 (초)
+
+# 크롤러 보호 장치: 소스별 차단기 + 실행 전체 마감 (오전 9시 뉴스레터가 늦지 않도록)
+CIRCUIT_BREAKER_THRESHOLD = int(os.getenv('CIRCUIT_BREAKER_THRESHOLD', '3'))  # 연속 타임아웃 N회면 해당 소스 중단
+RUN_DEADLINE_MINUTES = float(os.getenv('RUN_DEADLINE_MINUTES', '50'))  # 실행 시작부터 웹훅 전송까지 마감
+CRAWL_DEADLINE_MINUTES = float(os.getenv('CRAWL_DEADLINE_MINUTES', '25'))  # 크롤링 단계 마감 (실행 시작 기준)
+DELIVERY_RESERVE_MINUTES = 3  # HTML 생성 + 웹훅 전송용으로 남겨 두는 시간
+RUN_STARTED_AT = time.time()
 
 # Claude 클라이언트 초기화
 if not CLAUDE_API_KEY:
     raise ValueError("CLAUDE_API_KEY 환경변수가 설정되지 않았습니다!")
-anthropic_client = Anthropic(api_key=CLAUDE_API_KEY)
+# CLAUDE_BASE_URL: 로컬 테스트용 가짜 엔드포인트 등으로 API 주소를 바꿀 때 사용
+anthropic_client = Anthropic(api_key=CLAUDE_API_KEY, base_url=os.getenv('CLAUDE_BASE_URL') or None)
+# 동기 호출(1단계/2단계/요약)은 모두 게이트웨이를 거쳐 계정 한도에 맞춰 동시 실행 (Message Batches는 별도 한도라 직접 호출)
+llm_gateway = LLMGateway(CLAUDE_API_KEY, base_url=os.getenv('CLAUDE_BASE_URL') or None)
+filter_client = llm_gateway.lane('filter')
+translate_client = llm_gateway.lane('translate')
+summary_client = llm_gateway.lane('summary')
+speculate_client = llm_gateway.lane('speculate')  # 1단계와 동시에 시작하는 2단계 번역 (필터와 같은 우선순위)
+
+# 2단계 번역 모드
+# - sync: 기사별 순차 호출 (기본)
+# - batch: Message Batches API로 한 번에 제출 (백필/주말판 등 급하지 않은 실행용, 비용 절감)
+STAGE2_MODE = os.getenv('STAGE2_MODE', 'sync')
+BATCH_POLL_INTERVAL = int(os.getenv('BATCH_POLL_INTERVAL', '30'))  # 배치 상태 확인 간격 (초)
+BATCH_MAX_WAIT = int(os.getenv('BATCH_MAX_WAIT', '3600'))  # 배치 최대 대기 시간 (초), 초과 시 동기 호출로 처리
+TRANSLATION_MODEL = 'claude-sonnet-4-5-20250929'
+
+# 중국어 기사(Gamelook 등)는 토큰 길이 기준으로 묶어 한 요청에 여러 건 번역 (용어집은 묶음당 한 번)
+ZH_CHUNK_TOKENS = int(os.getenv('ZH_CHUNK_TOKENS', '3000'))  # 묶음당 본문 토큰 상한
+ZH_CHUNK_MAX_ARTICLES = int(os.getenv('ZH_CHUNK_MAX_ARTICLES', '5'))
+ZH_OUTPUT_TOKENS_PER_ARTICLE = 350
+
+# AI Summary: 기사가 많으면 카테고리 묶음별 요약(map) → 최종 통합(reduce)
+SUMMARY_SINGLE_PASS_LIMIT = 30
+SUMMARY_CHUNK_SIZE = 25
+SUMMARY_MAX_CHUNKS = int(os.getenv('SUMMARY_MAX_CHUNKS', '12'))
+SUMMARY_WORKERS = 4
 
-def setup_driver():
-    """Chrome 드라이버 설정"""
+CATEGORIES = ['규제 & 이슈', '게임 출시 & 발표', '매출 & 성과', '업데이트 & 패치', 'IP & 콜라보', '커뮤니티 & 이벤트']
+
+# 응답 형식은 tool use 스키마로 강제 (structured_output.request_structured)
+QUICK_FILTER_TOOL = make_tool('report_filter_scores', 'Report game relevance and importance scores for the article.', {
+    'type': 'object',
+    'properties': {
+        'game_relevance': {'type': 'number', 'minimum': 0.0, 'maximum': 1.0},
+        'importance': {'type': 'number', 'minimum': 0.0, 'maximum': 1.0},
+        'should_process': {'type': 'boolean'}
+    },
+    'required': ['game_relevance', 'importance', 'should_process']
+})
+TRANSLATION_TOOL = make_tool('report_translation', '번역된 제목, 요약, 카테고리를 보고합니다.', {
+    'type': 'object',
+    'properties': {
+        'title_kr': {'type': 'string', 'minLength': 1},
+        'content_summary_kr': {'type': 'string', 'minLength': 1},
+        'category': {'type': 'string', 'enum': CATEGORIES}
+    },
+    'required': ['title_kr', 'content_summary_kr', 'category']
+})
+
+TRANSLATION_CHUNK_ITEM_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'index': {'type': 'integer', 'minimum': 1},
+        'title_kr': {'type': 'string', 'minLength': 1},
+        'content_summary_kr': {'type': 'string', 'minLength': 1},
+        'category': {'type': 'string', 'enum': CATEGORIES}
+    },
+    'required': ['index', 'title_kr', 'content_summary_kr', 'category']
+}
+
+TRANSLATION_CHUNK_TOOL = make_tool('report_translations', '여러 기사의 번역된 제목, 요약, 카테고리를 기사 번호와 함께 보고합니다.', {
+    'type': 'object',
+    'properties': {
+        'translations': {'type': 'array', 'items': TRANSLATION_CHUNK_ITEM_SCHEMA}
+    },
+    'required': ['translations']
+})
+
+# 묶음 응답은 배열 형태만 검사하고 항목은 하나씩 검증 (잘못된 항목 하나 때문에 묶음 전체를 다시 받지 않음)
+TRANSLATION_CHUNK_ENVELOPE = {
+    'type': 'object',
+    'properties': {
+        'translations': {'type': 'array', 'items': {'type': 'object'}}
+    },
+    'required': ['translations']
+}
+
+def setup_driver(debugging_port=9222):
+    """Chrome 드라이버 설정 (동시 실행 시 드라이버마다 디버깅 포트를 다르게 지정)"""
     chrome_options = Options()
     chrome_options.add_argument('--headless=new')  # 새로운 headless 모드
     chrome_options.add_argument('--disable-gpu')
@@ -46,7 +182,7 @@ def setup_driver():
     chrome_options.add_argument('--disable-web-security')
     chrome_options.add_argument('--ignore-certificate-errors')
     chrome_options.add_argument('--window-size=1920,1080')
-    chrome_options.add_argument('--remote-debugging-port=9222')  # 디버깅 포트
+    chrome_options.add_argument(f'--remote-debugging-port={debugging_port}')  # 디버깅 포트
     chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
     
     # 로그 레벨 설정
@@ -58,31 +194,235 @@ def setup_driver():
     # 타임아웃 설정
     driver.set_page_load_timeout(30)
     driver.set_script_timeout(30)
-    driver.implicitly_wait(10)
+    driver.implicitly_wait(IMPLICIT_WAIT_SECONDS)
     
     print('Chrome 드라이버 초기화 완료!')
     return driver
 
-def is_within_24_hours(article_time_kst, now_kst):
-    """24시간 이내 기사인지 확인"""
-    diff = now_kst - article_time_kst
-    return diff.total_seconds() / 3600 <= 24
+@contextmanager
+def no_implicit_wait(driver):
+    """없을 수도 있는 요소 조회용: 요소가 없을 때 implicit wait만큼 기다리지 않도록 잠시 0으로"""
+    driver.implicitly_wait(0)
+    try:
+        yield
+    finally:
+        driver.implicitly_wait(IMPLICIT_WAIT_SECONDS)
+
+def llm_deadline():
+    """Claude 호출 단계 마감 시각 (전체 마감에서 전송 시간을 뺀 시각)"""
+    return RUN_STARTED_AT + (RUN_DEADLINE_MINUTES - DELIVERY_RESERVE_MINUTES) * 60
+
+def past_llm_deadline():
+    return time.time() > llm_deadline()
+
+def new_circuit_breaker(name):
+    """소스별 차단기 (연속 타임아웃 횟수, 열림 여부)"""
+    return {'name': name, 'consecutive_timeouts': 0, 'open': False}
+
+def record_crawl_timeout(breaker):
+    """타임아웃 기록, 연속 CIRCUIT_BREAKER_THRESHOLD회면 차단기 열림 (해당 소스 중단)"""
+    if breaker is None:
+        return
+    breaker['consecutive_timeouts'] += 1
+    if not breaker['open'] and breaker['consecutive_timeouts'] >= CIRCUIT_BREAKER_THRESHOLD:
+        breaker['open'] = True
+        print(f'   🔌 {breaker["name"]} 연속 타임아웃 {breaker["consecutive_timeouts"]}회 - 차단기 열림, 남은 기사 건너뜀')
+        sys.stdout.flush()
 
-def generate_daily_summary(articles):
-    """Claude API를 사용하여 오늘의 게임 산업 트렌드 분석 (4개 불릿)"""
+def record_crawl_success(breaker):
+    if breaker is not None:
+        breaker['consecutive_timeouts'] = 0
+
+def should_stop_crawl(breaker, deadline):
+    """차단기가 열렸거나 시간 예산을 넘었으면 True"""
+    return bool((breaker and breaker['open']) or (deadline and time.time() > deadline))
+
+def unique_articles(articles):
+    """URL 기준 중복 제거 (먼저 수집된 항목 유지)"""
+    seen = set()
+    result = []
+    for article in articles:
+        if article['url'] in seen:
+            continue
+        seen.add(article['url'])
+        result.append(article)
+    return result
+
+def load_crawl_state():
+    """실행 간 유지되는 크롤링 상태 로드 (워터마크, 최근 수집 URL)"""
     try:
-        # 상위 30개 기사의 제목과 요약만 추출
-        article_summaries = []
-        for i, article in enumerate(articles[:30], 1):
-            category = article.get('category', '기타')
-            article_summaries.append(f"{i}. [{category}] {article.get('title_kr', article.get('title', ''))}\n   {article.get('content_summary_kr', '')[:100]}...")
+        with open(CRAWL_STATE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def save_crawl_state(state):
+    """크롤링 상태 저장"""
+    with open(CRAWL_STATE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+
+CRAWL_STATE = load_crawl_state()
+
+def get_crawl_cutoff(now_kst):
+    """수집 기준 시각 계산 (이 시각 이후 발행된 기사만 수집)"""
+    window_cutoff = now_kst - timedelta(hours=CRAWL_WINDOW_HOURS)
+    watermark = CRAWL_STATE.get('last_success_at')
+    if CRAWL_MODE != 'since_last_run' or not watermark:
+        return window_cutoff
+
+    # 워터마크가 너무 오래됐으면 최대 소급 범위까지만 (실행이 며칠 빠진 경우)
+    watermark_cutoff = date_parser.parse(watermark).astimezone(KST) - timedelta(minutes=WATERMARK_OVERLAP_MINUTES)
+    return max(watermark_cutoff, now_kst - timedelta(hours=CRAWL_MAX_LOOKBACK_HOURS))
+
+def is_within_window(article_time_kst, now_kst, resolution=None):
+    """수집 윈도우 이내 기사인지 확인
+
+    resolution: 날짜 정밀도 (예: 일 단위 날짜는 timedelta(days=1)).
+    자정으로 파싱된 날짜가 그날 늦게 발행된 기사일 수 있으므로 구간 끝 기준으로 비교함.
+    """
+    latest_time = article_time_kst + resolution if resolution else article_time_kst
+    return latest_time >= get_crawl_cutoff(now_kst)
+
+def filter_seen_articles(articles):
+    """since_last_run 모드에서 이전 실행에 이미 수집한 기사 제거 (겹침 구간 중복 방지)
+
+    본문 지문이 크게 달라진 기사(content_updated)는 이미 수집했어도 다시 처리.
+    """
+    if CRAWL_MODE != 'since_last_run':
+        return articles
+    seen_urls = CRAWL_STATE.get('seen_urls', {})
+    return [a for a in articles if a['url'] not in seen_urls or a.get('content_updated')]
+
+def update_crawl_watermark(now_kst, articles):
+    """성공 실행 후 워터마크 갱신 + 최근 수집 URL 기록 (최대 소급 범위 밖은 정리)
+
+    articles: 이번 실행에서 수집해 1단계 판정까지 끝난 기사 (통과/제외 모두)
+    """
+    seen_urls = dict(CRAWL_STATE.get('seen_urls', {}))
+    for article in articles:
+        seen_urls[article['url']] = article.get('date', '')
+
+    oldest_kept = (now_kst - timedelta(hours=CRAWL_MAX_LOOKBACK_HOURS)).strftime('%Y-%m-%d %H:%M')
+    seen_urls = {url: date for url, date in seen_urls.items() if date >= oldest_kept}
+
+    CRAWL_STATE['last_success_at'] = now_kst.isoformat()
+    CRAWL_STATE['seen_urls'] = seen_urls
+    CRAWL_STATE['listings'] = {**CRAWL_STATE.get('listings', {}), **PENDING_LISTINGS}
+    save_crawl_state(CRAWL_STATE)
+
+# 이번 실행에서 끝까지 크롤링한 소스의 목록 캐시 항목 (웹훅 전송 성공 시 crawl_state.json에 반영)
+PENDING_LISTINGS = {}
+
+def check_source_listing(source):
+    """목록 첫 페이지 조건부 요청 → (건너뛸지 여부, 새 캐시 항목)
+
+    목록이 지난 성공 실행과 같아도 window 모드는 최근 24시간 기사를 다시 모아야 하므로
+    since_last_run 모드에서만 요청하고 소스 전체를 건너뜀 (window 모드는 요청하지 않음).
+    """
+    if not LISTING_CACHE or CRAWL_MODE != 'since_last_run' or not source.get('card_link_pattern'):
+        return False, None
+    name = source['name']
+    cached = CRAWL_STATE.get('listings', {}).get(name)
+    unchanged, entry = check_listing(source['listing_url'], source['card_link_pattern'], cached)
+    if not unchanged:
+        return False, entry
+    print(f'>> [{name}] 목록이 마지막 성공 실행 이후 그대로 - 크롤링 생략')
+    sys.stdout.flush()
+    return True, entry
+
+def format_summary_lines(articles, summary_chars=100):
+    """AI Summary 입력용 기사 목록 텍스트"""
+    article_summaries = []
+    for i, article in enumerate(articles, 1):
+        category = article.get('category', '기타')
+        article_summaries.append(f"{i}. [{category}] {article.get('title_kr', article.get('title', ''))}\n   {article.get('content_summary_kr', '')[:summary_chars]}...")
+    return "\n\n".join(article_summaries)
+
+def build_summary_chunks(articles):
+    """카테고리별로 중요도 순 정렬 후 SUMMARY_CHUNK_SIZE개씩 묶음
+
+    묶음이 SUMMARY_MAX_CHUNKS개를 넘으면 카테고리를 번갈아 가며 앞쪽(중요도 높은) 묶음부터 채택해
+    기사가 수백 개로 늘어도 호출 수와 토큰이 일정 범위 안에 머물도록 함.
+    """
+    by_category = {}
+    for article in articles:
+        by_category.setdefault(article.get('category', '기타'), []).append(article)
+
+    category_chunks = []
+    for category, items in by_category.items():
+        items = sorted(items, key=lambda a: stage1_scores(a)[1], reverse=True)
+        chunks = [items[i:i + SUMMARY_CHUNK_SIZE] for i in range(0, len(items), SUMMARY_CHUNK_SIZE)]
+        category_chunks.append((category, chunks))
+
+    selected = []
+    depth = 0
+    while len(selected) < SUMMARY_MAX_CHUNKS and any(depth < len(chunks) for _, chunks in category_chunks):
+        for category, chunks in category_chunks:
+            if depth < len(chunks) and len(selected) < SUMMARY_MAX_CHUNKS:
+                selected.append((category, chunks[depth]))
+        depth += 1
+    return selected
+
+def summarize_chunk(category, articles):
+    """map 단계: 카테고리 묶음 하나를 사례 중심 3줄 이내로 요약"""
+    prompt = f"""다음은 오늘 수집된 게임 뉴스 중 '{category}' 카테고리 기사 {len(articles)}개입니다.
+
+{format_summary_lines(articles, summary_chars=200)}
+
+이 묶음에서 가장 중요한 흐름을 최대 3줄로 정리하세요.
+- 각 줄에 구체적인 게임명/회사명/수치를 포함
+- 여러 기사에 공통된 주제가 있으면 우선
+- 명사형 종결어미 사용"""
+
+    response = summary_client.messages.create(
+        model="claude-sonnet-4-20250514",
+        max_tokens=400,
+        messages=[{"role": "user", "content": prompt}]
+    )
+    return f"[{category}] ({len(articles)}개 기사)\n{response.content[0].text.strip()}"
+
+def generate_daily_summary(articles, rising_trends=None):
+    """Claude API를 사용하여 오늘의 게임 산업 트렌드 분석 (4개 불릿)
+
+    기사가 SUMMARY_SINGLE_PASS_LIMIT개를 넘으면 카테고리 묶음별 요약(map)을 동시에 만든 뒤
+    그 요약들로 최종 4개 불릿을 생성(reduce)함. 실패한 묶음은 빼고 성공한 묶음만으로 통합.
+    rising_trends: trends.get_rising_entities() 결과 (이번 주 급상승 게임/회사를 참고 자료로 제공)
+    """
+    try:
+        if len(articles) <= SUMMARY_SINGLE_PASS_LIMIT:
+            articles_text = format_summary_lines(articles)
+            source_label = "수집된 기사들"
+        else:
+            chunks = build_summary_chunks(articles)
+            covered = sum(len(chunk) for _, chunk in chunks)
+            print(f'   기사 {len(articles)}개 → {len(chunks)}개 묶음 요약 후 통합 ({covered}개 기사 반영)')
+            sys.stdout.flush()
+            with ThreadPoolExecutor(max_workers=SUMMARY_WORKERS) as executor:
+                futures = [executor.submit(summarize_chunk, category, chunk) for category, chunk in chunks]
+            mini_summaries = []
+            for (category, _), future in zip(chunks, futures):
+                try:
+                    mini_summaries.append(future.result())
+                except Exception as e:
+                    print(f'   [{category}] 묶음 요약 실패 (제외): {e}')
+            sys.stdout.flush()
+            if not mini_summaries:
+                raise RuntimeError('모든 묶음 요약 실패')
+            articles_text = "\n\n".join(mini_summaries)
+            source_label = f"카테고리별 요약 (전체 {len(articles)}개 기사)"
         
-        articles_text = "\n\n".join(article_summaries)
+        trend_text = ""
+        if rising_trends:
+            trend_text = f"""
+
+이번 주 언급이 급증한 게임/회사 (최근 30일 대비):
+{format_trend_signals(rising_trends)}
+오늘 기사와 관련이 있으면 단발성 뉴스가 아닌 주간 흐름으로 언급하세요."""
         
         prompt = f"""당신은 게임 산업 분석가입니다. 오늘 수집된 뉴스 기사들을 분석하여 **구체적인 사례 기반의 산업 트렌드**를 파악해주세요.
 
-수집된 기사들:
-{articles_text}
+{source_label}:
+{articles_text}{trend_text}
 
 분석 요구사항:
 1. **반드시 구체적인 게임명, 회사명, 사례를 언급**하면서 트렌드 설명
@@ -112,7 +452,7 @@ def generate_daily_summary(articles):
 • [구체적 사례 기반 트렌드 3]
 • [구체적 사례 기반 트렌드 4]"""
 
-        response = anthropic_client.messages.create(
+        response = summary_client.messages.create(
             model="claude-sonnet-4-20250514",
             max_tokens=800,
             messages=[{"role": "user", "content": prompt}]
@@ -125,11 +465,11 @@ def generate_daily_summary(articles):
         print(f"[ERROR] AI Summary 생성 실패: {e}")
         return "• 오늘의 게임 산업 트렌드를 분석 중입니다.\n• 주요 이슈를 정리하고 있습니다.\n• 업데이트 소식을 확인 중입니다.\n• 산업 동향을 모니터링하고 있습니다."
 
-def quick_filter(title, content):
+def quick_filter(title, content, media='', url=''):
     """1단계: 원문으로 게임 관련성 & 중요도만 빠르게 평가 (저렴한 토큰)"""
     try:
-        # 본문 처음 500자만 사용 (토큰 절약)
-        content_preview = content[:500]
+        # 본문 앞부분만 사용 (토큰 절약, 언어와 무관하게 같은 토큰 수)
+        content_preview = trim_to_tokens(content, QUICK_FILTER_PREVIEW_TOKENS)
         
         prompt = f"""Evaluate this gaming article quickly (DO NOT translate):
 
@@ -148,52 +488,44 @@ Evaluate:
    - High (0.4-0.7): New releases, major updates, IP expansions
    - Very High (0.7-1.0): Industry reports, regulations, business strategy changes
 
-Return ONLY JSON:
-{{
-  "game_relevance": 0.0,
-  "importance": 0.0,
-  "should_process": true/false
-}}
-
+Report the result with the report_filter_scores tool.
 Set should_process to true ONLY if game_relevance >= 0.5 AND importance >= 0.4"""
 
-        message = anthropic_client.messages.create(
+        result = request_structured(
+            filter_client,
+            'quick_filter',
             model="claude-sonnet-4-20250514",  # 더 저렴한 모델 사용
-            max_tokens=150,  # 짧은 응답만 필요
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
+            max_tokens=200,  # 짧은 응답만 필요
+            prompt=prompt,
+            tool=QUICK_FILTER_TOOL
         )
-        
-        # 응답 파싱
-        response_text = message.content[0].text
-        
-        # JSON 파싱
-        import json
-        if '```json' in response_text:
-            json_start = response_text.find('```json') + 7
-            json_end = response_text.find('```', json_start)
-            response_text = response_text[json_start:json_end].strip()
-        elif '```' in response_text:
-            json_start = response_text.find('```') + 3
-            json_end = response_text.find('```', json_start)
-            response_text = response_text[json_start:json_end].strip()
-        
-        result = json.loads(response_text)
+        record_label(title, content_preview, result['game_relevance'], result['importance'], media, url)
         return (
-            result.get('game_relevance', 0.0),
-            result.get('importance', 0.0),
-            result.get('should_process', False)
+            result['game_relevance'],
+            result['importance'],
+            result['should_process']
         )
         
+    except StructuredOutputError:
+        raise  # 형식 오류 응답은 통과시키지 않음 (호출 측에서 점수 없이 제외, 파싱 통계에 최종 실패로 집계됨)
     except Exception as e:
         print(f'   [WARN] 빠른 필터링 실패: {e}')
-        return 1.0, 0.5, True  # 실패시 처리 진행
+        return 1.0, 0.5, True  # API 오류시 처리 진행
 
-def translate_and_summarize(title, content, category_hint=''):
-    """2단계: 필터 통과한 기사만 번역 + 요약 (비싼 토큰)"""
-    try:
-        prompt = f"""다음 게임 뉴스 기사를 분석하고 한국어로 번역 및 요약해주세요.
+def build_translation_prompt(title, content):
+    """2단계 번역 & 요약 프롬프트 (용어집/학습된 고유명사 표기 지정, 비슷한 이전 제목 번역 참고)"""
+    glossary = glossary_for([title, content], entity_glossary())
+    glossary_text = f"""
+
+용어집 (아래 표기를 반드시 그대로 사용):
+{format_glossary(glossary)}""" if glossary else ""
+    similar = find_similar(title)
+    reference_text = f"""
+
+비슷한 이전 기사 제목 번역 (표기와 어조 참고, 내용은 이번 기사 기준):
+- {similar['source_title']} → {similar['title_kr']}""" if similar else ""
+
+    return f"""다음 게임 뉴스 기사를 분석하고 한국어로 번역 및 요약해주세요.{glossary_text}{reference_text}
 
 제목: {title}
 
@@ -213,245 +545,504 @@ def translate_and_summarize(title, content, category_hint=''):
    - "IP & 콜라보": 게임 IP 관련 뉴스, 협업, 미디어 확장(영화, 시리즈 등)
    - "커뮤니티 & 이벤트": 게임 이벤트, 팬 행사, 프로모션
 
-응답 형식 (JSON):
-{{
-  "title_kr": "번역된 제목",
-  "content_summary_kr": "명사형 종결어미로 작성된 요약",
-  "category": "카테고리명"
-}}"""
+report_translation 도구로 응답:
+- title_kr: 번역된 제목
+- content_summary_kr: 명사형 종결어미로 작성된 요약
+- category: 위 카테고리명 중 하나"""
 
-        message = anthropic_client.messages.create(
-            model="claude-sonnet-4-5-20250929",
+def translate_and_summarize(title, content, category_hint='', client=None):
+    """2단계: 필터 통과한 기사만 번역 + 요약 (비싼 토큰)"""
+    try:
+        result = request_structured(
+            client or translate_client,
+            'translate',
+            model=TRANSLATION_MODEL,
             max_tokens=1024,
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
-        
-        # 응답 파싱
-        response_text = message.content[0].text
-        
-        # JSON 파싱
-        import json
-        if '```json' in response_text:
-            json_start = response_text.find('```json') + 7
-            json_end = response_text.find('```', json_start)
-            response_text = response_text[json_start:json_end].strip()
-        elif '```' in response_text:
-            json_start = response_text.find('```') + 3
-            json_end = response_text.find('```', json_start)
-            response_text = response_text[json_start:json_end].strip()
-        
-        result = json.loads(response_text)
-        return (
-            result.get('title_kr', title),
-            result.get('content_summary_kr', content[:200]),
-            result.get('category', '기타')
+            prompt=build_translation_prompt(title, content),
+            tool=TRANSLATION_TOOL
         )
+        return result['title_kr'], result['content_summary_kr'], result['category']
         
     except Exception as e:
         print(f'   [WARN] 번역/요약 실패: {e}')
         return title, content[:200], '기타'  # 실패시 기본값 반환
 
-def crawl_gamespot(driver, now_kst):
-    """GameSpot 크롤링"""
-    print('>> [GameSpot] 크롤링 중...')
-    articles = []
-    
-    for page_num in range(1, MAX_PAGE + 1):
-        url = 'https://www.gamespot.com/news/' if page_num == 1 else f'https://www.gamespot.com/news/?page={page_num}'
-        
-        try:
-            driver.get(url)
-            time.sleep(2)
-        except Exception as e:
-            print(f'   GameSpot 페이지 {page_num} 로드 실패: {e}')
+def start_speculative_translation(executor, article):
+    """통과가 거의 확실한 기사의 2단계 번역을 1단계와 동시에 시작 → (기사, 2단계 입력 본문, Future) 또는 None
+
+    입력은 2단계와 같게 토큰 예산을 적용한 본문을 쓰고, 중국어(묶음 번역)와 번역 메모리 적중 기사는 제외.
+    """
+    body = select_informative_text(article['body'])
+    if detect_language(body) == 'zh' or has_exact(article['title'], body):
+        return None
+    record_speculation('speculated')
+    return article, body, executor.submit(translate_and_summarize, article['title'], body, '', speculate_client)
+
+def discard_speculation(speculative, keep_urls, wait=False):
+    """keep_urls에 없는 투기 번역 정리 (시작 전이면 취소, 끝났으면 버린 토큰 집계, wait이면 진행 중인 것도 기다림)"""
+    for url in [u for u in speculative if u not in keep_urls]:
+        article, body, future = speculative[url]
+        if future.cancel():
+            record_speculation('cancelled')
+        elif wait or future.done():
+            title_kr, content_summary_kr, _ = future.result()
+            tokens = stage2_cost({'title': article['title'], 'body': body}) + estimate_tokens(title_kr + content_summary_kr)
+            record_speculation('wasted', tokens)
+        else:
             continue
-        
+        del speculative[url]
+
+def build_chinese_chunks(articles, max_tokens=ZH_CHUNK_TOKENS, max_articles=ZH_CHUNK_MAX_ARTICLES):
+    """중국어 기사를 본문 토큰 합이 max_tokens 이하가 되도록 순서대로 묶음"""
+    chunks = []
+    current = []
+    current_tokens = 0
+    for article in articles:
+        tokens = estimate_tokens(article['title']) + estimate_tokens(article['body'])
+        if current and (current_tokens + tokens > max_tokens or len(current) >= max_articles):
+            chunks.append(current)
+            current = []
+            current_tokens = 0
+        current.append(article)
+        current_tokens += tokens
+    if current:
+        chunks.append(current)
+    return chunks
+
+def build_chinese_chunk_prompt(articles, glossary):
+    """중국어 기사 묶음 번역 프롬프트 (용어집은 묶음 전체에 한 번만)"""
+    article_blocks = []
+    for i, article in enumerate(articles, 1):
+        article_blocks.append(f"""[기사 {i}]
+제목: {article['title']}
+본문:
+{article['body']}""")
+    glossary_text = f"""
+
+용어집 (아래 표기를 반드시 그대로 사용):
+{format_glossary(glossary)}""" if glossary else ""
+
+    return f"""다음은 중국 게임 매체의 기사 {len(articles)}개입니다. 각 기사를 한국어로 번역 및 요약해주세요.{glossary_text}
+
+{chr(10).join(article_blocks)}
+
+요구사항:
+1. 제목은 한국어로 자연스럽게 번역 (《》 안의 게임명은 용어집 또는 공식 영문/한국어 명칭으로)
+2. 본문은 핵심 내용을 두괄식으로 2-3문장으로 요약하되, **종결어미를 명사형으로 작성** (예: ~함, ~발표, ~공개)
+3. 회사명, 게임명, 인물명은 용어집 표기를 우선하고, 없으면 공식 영문 명칭 사용 (중국어 인명은 한자 독음 대신 원문 병음 또는 한자 유지)
+4. 번역체가 아닌 자연스러운 한국어 사용
+5. 카테고리 분류: "규제 & 이슈", "게임 출시 & 발표", "매출 & 성과", "업데이트 & 패치", "IP & 콜라보", "커뮤니티 & 이벤트" 중 하나
+   (판호/규제/소송은 규제 & 이슈, 流水·매출·실적·해외 진출 성과는 매출 & 성과)
+
+report_translations 도구로 모든 기사를 빠짐없이 응답:
+- index: 기사 번호 (1부터)
+- title_kr, content_summary_kr, category"""
+
+def translate_chinese_chunk(articles):
+    """중국어 기사 묶음을 한 번에 번역, 결과를 받지 못한 기사 목록 반환"""
+    glossary = glossary_for([a['title'] + '\n' + a['body'] for a in articles], entity_glossary())
+    try:
+        result = request_structured(
+            translate_client,
+            'translate_zh',
+            model=TRANSLATION_MODEL,
+            max_tokens=ZH_OUTPUT_TOKENS_PER_ARTICLE * len(articles) + 200,
+            prompt=build_chinese_chunk_prompt(articles, glossary),
+            tool=TRANSLATION_CHUNK_TOOL,
+            validate_schema=TRANSLATION_CHUNK_ENVELOPE
+        )
+    except Exception as e:
+        print(f'   [WARN] 중국어 묶음 번역 실패: {e}')
+        return articles
+
+    # 항목별 검증: 올바른 항목은 채택하고, 빠지거나 잘못된 기사만 기사별 번역으로 넘김
+    done = set()
+    for i, item in enumerate(result['translations']):
         try:
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, '.card-item'))
-            )
-        except:
+            validate(item, TRANSLATION_CHUNK_ITEM_SCHEMA, f'$.translations[{i}]')
+        except StructuredOutputError as e:
+            print(f'   [WARN] 중국어 묶음 항목 형식 오류: {e}')
             continue
-        
-        # 기사 목록 추출
-        cards = driver.find_elements(By.CSS_SELECTOR, '.card-item')
-        
-        for card in cards:
-            try:
-                title_elem = card.find_element(By.CSS_SELECTOR, 'h4.card-item__title')
-                link_elem = card.find_element(By.CSS_SELECTOR, 'a.card-item__link')
-                time_elem = card.find_element(By.CSS_SELECTOR, 'div.symbol-text')
-                
-                title = title_elem.text.strip()
-                url = link_elem.get_attribute('href')
-                date_text = time_elem.get_attribute('title').replace('Updated on: ', '').strip()
-                
-                # 댓글 수
-                try:
-                    comment_spans = card.find_elements(By.CSS_SELECTOR, 'span.text-small')
-                    comments = int(re.sub(r'\D', '', comment_spans[1].text)) if len(comment_spans) > 1 else 0
-                except:
-                    comments = 0
-                
-                # 날짜 파싱 (PST -> KST)
+        idx = item['index'] - 1
+        if 0 <= idx < len(articles) and idx not in done:
+            articles[idx]['title_kr'] = item['title_kr']
+            articles[idx]['content_summary_kr'] = item['content_summary_kr']
+            articles[idx]['category'] = item['category']
+            done.add(idx)
+    return [a for i, a in enumerate(articles) if i not in done]
+
+def translate_chinese_articles(articles):
+    """2단계 (중국어): 토큰 길이 기준 묶음 번역, 누락된 기사는 반환해 기사별 번역으로 처리"""
+    chunks = build_chinese_chunks(articles)
+    print(f'   🀄 중국어 기사 {len(articles)}개 → {len(chunks)}개 묶음 번역')
+    sys.stdout.flush()
+
+    def translate_chunk(chunk):
+        return chunk if past_llm_deadline() else translate_chinese_chunk(chunk)
+
+    missing = []
+    with ThreadPoolExecutor(max_workers=LLM_MAX_CONCURRENCY) as executor:
+        for i, (chunk, failed) in enumerate(zip(chunks, executor.map(translate_chunk, chunks)), 1):
+            print(f'   [묶음 {i}/{len(chunks)}] {len(chunk) - len(failed)}/{len(chunk)}개 번역 완료')
+            sys.stdout.flush()
+            missing.extend(failed)
+    return missing
+
+def translate_articles_batch(articles):
+    """2단계 (batch 모드): 전체 기사를 Message Batch 하나로 제출 → 폴링 → 결과 병합
+
+    배치에서 실패/만료된 기사와 대기 시간 초과 시 남은 기사는 동기 호출로 처리함.
+    """
+    batch_requests = [
+        {
+            'custom_id': f'article-{i}',
+            'params': {
+                'model': TRANSLATION_MODEL,
+                'max_tokens': 1024,
+                'tools': [TRANSLATION_TOOL],
+                'tool_choice': {'type': 'tool', 'name': TRANSLATION_TOOL['name']},
+                'messages': [{'role': 'user', 'content': build_translation_prompt(a['title'], a['body'])}]
+            }
+        }
+        for i, a in enumerate(articles)
+    ]
+
+    translated = set()
+    try:
+        batch = anthropic_client.messages.batches.create(requests=batch_requests)
+        print(f'   📦 배치 제출: {batch.id} ({len(batch_requests)}개 요청)')
+        sys.stdout.flush()
+
+        deadline = min(time.time() + BATCH_MAX_WAIT, llm_deadline())
+        while batch.processing_status != 'ended':
+            if time.time() > deadline:
+                print(f'   ⏱️ 배치 대기 시간 초과 (최대 {BATCH_MAX_WAIT}초 또는 실행 마감) - 배치 취소 후 동기 호출로 처리')
+                anthropic_client.messages.batches.cancel(batch.id)
+                break
+            time.sleep(BATCH_POLL_INTERVAL)
+            batch = anthropic_client.messages.batches.retrieve(batch.id)
+            counts = batch.request_counts
+            done_count = counts.succeeded + counts.errored + counts.canceled + counts.expired
+            print(f'   배치 진행: {done_count}/{len(batch_requests)} (성공 {counts.succeeded}, 오류 {counts.errored}, 처리 중 {counts.processing})')
+            sys.stdout.flush()
+
+        if batch.processing_status == 'ended':
+            for entry in anthropic_client.messages.batches.results(batch.id):
+                idx = int(entry.custom_id.split('-')[1])
+                if entry.result.type != 'succeeded':
+                    print(f'   [WARN] 배치 요청 실패 ({entry.custom_id}): {entry.result.type}')
+                    continue
+                article = articles[idx]
                 try:
-                    pst = pytz.timezone('America/Los_Angeles')
-                    # "Dec" 같은 축약형 월 이름 처리
-                    article_time_pst = datetime.strptime(date_text, '%A, %b %d, %Y %I:%M%p')
-                    article_time_pst = pst.localize(article_time_pst)
-                    article_time_kst = article_time_pst.astimezone(KST)
-                    
-                    if not is_within_24_hours(article_time_kst, now_kst):
-                        continue
-                    
-                    # 본문 크롤링
-                    driver.execute_script("window.open('');")
-                    driver.switch_to.window(driver.window_handles[-1])
-                    
-                    body_text = ''
-                    thumbnail = ''
-                    try:
-                        driver.get(url)
-                        time.sleep(1)
-                        
-                        WebDriverWait(driver, 5).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, '.article-body'))
-                        )
-                        paragraphs = driver.find_elements(By.CSS_SELECTOR, '.article-body p')
-                        body_text = '\n'.join([p.text.strip() for p in paragraphs if p.text.strip()])
-                        
-                        # 썸네일
-                        og_image = driver.find_element(By.CSS_SELECTOR, 'meta[property="og:image"]')
-                        thumbnail = og_image.get_attribute('content')
-                    except Exception as e:
-                        print(f'   GameSpot 상세 페이지 로드 실패: {url[:50]}...')
-                    
-                    driver.close()
-                    driver.switch_to.window(driver.window_handles[0])
-                    
-                    articles.append({
-                        'title': title,
-                        'url': url,
-                        'date': article_time_kst.strftime('%Y-%m-%d %H:%M'),
-                        'comments': comments,
-                        'thumbnail': thumbnail,
-                        'body': body_text[:1000],
-                        'media': 'GameSpot'
-                    })
-                    
-                except Exception as e:
+                    result = parse_message(entry.result.message, TRANSLATION_TOOL['name'], TRANSLATION_TOOL['input_schema'])
+                    record_external_result('translate', entry.result.message)
+                except StructuredOutputError as e:
+                    record_external_result('translate', entry.result.message, e)
+                    print(f'   [WARN] 배치 응답 형식 오류 ({entry.custom_id}): {e}')
                     continue
-                    
-            except Exception as e:
-                continue
-    
-    return articles
+                article['title_kr'] = result['title_kr']
+                article['content_summary_kr'] = result['content_summary_kr']
+                article['category'] = result['category']
+                translated.add(idx)
+    except Exception as e:
+        print(f'   ❌ 배치 처리 실패: {e} - 동기 호출로 처리')
 
-def crawl_gamelook(driver, now_kst):
-    """Gamelook 크롤링"""
-    print('>> [Gamelook] 크롤링 중...')
-    articles = []
-    
-    for page_num in range(1, MAX_PAGE + 1):
-        url = 'http://www.gamelook.com.cn/' if page_num == 1 else f'http://www.gamelook.com.cn/page/{page_num}/'
-        
+    print(f'   ✅ 배치 결과 병합: {len(translated)}/{len(articles)}개')
+    sys.stdout.flush()
+
+    # 실패분은 동기 호출로 재처리
+    for idx, article in enumerate(articles):
+        if idx in translated:
+            continue
+        if past_llm_deadline():
+            print(f'   ⏱️ 실행 마감 임박 - 재처리 생략: {article["title"][:50]}...')
+            title_kr, content_summary_kr, category = article['title'], article['body'][:200], '기타'
+        else:
+            print(f'   [재처리] {article["media"]} - {article["title"][:50]}...')
+            title_kr, content_summary_kr, category = translate_and_summarize(article['title'], article['body'])
+        article['title_kr'] = title_kr
+        article['content_summary_kr'] = content_summary_kr
+        article['category'] = category
+
+def get_listing_url(source, page_num):
+    """어댑터 정의에 따른 목록 페이지 URL"""
+    if page_num == 1:
+        return source['listing_url']
+    return source['page_url'].format(page=page_num)
+
+def parse_source_date(source, date_text):
+    """어댑터의 날짜 형식/시간대 기준으로 기사 시각을 KST로 변환"""
+    source_tz = pytz.timezone(source['timezone'])
+    article_time = source_tz.localize(datetime.strptime(date_text, source['date_format']))
+    return article_time.astimezone(KST)
+
+def parse_source_card(card, source):
+    """목록 카드에서 제목, URL, 날짜, 댓글 수, 썸네일 추출"""
+    title_elem = card.find_element(By.CSS_SELECTOR, source['title_selector'])
+    link_elem = card.find_element(By.CSS_SELECTOR, source['link_selector']) if source.get('link_selector') else title_elem
+    date_elem = card.find_element(By.CSS_SELECTOR, source['date_selector'])
+
+    date_attribute = source.get('date_attribute')
+    date_text = date_elem.get_attribute(date_attribute) if date_attribute else date_elem.text
+    for prefix in source.get('date_strip', []):
+        date_text = date_text.replace(prefix, '')
+
+    # 댓글 수
+    comments = 0
+    if source.get('comments_selector'):
+        try:
+            comment_elems = card.find_elements(By.CSS_SELECTOR, source['comments_selector'])
+            index = source.get('comments_index', 0)
+            comments = int(re.sub(r'\D', '', comment_elems[index].text)) if len(comment_elems) > index else 0
+        except:
+            comments = 0
+
+    # 썸네일 (목록에 있는 경우)
+    thumbnail = ''
+    if source.get('card_thumbnail_selector'):
+        try:
+            img_elem = card.find_element(By.CSS_SELECTOR, source['card_thumbnail_selector'])
+            for attribute in source.get('card_thumbnail_attributes', ['src']):
+                thumbnail = img_elem.get_attribute(attribute)
+                if thumbnail:
+                    break
+        except:
+            pass
+
+    return {
+        'title': title_elem.text.strip(),
+        'url': link_elem.get_attribute('href'),
+        'time_kst': parse_source_date(source, date_text.strip()),
+        'comments': comments,
+        'thumbnail': thumbnail or ''
+    }
+
+def fetch_source_detail(driver, source, url, breaker=None):
+    """새 창에서 상세 페이지를 열어 본문과 og:image 추출 (타임아웃은 차단기에 기록)
+
+    page_source를 한 번만 받아 크롤러 스레드에서 바로 파싱 (문단마다 WebDriver 왕복하지 않음).
+    """
+    body_text = ''
+    thumbnail = ''
+    driver.execute_script("window.open('');")
+    driver.switch_to.window(driver.window_handles[-1])
+    try:
+        driver.get(url)
+        time.sleep(1)
+
+        WebDriverWait(driver, 5).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, source['detail_wait_selector']))
+        )
+        parsed = parse_html(driver.page_source, source['detail_body_selector'])
+        body_text = parsed['body']
+        if source.get('detail_thumbnail'):
+            thumbnail = parsed['thumbnail']
+        record_crawl_success(breaker)
+    except TimeoutException:
+        print(f'   {source["name"]} 상세 페이지 타임아웃: {url[:50]}...')
+        record_crawl_timeout(breaker)
+    except Exception as e:
+        print(f'   {source["name"]} 상세 페이지 로드 실패: {url[:50]}...')
+    finally:
+        try:
+            if len(driver.window_handles) > 1:
+                driver.close()
+                driver.switch_to.window(driver.window_handles[0])
+        except:
+            pass
+    return body_text, thumbnail
+
+def crawl_source(driver, source, now_kst, deadline=None, articles=None, breaker=None, progress=None):
+    """어댑터 정의(dict) 기반 공통 크롤러: 목록 페이지 순회 → 카드 파싱 → 수집 윈도우 필터 → 상세 페이지
+
+    articles: 수집 결과를 바로 추가할 리스트 (중간에 예외/시간 초과가 나도 호출 측에 부분 결과가 남음)
+    progress: 시도 간 공유하는 진행 상황 {'status': {URL: 'collected'}} (재시도 시 수집한 상세 페이지는 다시 열지 않음)
+    """
+    name = source['name']
+    print(f'>> [{name}] 크롤링 중...')
+    articles = [] if articles is None else articles
+    status = ({} if progress is None else progress).setdefault('status', {})
+    max_articles = source.get('max_articles')
+    resolution = timedelta(days=1) if source.get('date_resolution') == 'day' else None
+
+    for page_num in range(1, source.get('max_pages', MAX_PAGE) + 1):
+        if should_stop_crawl(breaker, deadline):
+            print(f'   {name} 시간 예산 초과/차단 - 수집된 {len(articles)}개로 중단')
+            break
+
+        url = get_listing_url(source, page_num)
         try:
             driver.get(url)
             time.sleep(2)
+        except TimeoutException:
+            print(f'   {name} 페이지 {page_num} 로드 타임아웃')
+            record_crawl_timeout(breaker)
+            continue
         except Exception as e:
-            print(f'   Gamelook 페이지 {page_num} 로드 실패: {e}')
+            print(f'   {name} 페이지 {page_num} 로드 실패: {e}')
             continue
-        
+
         try:
             WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'li.item'))
+                EC.presence_of_element_located((By.CSS_SELECTOR, source['card_selector']))
             )
         except:
             continue
-        
-        # 기사 목록 추출
-        items = driver.find_elements(By.CSS_SELECTOR, 'li.item')
-        
-        for item in items:
+
+        # 기사 목록 추출 (상세 페이지 사이에 드라이버가 재시작될 수 있으므로 카드는 먼저 dict로 파싱)
+        cards = []
+        for card in driver.find_elements(By.CSS_SELECTOR, source['card_selector']):
             try:
-                # 제목과 링크
-                title_elem = item.find_element(By.CSS_SELECTOR, 'h2.item-title a')
-                title = title_elem.text.strip()
-                url = title_elem.get_attribute('href')
-                
-                # 썸네일
-                thumbnail = ''
-                try:
-                    img_elem = item.find_element(By.CSS_SELECTOR, '.item-img img')
-                    thumbnail = img_elem.get_attribute('data-original') or img_elem.get_attribute('src')
-                except:
-                    pass
-                
-                # 날짜
-                try:
-                    date_elem = item.find_element(By.CSS_SELECTOR, '.item-meta .date')
-                    date_text = date_elem.text.strip()  # "2025-12-05"
-                    
-                    # KST로 파싱 (중국 시간 = UTC+8, KST = UTC+9, 1시간 차이)
-                    china_tz = pytz.timezone('Asia/Shanghai')
-                    article_time_china = datetime.strptime(date_text, '%Y-%m-%d')
-                    article_time_china = china_tz.localize(article_time_china)
-                    article_time_kst = article_time_china.astimezone(KST)
-                    
-                    if not is_within_24_hours(article_time_kst, now_kst):
-                        continue
-                    
-                except:
-                    continue
-                
-                # 본문 크롤링
-                driver.execute_script("window.open('');")
-                driver.switch_to.window(driver.window_handles[-1])
-                
-                body_text = ''
-                try:
-                    driver.get(url)
-                    time.sleep(1)
-                    
-                    WebDriverWait(driver, 5).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, 'article'))
-                    )
-                    paragraphs = driver.find_elements(By.CSS_SELECTOR, 'article p')
-                    body_text = '\n'.join([p.text.strip() for p in paragraphs if p.text.strip()])
-                except Exception as e:
-                    print(f'   Gamelook 상세 페이지 로드 실패: {url[:50]}...')
-                
-                driver.close()
-                driver.switch_to.window(driver.window_handles[0])
-                
-                articles.append({
-                    'title': title,
-                    'url': url,
-                    'date': article_time_kst.strftime('%Y-%m-%d %H:%M'),
-                    'comments': 0,  # Gamelook은 댓글 수 없음
-                    'thumbnail': thumbnail,
-                    'body': body_text[:1000],
-                    'media': 'Gamelook'
-                })
-                
+                cards.append(parse_source_card(card, source))
             except Exception as e:
+                continue
+        passed_cutoff = False
+
+        for card_data in cards:
+            if should_stop_crawl(breaker, deadline):
+                break
+            if max_articles and len(articles) >= max_articles:
+                break
+
+            if not is_within_window(card_data['time_kst'], now_kst, resolution):
+                passed_cutoff = True
+                continue
+            if status.get(card_data['url']) == 'collected':
+                continue
+
+            # 본문 크롤링
+            checkpoint(driver)
+            body_text, detail_thumbnail = fetch_source_detail(driver, source, card_data['url'], breaker)
+
+            articles.append({
+                'title': card_data['title'],
+                'url': card_data['url'],
+                'date': card_data['time_kst'].strftime('%Y-%m-%d %H:%M'),
+                'comments': card_data['comments'],
+                'thumbnail': card_data['thumbnail'] or detail_thumbnail,
+                'body': body_text[:RAW_BODY_MAX_CHARS],
+                'media': name
+            })
+            status[card_data['url']] = 'collected'
+
+        # 목록은 최신순이므로 기준 시각을 지난 카드가 나오면 다음 페이지는 볼 필요 없음
+        if passed_cutoff:
+            print(f'   {name} 수집 기준 시각 통과 - 페이지 {page_num}에서 순회 중단')
+            break
+
+    return articles
+
+def normalize_article_url(url):
+    """URL 비교용 정규화 (스킴, 쿼리, 끝 슬래시 제거)"""
+    if not url:
+        return ''
+    url = url.split('#')[0].split('?')[0].rstrip('/')
+    return re.sub(r'^https?://(www\.)?', '', url)
+
+def parse_ign_feed_times(feed_xml):
+    """IGN RSS 피드에서 {정규화 URL: 발행 시각(KST)} 추출"""
+    times = {}
+    root = ET.fromstring(feed_xml)
+    for item in root.iter('item'):
+        link = (item.findtext('link') or '').strip()
+        pub_date = (item.findtext('pubDate') or '').strip()
+        if not link or not pub_date:
+            continue
+        try:
+            times[normalize_article_url(link)] = date_parser.parse(pub_date).astimezone(KST)
+        except Exception:
+            continue
+    return times
+
+def extract_ign_state_times(page_source):
+    """IGN 목록 페이지에 포함된 __NEXT_DATA__ JSON에서 {정규화 URL: 발행 시각(KST)} 추출"""
+    times = {}
+    match = re.search(r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', page_source, re.S)
+    if not match:
+        return times
+    try:
+        state = json.loads(match.group(1))
+    except ValueError:
+        return times
+
+    # 기사 객체는 구조 깊숙이 흩어져 있으므로 url + 발행일 키를 가진 dict를 모두 탐색
+    stack = [state]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            url = node.get('url')
+            published = node.get('publishDate') or node.get('publishedAt') or node.get('publishedDate')
+            if isinstance(url, str) and isinstance(published, str):
+                if url.startswith('/'):
+                    url = 'https://www.ign.com' + url
                 try:
-                    if len(driver.window_handles) > 1:
-                        driver.close()
-                        driver.switch_to.window(driver.window_handles[0])
-                except:
+                    times[normalize_article_url(url)] = date_parser.parse(published).astimezone(KST)
+                except Exception:
                     pass
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return times
+
+def fetch_ign_listing_times(driver):
+    """RSS 피드 + 목록 페이지 JSON에서 IGN 기사 발행 시각 수집 (상세 페이지 접근 없음)"""
+    times = {}
+    try:
+        response = requests.get(
+            IGN_FEED_URL,
+            headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'},
+            timeout=10
+        )
+        response.raise_for_status()
+        times.update(parse_ign_feed_times(response.content))
+    except Exception as e:
+        print(f'   IGN RSS 피드 로드 실패: {str(e)[:50]}')
+
+    try:
+        times.update(extract_ign_state_times(driver.page_source))
+    except Exception as e:
+        print(f'   IGN 목록 JSON 파싱 실패: {str(e)[:50]}')
+
+    print(f'   IGN 목록 단계 발행 시각 {len(times)}개 확보')
+    sys.stdout.flush()
+    return times
+
+def get_ign_card_url(card):
+    """IGN 카드의 기사 URL"""
+    parent_link = card.find_element(By.XPATH, './ancestor::a[@class="item-body"]')
+    url = parent_link.get_attribute('href')
+    if url.startswith('/'):
+        url = 'https://www.ign.com' + url
+    return url
+
+def get_ign_card_time(card, url, listing_times):
+    """카드 마크업의 <time> 또는 목록 단계 발행 시각으로 카드 시각 확인 (없으면 None)
+
+    <time>이 없는 카드가 많으므로 no_implicit_wait 안에서 호출 (find_elements로 기다리지 않고 확인).
+    """
+    time_elems = card.find_elements(By.XPATH, './ancestor::a[@class="item-body"]//time[@datetime]')
+    if time_elems:
+        try:
+            return date_parser.parse(time_elems[0].get_attribute('datetime')).astimezone(KST)
+        except (ValueError, OverflowError):
+            pass
+    return listing_times.get(normalize_article_url(url))
+
+def is_ign_listing_past_window(driver, listing_times, now_kst):
+    """현재 로드된 카드 중 가장 오래된 카드가 수집 윈도우 밖인지 확인 (스크롤 조기 종료용)"""
+    oldest = None
+    with no_implicit_wait(driver):
+        for card in driver.find_elements(By.CSS_SELECTOR, '[data-cy="item-details"]'):
+            try:
+                card_time = get_ign_card_time(card, get_ign_card_url(card), listing_times)
+            except Exception:
                 continue
-    
-    return articles
+            if card_time and (oldest is None or card_time < oldest):
+                oldest = card_time
+    return oldest is not None and not is_within_window(oldest, now_kst)
 
-def crawl_ign(driver, now_kst):
-    """IGN 크롤링"""
-    print('>> [IGN] 크롤링 중...')
-    articles = []
-    
+def load_ign_cards(driver, now_kst, breaker=None):
+    """IGN 뉴스 목록 로드 → 스크롤 → 카드 정보 목록 [{'title', 'url', 'comments', 'listing_time'}]"""
     try:
         print('   IGN 메인 페이지 로딩...')
         sys.stdout.flush()
@@ -459,16 +1050,25 @@ def crawl_ign(driver, now_kst):
         time.sleep(3)
         print('   IGN 메인 페이지 로드 완료')
         sys.stdout.flush()
+    except TimeoutException as e:
+        record_crawl_timeout(breaker)
+        raise Exception(f'IGN 메인 페이지 로드 타임아웃: {str(e)[:50]}')
     except Exception as e:
         print(f'   IGN 페이지 로드 실패: {str(e)[:100]}')
         sys.stdout.flush()
         # 재시도를 위해 예외를 다시 던짐
         raise Exception(f'IGN 메인 페이지 로드 실패: {str(e)[:50]}')
     
+    # 목록 단계 발행 시각 확보 (fast path)
+    listing_times = fetch_ign_listing_times(driver) if IGN_LISTING_FAST_PATH else {}
+    
     # 스크롤해서 더 많은 기사 로드 (24시간 내 모든 기사 로드)
     try:
         print('   IGN 페이지 스크롤 중... (더 많은 기사 로드)')
         for i in range(5):  # 3 → 5로 증가
+            if IGN_LISTING_FAST_PATH and is_ign_listing_past_window(driver, listing_times, now_kst):
+                print('   가장 오래된 카드가 수집 윈도우 밖 - 스크롤 중단')
+                break
             driver.execute_script('window.scrollBy(0, document.body.scrollHeight)')
             time.sleep(1.5)
             print(f'   스크롤 {i+1}/5 완료')
@@ -489,33 +1089,17 @@ def crawl_ign(driver, now_kst):
         # 재시도를 위해 예외를 다시 던짐
         raise Exception(f'IGN 기사 카드 로드 실패: {str(e)[:50]}')
     
-    cards = driver.find_elements(By.CSS_SELECTOR, '[data-cy="item-details"]')
-    print(f'   IGN 총 {len(cards)}개 카드 발견')
-    sys.stdout.flush()
-    
-    # 최대 30개 처리 + 24시간 내 기사만 수집
-    processed_count = 0
-    max_articles = 30
-    
-    for idx, card in enumerate(cards, 1):
-        try:
-            # 최대 개수 체크를 try 블록 안으로 이동
-            if processed_count >= max_articles:
-                print(f'   최대 {max_articles}개 처리 완료 - 중단')
-                sys.stdout.flush()
-                break
-            
-            print(f'   IGN 기사 {idx}/{min(len(cards), max_articles)} 처리 중...')
-            title_elem = card.find_element(By.CSS_SELECTOR, '[data-cy="item-title"]')
-            title = title_elem.text.strip()
-            
-            # 링크
-            parent_link = card.find_element(By.XPATH, './ancestor::a[@class="item-body"]')
-            url = parent_link.get_attribute('href')
-            if url.startswith('/'):
-                url = 'https://www.ign.com' + url
-            
-            print(f'   제목: {title[:50]}...')
+    # 재시도 시 목록을 다시 열지 않도록 카드 정보를 값으로 추출해 둠 (WebElement는 페이지 이동 후 무효)
+    # 카드는 이미 로드된 상태라 선택 요소(<time>, 댓글 수)는 기다리지 않고 조회
+    card_infos = []
+    with no_implicit_wait(driver):
+        for card in driver.find_elements(By.CSS_SELECTOR, '[data-cy="item-details"]'):
+            try:
+                title = card.find_element(By.CSS_SELECTOR, '[data-cy="item-title"]').text.strip()
+                url = get_ign_card_url(card)
+            except Exception as e:
+                print(f'   IGN 카드 파싱 실패: {str(e)[:50]}')
+                continue
             
             # 댓글 수
             try:
@@ -524,120 +1108,316 @@ def crawl_ign(driver, now_kst):
             except:
                 comments = 0
             
-            # 상세 페이지에서 날짜 확인
-            print(f'   상세 페이지 열기: {url[:50]}...')
-            sys.stdout.flush()
-            driver.execute_script("window.open('');")
-            driver.switch_to.window(driver.window_handles[-1])
-            
-            # 상세 페이지 로드 타임아웃을 10초로 제한
-            driver.set_page_load_timeout(10)
-            
-            try:
-                driver.get(url)
-                time.sleep(1)
-                print(f'   상세 페이지 로드 완료')
-                sys.stdout.flush()
-            except Exception as e:
-                print(f'   IGN 상세 페이지 로드 실패 (10초 타임아웃): {str(e)[:50]}')
-                sys.stdout.flush()
-                driver.set_page_load_timeout(30)  # 원래대로 복구
-                try:
-                    driver.close()
-                    driver.switch_to.window(driver.window_handles[0])
-                except:
-                    pass
-                continue
-            finally:
-                driver.set_page_load_timeout(30)  # 원래대로 복구
-            
-            try:
-                print(f'   메타데이터 파싱 중...')
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.TAG_NAME, 'main'))
-                )
-                
-                # 날짜 파싱
-                published_meta = driver.find_element(By.CSS_SELECTOR, 'meta[property="article:published_time"]')
-                published_time = published_meta.get_attribute('content')
-                
-                article_time_kst = date_parser.parse(published_time).astimezone(KST)
-                print(f'   날짜: {article_time_kst.strftime("%Y-%m-%d %H:%M")}')
-                
-                if not is_within_24_hours(article_time_kst, now_kst):
-                    print(f'   24시간 이내 기사 아님 - 스킵')
-                    driver.close()
-                    driver.switch_to.window(driver.window_handles[0])
-                    continue
-                
-                # 본문
-                paragraphs = driver.find_elements(By.CSS_SELECTOR, 'main p')
-                body_text = '\n'.join([p.text.strip() for p in paragraphs if p.text.strip()])
-                print(f'   본문 길이: {len(body_text)}자')
-                
-                # 썸네일
-                thumbnail = ''
-                try:
-                    og_image = driver.find_element(By.CSS_SELECTOR, 'meta[property="og:image"]')
-                    thumbnail = og_image.get_attribute('content')
-                except:
-                    pass
-                
-                driver.close()
-                driver.switch_to.window(driver.window_handles[0])
-                
-                articles.append({
-                    'title': title,
-                    'url': url,
-                    'date': article_time_kst.strftime('%Y-%m-%d %H:%M'),
-                    'comments': comments,
-                    'thumbnail': thumbnail,
-                    'body': body_text[:1000],
-                    'media': 'IGN'
-                })
-                processed_count += 1  # 수집 성공 시 카운트 증가
-                print(f'   ✅ IGN 기사 {idx} 수집 완료! (총 {processed_count}개)')
-                
-            except Exception as e:
-                print(f'   ❌ IGN 기사 {idx} 처리 실패: {str(e)[:100]}')
-                sys.stdout.flush()
-                # 윈도우 정리
-                try:
-                    if len(driver.window_handles) > 1:
-                        driver.close()
-                        driver.switch_to.window(driver.window_handles[0])
-                except Exception as cleanup_error:
-                    print(f'   윈도우 정리 실패: {str(cleanup_error)[:50]}')
-                    sys.stdout.flush()
-                continue
-                
-        except Exception as e:
-            print(f'   ❌ IGN 기사 {idx} 외부 예외: {str(e)[:100]}')
-            sys.stdout.flush()
-            # 윈도우 정리
-            try:
-                if len(driver.window_handles) > 1:
-                    driver.close()
-                    driver.switch_to.window(driver.window_handles[0])
-            except:
-                pass
-            continue
+            card_infos.append({
+                'title': title,
+                'url': url,
+                'comments': comments,
+                'listing_time': get_ign_card_time(card, url, listing_times) if IGN_LISTING_FAST_PATH else None
+            })
+    
+    print(f'   IGN 총 {len(card_infos)}개 카드 발견')
+    sys.stdout.flush()
+    return card_infos
+
+def fetch_ign_article(driver, card_info, now_kst, breaker=None):
+    """IGN 상세 페이지 처리 → ('collected', 기사) / ('skipped', None) / ('failed', None)"""
+    url = card_info['url']
+    
+    # 상세 페이지에서 날짜 확인
+    print(f'   상세 페이지 열기: {url[:50]}...')
+    sys.stdout.flush()
+    driver.execute_script("window.open('');")
+    driver.switch_to.window(driver.window_handles[-1])
+    
+    # 상세 페이지 로드 타임아웃을 10초로 제한
+    driver.set_page_load_timeout(10)
     
-    # IGN 크롤링 완료 후 메인 윈도우로 확실히 복귀
+    try:
+        driver.get(url)
+        time.sleep(1)
+        print(f'   상세 페이지 로드 완료')
+        sys.stdout.flush()
+    except Exception as e:
+        print(f'   IGN 상세 페이지 로드 실패 (10초 타임아웃): {str(e)[:50]}')
+        sys.stdout.flush()
+        if isinstance(e, TimeoutException):
+            record_crawl_timeout(breaker)
+        close_extra_windows(driver)
+        return 'failed', None
+    finally:
+        driver.set_page_load_timeout(30)  # 원래대로 복구
+    
+    try:
+        print(f'   메타데이터 파싱 중...')
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.TAG_NAME, 'main'))
+        )
+        
+        # page_source 한 번으로 날짜/본문/썸네일 추출
+        parsed = parse_html(driver.page_source, IGN_BODY_SELECTOR)
+        if not parsed['published_time']:
+            raise ValueError('article:published_time 메타 태그 없음')
+        
+        # 날짜 파싱
+        article_time_kst = date_parser.parse(parsed['published_time']).astimezone(KST)
+        print(f'   날짜: {article_time_kst.strftime("%Y-%m-%d %H:%M")}')
+        
+        if not is_within_window(article_time_kst, now_kst):
+            print(f'   수집 윈도우 밖 기사 - 스킵')
+            return 'skipped', None
+        
+        # 본문
+        body_text = parsed['body']
+        print(f'   본문 길이: {len(body_text)}자')
+        
+        # 썸네일
+        thumbnail = parsed['thumbnail']
+        
+        record_crawl_success(breaker)
+        return 'collected', {
+            'title': card_info['title'],
+            'url': url,
+            'date': article_time_kst.strftime('%Y-%m-%d %H:%M'),
+            'comments': card_info['comments'],
+            'thumbnail': thumbnail,
+            'body': body_text[:RAW_BODY_MAX_CHARS],
+            'media': 'IGN'
+        }
+    except Exception as e:
+        print(f'   ❌ IGN 기사 처리 실패: {str(e)[:100]}')
+        sys.stdout.flush()
+        if isinstance(e, TimeoutException):
+            record_crawl_timeout(breaker)
+        return 'failed', None
+    finally:
+        close_extra_windows(driver)
+
+def close_extra_windows(driver):
+    """상세 페이지용으로 연 창을 닫고 메인 창으로 복귀"""
     try:
         if len(driver.window_handles) > 1:
             for handle in driver.window_handles[1:]:
                 driver.switch_to.window(handle)
                 driver.close()
             driver.switch_to.window(driver.window_handles[0])
-            print(f'   IGN 크롤링 완료 - 모든 추가 윈도우 닫음')
-            sys.stdout.flush()
     except Exception as e:
-        print(f'   윈도우 정리 중 오류: {str(e)[:50]}')
+        print(f'   윈도우 정리 실패: {str(e)[:50]}')
+        sys.stdout.flush()
+
+def crawl_ign(driver, now_kst, deadline=None, articles=None, breaker=None, progress=None):
+    """IGN 크롤링 (재시도하면 처리하지 않은 카드부터 이어서 진행)
+
+    articles: 수집 결과를 바로 추가할 리스트 (예외가 나도 수집분은 호출 측에 남음)
+    progress: 시도 간 공유하는 진행 상황 {'cards': 카드 정보 목록, 'status': {URL: 'collected'|'skipped'|'failed'},
+              'attempts': {URL: 시도 횟수}}. 카드 목록이 이미 있으면 목록 로드/스크롤을 생략함.
+    """
+    print('>> [IGN] 크롤링 중...')
+    articles = [] if articles is None else articles
+    progress = {} if progress is None else progress
+    status = progress.setdefault('status', {})
+    attempts = progress.setdefault('attempts', {})
+    
+    if progress.get('cards') is None:
+        progress['cards'] = load_ign_cards(driver, now_kst, breaker)
+    else:
+        remaining = sum(1 for c in progress['cards'] if status.get(c['url']) in (None, 'failed'))
+        print(f'   이전 시도 진행 상황으로 재개 - 남은 카드 {remaining}개 (수집 {len(articles)}개 유지)')
+        sys.stdout.flush()
+    cards = progress['cards']
+    
+    # 최대 30개 처리 + 24시간 내 기사만 수집
+    max_articles = 30
+    
+    for idx, card_info in enumerate(cards, 1):
+        url = card_info['url']
+        # 이미 끝난 카드, 두 번 실패한 카드는 건너뜀
+        if status.get(url) in ('collected', 'skipped') or attempts.get(url, 0) >= 2:
+            continue
+        if len(articles) >= max_articles:
+            print(f'   최대 {max_articles}개 처리 완료 - 중단')
+            sys.stdout.flush()
+            break
+        if should_stop_crawl(breaker, deadline):
+            print(f'   IGN 시간 예산 초과/차단 - 수집된 {len(articles)}개로 중단')
+            sys.stdout.flush()
+            break
+        
+        print(f'   IGN 기사 {idx}/{len(cards)} 처리 중...')
+        print(f'   제목: {card_info["title"][:50]}...')
+        
+        # 목록 단계에서 이미 수집 윈도우 밖으로 확인된 카드는 상세 페이지를 열지 않음
+        if card_info['listing_time'] and not is_within_window(card_info['listing_time'], now_kst):
+            print(f'   수집 윈도우 밖 기사 (목록 기준) - 스킵')
+            status[url] = 'skipped'
+            continue
+        
+        attempts[url] = attempts.get(url, 0) + 1
+        checkpoint(driver)  # 카드 정보는 dict로 보관 중이므로 여기서 재시작해도 안전
+        result, article = fetch_ign_article(driver, card_info, now_kst, breaker)
+        status[url] = result
+        if article:
+            articles.append(article)
+            print(f'   ✅ IGN 기사 {idx} 수집 완료! (총 {len(articles)}개)')
         sys.stdout.flush()
     
+    # IGN 크롤링 완료 후 메인 윈도우로 확실히 복귀
+    close_extra_windows(driver)
     return articles
 
+# 소스 어댑터 레지스트리
+# 새 사이트는 목록 URL, 카드/상세 셀렉터, 날짜 형식, 시간대를 dict로 선언하면
+# crawl_source()가 공통으로 처리함. 구조가 특수한 사이트는 'crawl'에 전용 함수를 지정.
+# card_link_pattern: 목록 HTML에서 기사 링크를 뽑는 정규식 (목록 변경 여부 판단용)
+SOURCES = [
+    {
+        'name': 'GameSpot',
+        'listing_url': 'https://www.gamespot.com/news/',
+        'page_url': 'https://www.gamespot.com/news/?page={page}',
+        'max_pages': MAX_PAGE,
+        'card_selector': '.card-item',
+        'title_selector': 'h4.card-item__title',
+        'link_selector': 'a.card-item__link',
+        'date_selector': 'div.symbol-text',
+        'date_attribute': 'title',
+        'date_strip': ['Updated on: '],
+        'date_format': '%A, %b %d, %Y %I:%M%p',  # "Dec" 같은 축약형 월 이름
+        'timezone': 'America/Los_Angeles',
+        'comments_selector': 'span.text-small',
+        'comments_index': 1,
+        'detail_wait_selector': '.article-body',
+        'detail_body_selector': '.article-body p',
+        'detail_thumbnail': True,
+        'card_link_pattern': r'href="(/articles/[^"]+/1100-\d+/?)"',
+    },
+    {
+        'name': 'IGN',
+        'listing_url': 'https://www.ign.com/news',
+        'card_link_pattern': r'href="(/articles/[^"?#]+)"',
+        'detail_body_selector': IGN_BODY_SELECTOR,
+        'crawl': crawl_ign,
+        'retries': 3,
+    },
+    {
+        'name': 'Gamelook',
+        'listing_url': 'http://www.gamelook.com.cn/',
+        'page_url': 'http://www.gamelook.com.cn/page/{page}/',
+        'max_pages': MAX_PAGE,
+        'card_selector': 'li.item',
+        'title_selector': 'h2.item-title a',
+        'date_selector': '.item-meta .date',
+        'date_format': '%Y-%m-%d',  # "2025-12-05" (일 단위)
+        'date_resolution': 'day',
+        'timezone': 'Asia/Shanghai',
+        'card_thumbnail_selector': '.item-img img',
+        'card_thumbnail_attributes': ['data-original', 'src'],
+        'detail_wait_selector': 'article',
+        'detail_body_selector': 'article p',
+        'card_link_pattern': r'href="(https?://www\.gamelook\.com\.cn/\d{4}/\d{2}/\d+/?)"',
+    },
+]
+
+def run_source(source, now_kst, debugging_port, deadline=None, collected=None, drivers=None):
+    """소스 하나를 전용 드라이버로 크롤링 (재시도 + 시간 예산 + 차단기)
+
+    collected: 수집 결과를 바로 추가할 리스트. 실패/시간 초과여도 그때까지 수집한 기사는 반환함.
+    drivers: 소스명 → 드라이버 (마감이 지나도 끝나지 않으면 호출 측이 드라이버를 강제 종료)
+    """
+    name = source['name']
+    source_deadline = time.time() + source.get('timeout', SOURCE_TIMEOUT)
+    deadline = min(source_deadline, deadline) if deadline else source_deadline
+    retries = source.get('retries', 1)
+    collected = [] if collected is None else collected
+    breaker = new_circuit_breaker(name)
+    progress = {}  # 시도 간 공유 (처리한 URL은 재시도에서 다시 열지 않음)
+
+    skip, listing_entry = check_source_listing(source)
+    if skip:
+        return collected
+
+    driver = WatchedDriver(lambda: setup_driver(debugging_port), name)
+    if drivers is not None:
+        drivers[name] = driver
+    try:
+        for retry in range(retries):
+            if should_stop_crawl(breaker, deadline):
+                break
+            try:
+                if retry > 0:
+                    print(f'>> [{name}] 재시도 {retry}/{retries-1}...')
+                    sys.stdout.flush()
+                    time.sleep(min(5, max(0, deadline - time.time())))  # 재시도 전 대기
+                    close_extra_windows(driver)  # 실패한 시도에서 열린 상세 페이지 창 정리
+                else:
+                    print(f'>> [{name}] 크롤링 시작...')
+                    sys.stdout.flush()
+
+                if source.get('crawl'):
+                    source['crawl'](driver, now_kst, deadline=deadline, articles=collected, breaker=breaker, progress=progress)
+                else:
+                    crawl_source(driver, source, now_kst, deadline, articles=collected, breaker=breaker, progress=progress)
+                # 중간에 끊기지 않고 끝난 소스만 목록 캐시 갱신 (끊긴 목록을 '변경 없음'으로 건너뛰지 않도록)
+                if listing_entry and not should_stop_crawl(breaker, deadline):
+                    PENDING_LISTINGS[name] = listing_entry
+                return unique_articles(collected)
+            except Exception as e:
+                print(f'   ❌ {name} 크롤링 실패 (시도 {retry+1}/{retries}): {str(e)[:100]}')
+                sys.stdout.flush()
+        if collected:
+            print(f'   ⚠️ {name} 크롤링 중단 - 부분 결과 {len(unique_articles(collected))}개 사용')
+        else:
+            print(f'   ⚠️ {name} 크롤링 최종 실패 - 다른 소스로 계속 진행')
+        return unique_articles(collected)
+    finally:
+        driver.quit()
+
+def crawl_all_sources(now_kst, sources=None, deadline=None):
+    """등록된 모든 소스를 소스별 드라이버로 동시에 크롤링
+
+    deadline: 크롤링 단계 마감 시각 (기본: 실행 시작 + CRAWL_DEADLINE_MINUTES). 마감까지 끝나지 않은
+    소스는 그때까지 수집한 부분 결과만 사용하고, 멈춘 호출에서 돌아오지 않는 소스는 드라이버를 강제 종료해
+    워커 스레드가 실행 끝까지 프로세스를 붙잡지 않게 함.
+    """
+    sources = sources or SOURCES
+    deadline = deadline or RUN_STARTED_AT + CRAWL_DEADLINE_MINUTES * 60
+    workers = max(1, min(CRAWL_WORKERS, len(sources)))
+    print(f'>> {len(sources)}개 소스 동시 크롤링 (워커 {workers}개, 마감 {datetime.fromtimestamp(deadline, KST).strftime("%H:%M:%S")})')
+    sys.stdout.flush()
+
+    # 워커 수보다 소스가 많으면 대기열이 생기므로 전체 대기 시간은 라운드 수만큼 늘림
+    rounds = -(-len(sources) // workers)
+    overall_timeout = max(s.get('timeout', SOURCE_TIMEOUT) for s in sources) * rounds + 60
+    overall_timeout = min(overall_timeout, max(0, deadline - time.time()) + 30)  # 마감 후 정리 여유 30초
+
+    partial = {source['name']: [] for source in sources}
+    drivers = {}  # 소스명 → 드라이버 (마감 후에도 끝나지 않은 소스 강제 종료용)
+    executor = ThreadPoolExecutor(max_workers=workers)
+    futures = [
+        executor.submit(run_source, source, now_kst, 9222 + idx, deadline, partial[source['name']], drivers)
+        for idx, source in enumerate(sources)
+    ]
+    wait(futures, timeout=overall_timeout)
+
+    all_articles = []
+    for source, future in zip(sources, futures):
+        if not future.done():
+            articles = unique_articles(list(partial[source['name']]))
+            all_articles.extend(articles)
+            print(f'   ⏱️ {source["name"]} 시간 초과 - 부분 결과 {len(articles)}개로 진행')
+            if source['name'] in drivers:
+                drivers[source['name']].kill()  # 멈춘 driver.get 등이 연결 오류로 반환되어 워커 종료
+            continue
+        try:
+            articles = future.result()
+            all_articles.extend(articles)
+            print(f'   {source["name"]}: {len(articles)}개 수집')
+        except Exception as e:
+            print(f'   ❌ {source["name"]} 크롤링 실패: {e}')
+    sys.stdout.flush()
+
+    executor.shutdown(wait=False, cancel_futures=True)
+    print_memory_report()
+    return all_articles
+
 def main():
     """메인 실행 함수"""
     import json
@@ -650,70 +1430,20 @@ def main():
     
     now_kst = datetime.now(KST)
     print(f'현재 시각 (KST): {now_kst.strftime("%Y-%m-%d %H:%M:%S")}')
-    print(f'필터링 기준: 24시간 이내 기사\n')
+    print(f'필터링 기준: {get_crawl_cutoff(now_kst).strftime("%Y-%m-%d %H:%M")} 이후 기사 (모드: {CRAWL_MODE})\n')
     sys.stdout.flush()
     
-    driver = setup_driver()
-    all_articles = []
+    all_articles = crawl_all_sources(now_kst)
     
-    try:
-        # GameSpot 크롤링
-        try:
-            print('>> [GameSpot] 크롤링 시작...')
-            sys.stdout.flush()
-            gamespot_articles = crawl_gamespot(driver, now_kst)
-            all_articles.extend(gamespot_articles)
-            print(f'   GameSpot: {len(gamespot_articles)}개 수집')
-            sys.stdout.flush()
-        except Exception as e:
-            print(f'   ❌ GameSpot 크롤링 실패: {e}')
+    # 본문 지문: 이전에 처리한 URL이 사소하게만 바뀌었으면 이전 1단계/2단계 결과 재사용
+    fingerprint_store = load_fingerprints() if FINGERPRINTS else {}
+    if FINGERPRINTS:
+        reused_count, updated_count = match_previous(all_articles, fingerprint_store, now_kst)
+        if reused_count or updated_count:
+            print(f'\n>> 본문 지문: 사소한 수정 {reused_count}개 (이전 결과 재사용), 실질적 수정 {updated_count}개 (다시 평가)')
             sys.stdout.flush()
-        
-        # IGN 크롤링 (재시도 로직 추가)
-        ign_success = False
-        max_retries = 3
-        
-        for retry in range(max_retries):
-            try:
-                if retry > 0:
-                    print(f'>> [IGN] 재시도 {retry}/{max_retries-1}...')
-                    sys.stdout.flush()
-                    time.sleep(5)  # 재시도 전 대기
-                else:
-                    print('>> [IGN] 크롤링 시작...')
-                    sys.stdout.flush()
-                
-                ign_articles = crawl_ign(driver, now_kst)
-                all_articles.extend(ign_articles)
-                print(f'   IGN: {len(ign_articles)}개 수집')
-                sys.stdout.flush()
-                ign_success = True
-                break
-            except Exception as e:
-                print(f'   ❌ IGN 크롤링 실패 (시도 {retry+1}/{max_retries}): {str(e)[:100]}')
-                sys.stdout.flush()
-                if retry == max_retries - 1:
-                    print(f'   ⚠️ IGN 크롤링 최종 실패 - GameSpot과 Gamelook으로 계속 진행')
-                    sys.stdout.flush()
-        
-        # Gamelook 크롤링
-        try:
-            print('>> [Gamelook] 크롤링 시작...')
-            sys.stdout.flush()
-            gamelook_articles = crawl_gamelook(driver, now_kst)
-            all_articles.extend(gamelook_articles)
-            print(f'   Gamelook: {len(gamelook_articles)}개 수집')
-            sys.stdout.flush()
-        except Exception as e:
-            print(f'   ❌ Gamelook 크롤링 실패: {e}')
-            sys.stdout.flush()
-        
-    finally:
-        print('Chrome 드라이버 종료 중...')
-        sys.stdout.flush()
-        driver.quit()
-        print('Chrome 드라이버 종료 완료!')
-        sys.stdout.flush()
+    all_articles = filter_seen_articles(all_articles)
+    crawled_articles = all_articles  # 1단계 제외 기사까지 아카이브에 남김 (백필에서 기준을 바꿔 재렌더링)
     
     print(f'\n>> 수집 완료! 총 {len(all_articles)}개 기사')
     sys.stdout.flush()
@@ -736,75 +1466,207 @@ def main():
         filtered_articles = []
         skipped_count = 0
         
-        for i, article in enumerate(all_articles, 1):
-            print(f'   [{i}/{len(all_articles)}] {article["media"]} - {article["title"][:50]}...')
-            sys.stdout.flush()
-            
+        # 로컬 모델이 확신하는 기사는 로컬에서 판정, 임계값 근처만 Claude로 에스컬레이션
+        local_scorer = build_local_scorer()
+        local_count = 0
+        escalated = []  # (로컬 예상 통과 여부, Claude 통과 여부)
+        audited = set()  # 로컬 판정했지만 라벨 표본으로 Claude에도 보낸 기사 인덱스
+        audit_results = []  # (로컬 판정, Claude 통과 여부)
+        passed = {}  # 기사 인덱스 → 통과 여부 (filtered_articles는 원래 순서 유지)
+        api_queue = []  # (인덱스, 기사, 로컬 예상 통과 여부, 로컬 (관련성 p, 중요도 p))
+        
+        # 투기 실행: 통과가 거의 확실한 기사는 1단계와 동시에 2단계 번역 시작 (기사별 동기 번역 모드에서만)
+        speculating = SPECULATIVE_STAGE2 and STAGE2_MODE == 'sync'
+        pass_rates = source_pass_rates(load_labels()) if speculating else {}
+        speculative = {}  # URL → (기사, 2단계 입력 본문, Future)
+        speculation_executor = ThreadPoolExecutor(max_workers=LLM_MAX_CONCURRENCY) if speculating else None
+        
+        for i, article in enumerate(all_articles):
+            if article.get('fingerprint_reused'):
+                passed[i] = article['stage1_passed']
+                continue
+            if not local_scorer:
+                api_queue.append((i, article, None, None))
+                continue
+            preview = trim_to_tokens(article['body'], QUICK_FILTER_PREVIEW_TOKENS)
+            p_relevance, p_importance, decision = local_decision(local_scorer, article['title'], preview)
+            if decision is None:
+                api_queue.append((i, article, p_relevance >= 0.5 and p_importance >= 0.5, (p_relevance, p_importance)))
+                continue
+            if sample_for_audit():
+                # 확신 구간 라벨 표본: Claude 결과로 판정 (에스컬레이션 기사만 라벨로 쌓이는 편향 방지)
+                audited.add(i)
+                api_queue.append((i, article, decision, (p_relevance, p_importance)))
+                continue
+            # 분류기 확률은 Claude 점수(0~1 평가값)와 의미가 다르므로 별도 필드에 저장하고 점수는 비워 둠
+            # (랭킹/예산/백필은 article_table.stage1_scores로 판정 하한을 사용)
+            article['local_p_relevance'] = round(p_relevance, 2)
+            article['local_p_importance'] = round(p_importance, 2)
+            article['stage1_tier'] = 'local'
+            article['stage1_passed'] = decision
+            local_count += 1
+            passed[i] = decision
+            print(f'   [{i + 1}/{len(all_articles)}] {article["media"]} - {article["title"][:50]}... '
+                  f'{"✅ 로컬 통과" if decision else "⏭️  로컬 제외"} (관련성 p={p_relevance:.2f}, 중요도 p={p_importance:.2f})')
+        sys.stdout.flush()
+        
+        def score_with_claude(item):
+            """Claude 1단계 평가 (호출 속도는 게이트웨이가 조절) → 통과 여부, 실행 마감 후면 None"""
+            i, article, local_guess, local_probs = item
+            if past_llm_deadline():
+                return None
+            if speculating and should_speculate(article['media'], article['url'], pass_rates, local_probs):
+                entry = start_speculative_translation(speculation_executor, article)
+                if entry:
+                    speculative[article['url']] = entry
             try:
                 game_relevance, importance, should_process = quick_filter(
-                    article['title'], 
-                    article['body']
+                    article['title'], article['body'], article['media'], article['url']
                 )
-                
-                article['game_relevance'] = game_relevance
-                article['importance'] = importance
-                
-                if should_process:
-                    filtered_articles.append(article)
-                    print(f'   ✅ 필터 통과 (관련성: {game_relevance:.2f}, 중요도: {importance:.2f})')
-                else:
-                    skipped_count += 1
-                    print(f'   ⏭️  필터 제외 (관련성: {game_relevance:.2f}, 중요도: {importance:.2f})')
-                sys.stdout.flush()
+            except StructuredOutputError as e:
+                # 점수 없이 제외 (stage1_passed를 남기지 않아 지문 저장소에도 기록되지 않고 다음 실행에서 다시 평가)
+                print(f'   ❌ 필터 응답 형식 오류: {e} - 제외')
+                return False
             except Exception as e:
                 print(f'   ❌ 필터링 실패: {e} - 기본 처리 진행')
-                article['game_relevance'] = 1.0
-                article['importance'] = 0.5
-                filtered_articles.append(article)
+                game_relevance, importance, should_process = 1.0, 0.5, True
+            article['game_relevance'] = game_relevance
+            article['importance'] = importance
+            article['stage1_passed'] = should_process
+            return should_process
+        
+        # Claude 평가는 동시에 요청 (게이트웨이의 RPM/TPM 버킷이 계정 한도에 맞춰 속도 조절)
+        deadline_skipped = 0
+        with ThreadPoolExecutor(max_workers=LLM_MAX_CONCURRENCY) as executor:
+            for (i, article, local_guess, _), should_process in zip(api_queue, executor.map(score_with_claude, api_queue)):
+                if should_process is None:
+                    deadline_skipped += 1
+                    continue
+                passed[i] = should_process
+                if 'game_relevance' not in article:
+                    print(f'   [{i + 1}/{len(all_articles)}] {article["media"]} - {article["title"][:50]}... ⏭️  점수 없음 (형식 오류)')
+                    sys.stdout.flush()
+                    continue
+                if i in audited:
+                    audit_results.append((local_guess, should_process))
+                elif local_guess is not None:
+                    escalated.append((local_guess, should_process))
+                print(f'   [{i + 1}/{len(all_articles)}] {article["media"]} - {article["title"][:50]}... '
+                      f'{"✅ 필터 통과" if should_process else "⏭️  필터 제외"} '
+                      f'(관련성: {article["game_relevance"]:.2f}, 중요도: {article["importance"]:.2f})')
                 sys.stdout.flush()
-            
-            time.sleep(0.3)  # API 호출 간격
+        if deadline_skipped:
+            print(f'   ⏱️ 실행 마감 임박 - {deadline_skipped}개 기사 평가 생략')
+        
+        filtered_articles = [a for i, a in enumerate(all_articles) if passed.get(i)]
+        stage1_passed_urls = {a['url'] for a in filtered_articles}
+        skipped_count = len(all_articles) - len(filtered_articles)
         
         print(f'\n>> [1단계 완료] {len(filtered_articles)}개 통과, {skipped_count}개 제외')
+        if local_scorer:
+            agreement = sum(1 for local, api in escalated if local == api)
+            print(f'   로컬 판정 {local_count}개, Claude 에스컬레이션 {len(escalated)}개'
+                  + (f' (에스컬레이션 구간 로컬/Claude 일치율 {agreement / len(escalated) * 100:.0f}%)' if escalated else ''))
+            if audit_results:
+                audit_agreement = sum(1 for local, api in audit_results if local == api)
+                print(f'   로컬 판정 표본 {len(audit_results)}개 Claude 재평가 (일치율 {audit_agreement / len(audit_results) * 100:.0f}%)')
+        prune_labels()
         print(f'   💰 토큰 절약: 약 {skipped_count * 1500} 토큰 (~{skipped_count * 1500 * 0.003 / 1000:.2f}원)')
         sys.stdout.flush()
         
+        # 토큰 예산: 기사별 정보량 높은 문단만 남기고, 실행 상한을 넘으면 점수 낮은 기사부터 제외
+        # 지문으로 이전 결과를 재사용하는 기사는 2단계 호출이 없으므로 예산 계산에서 제외
+        budgeted, budget_dropped = apply_token_budget([a for a in filtered_articles if not a.get('fingerprint_reused')])
+        kept_ids = {id(a) for a in budgeted}
+        filtered_articles = [a for a in filtered_articles if a.get('fingerprint_reused') or id(a) in kept_ids]
+        # 필터 제외/예산 초과 기사의 투기 번역은 아직 시작 전이면 취소
+        discard_speculation(speculative, {a['url'] for a in filtered_articles})
+        print(f'\n>> 토큰 예산 적용: 2단계 예상 {total_stage2_tokens(budgeted):,} 토큰')
+        if budget_dropped:
+            print(f'   ⏭️  실행 토큰 상한 초과로 {len(budget_dropped)}개 제외 (중요도 낮은 순)')
+        sys.stdout.flush()
+        
         # 🎯 2단계: 통과한 기사만 번역 + 요약
-        print(f'\n>> [2단계] 번역 & 요약 중... (필터 통과 기사만)')
+        print(f'\n>> [2단계] 번역 & 요약 중... (필터 통과 기사만, 모드: {STAGE2_MODE})')
         sys.stdout.flush()
         
-        for i, article in enumerate(filtered_articles, 1):
-            print(f'   [{i}/{len(filtered_articles)}] {article["media"]} - {article["title"][:50]}...')
-            sys.stdout.flush()
-            
-            try:
-                title_kr, content_summary_kr, category = translate_and_summarize(
-                    article['title'], 
-                    article['body']
-                )
-                article['title_kr'] = title_kr
-                article['content_summary_kr'] = content_summary_kr
-                article['category'] = category
-                print(f'   ✅ 번역 완료: {title_kr[:30]}...')
-                sys.stdout.flush()
-            except Exception as e:
-                print(f'   ❌ 번역 실패: {e}')
-                article['title_kr'] = article['title']
-                article['content_summary_kr'] = article['body'][:200]
-                article['category'] = '기타'
-                sys.stdout.flush()
+        # 번역 메모리: 제목/본문이 이전과 같은 기사는 이전 번역을 그대로 사용
+        pending_articles = apply_translation_memory([a for a in filtered_articles if not a.get('fingerprint_reused')])
+        
+        if STAGE2_MODE == 'batch' and pending_articles:
+            translate_articles_batch(pending_articles)
+        elif pending_articles:
+            # 중국어 기사는 묶음 번역, 나머지와 묶음에서 누락된 기사는 기사별 번역
+            chinese_articles = [a for a in pending_articles if a.get('language') == 'zh']
+            per_article = [a for a in pending_articles if a.get('language') != 'zh']
+            if chinese_articles:
+                per_article += translate_chinese_articles(chinese_articles)
+            def translate_article(article):
+                """기사별 번역 (실패/마감 시 원문 기본값) → 오류 메시지 또는 None"""
+                try:
+                    entry = speculative.get(article['url'])
+                    if entry and entry[1] == article['body']:
+                        # 1단계와 동시에 시작한 번역 재사용
+                        del speculative[article['url']]
+                        title_kr, content_summary_kr, category = entry[2].result()
+                        record_speculation('hits')
+                    elif past_llm_deadline():
+                        raise TimeoutError('실행 마감 임박 - 번역 생략')
+                    else:
+                        title_kr, content_summary_kr, category = translate_and_summarize(
+                            article['title'], 
+                            article['body']
+                        )
+                    article['title_kr'] = title_kr
+                    article['content_summary_kr'] = content_summary_kr
+                    article['category'] = category
+                    return None
+                except Exception as e:
+                    article['title_kr'] = article['title']
+                    article['content_summary_kr'] = article['body'][:200]
+                    article['category'] = '기타'
+                    return str(e)
             
-            time.sleep(0.5)  # API 호출 간격
+            # 기사별 번역도 동시에 요청 (호출 간격은 게이트웨이가 조절)
+            with ThreadPoolExecutor(max_workers=LLM_MAX_CONCURRENCY) as executor:
+                for i, (article, error) in enumerate(zip(per_article, executor.map(translate_article, per_article)), 1):
+                    print(f'   [{i}/{len(per_article)}] {article["media"]} - {article["title"][:50]}...')
+                    if error:
+                        print(f'   ❌ 번역 실패: {error}')
+                    else:
+                        print(f'   ✅ 번역 완료: {article["title_kr"][:30]}...')
+                    sys.stdout.flush()
+        
+        if speculation_executor:
+            discard_speculation(speculative, set(), wait=True)
+            speculation_executor.shutdown(wait=True)
+            print_speculation_report()
+        
+        remember_translations(pending_articles, CATEGORIES)
+        if FINGERPRINTS:
+            remember_results(fingerprint_store, all_articles, stage1_passed_urls, CATEGORIES, now_kst)
+            save_fingerprints(fingerprint_store, now_kst)
         
         # 필터링된 기사로 교체
         all_articles = filtered_articles
         
+        print_parse_stats()
+        
+        # 7일/30일 트렌드 누적 갱신 (오늘 기사 건수만 더함)
+        trend_state = update_trend_state(load_trend_state(), now_kst, all_articles)
+        save_trend_state(trend_state)
+        rising_trends = get_rising_entities(trend_state)
+        if rising_trends:
+            print(f'\n>> 이번 주 급상승: ' + ', '.join(f"{e['name']}({e['count_7d']}건)" for e in rising_trends))
+        
         # AI Summary 생성
         print(f'\n>> AI Summary 생성 중...')
         sys.stdout.flush()
-        daily_summary = generate_daily_summary(all_articles)
+        daily_summary = generate_daily_summary(all_articles, rising_trends)
         print(f'✅ AI Summary 생성 완료')
         sys.stdout.flush()
+        llm_gateway.print_stats()
+        llm_gateway.close()
         
         # JSON 파일로 저장
         output_file = 'collected_articles.json'
@@ -812,11 +1674,14 @@ def main():
         # JSON 파일 저장 (AI Summary 포함)
         output_data = {
             'daily_summary': daily_summary,
+            'rising_trends': rising_trends,
             'articles': all_articles
         }
         with open(output_file, 'w', encoding='utf-8') as f:
             json.dump(output_data, f, ensure_ascii=False, indent=2)
         
+        print(f'아카이브 저장: {save_edition(now_kst, crawled_articles, daily_summary, rising_trends)}')
+        
         total_body_length = sum(len(article['body']) for article in all_articles)
         
         print(f'\n결과 저장: {output_file}')
@@ -831,22 +1696,15 @@ def main():
         with open('daily_newsletter.html', 'r', encoding='utf-8') as f:
             html_content = f.read()
         
-        # 웹훅 전송 (HTML 형태로)
+        # 웹훅 전송 (HTML 형태로, 수신처가 여러 개면 동시 전송)
         print(f'\n>> 웹훅 전송 중...')
-        try:
-            response = requests.post(
-                WEBHOOK_URL,
-                json={'html': html_content},
-                timeout=30
-            )
-            if response.status_code == 200:
-                print(f'✅ 웹훅 전송 성공! (응답: {response.status_code})')
-            else:
-                print(f'❌ 웹훅 응답: {response.status_code}')
-        except Exception as e:
-            print(f'❌ 웹훅 전송 실패: {e}')
+        results = deliver_all(parse_webhook_urls(WEBHOOK_URL), html_content, now_kst.strftime('%Y-%m-%d'))
+        if results and all(results.values()):
+            # 1단계에서 제외된 기사도 기록해 겹침 구간에서 다시 평가하지 않음 (마감/형식 오류로 점수가 없는 기사만 다음 실행에서 재평가)
+            update_crawl_watermark(now_kst, [a for a in crawled_articles if 'stage1_passed' in a])
     else:
         print('조건에 맞는 기사가 없습니다.')
+        llm_gateway.close()
     
     print('\n' + '='*60)
 
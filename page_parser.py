@@ -0,0 +1,197 @@
+"""상세 페이지 HTML 파싱 (page_source 한 번으로 본문 문단, og:image, 발행 시각 추출)
+
+크롤러는 상세 페이지의 page_source를 한 번만 받아 크롤러 스레드에서 바로 파싱합니다
+(문단마다 WebDriver 왕복하지 않음). 본문은 예전 Selenium `.text` 추출과 같도록
+스크립트/스타일과 숨김 요소(hidden 속성, 인라인 display:none/visibility:hidden)를 빼고,
+<br>은 줄바꿈, 나머지 공백은 한 칸으로 합칩니다.
+
+회귀 검사: python page_parser.py --check
+    parser_samples/의 저장된 페이지를 headless Chrome으로 열어 예전 `.text` 추출 결과와
+    parse_html 결과를 비교합니다 (Chrome 필요, GitHub Actions에서 실행).
+"""
+import argparse
+import json
+import os
+import re
+import sys
+from html.parser import HTMLParser
+
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+
+PARSER_SAMPLE_DIR = os.getenv('PARSER_SAMPLE_DIR', 'parser_samples')
+
+SKIP_TAGS = {'script', 'style', 'noscript', 'template', 'svg'}
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+HIDDEN_STYLE_PATTERN = re.compile(r'(?:^|;)\s*(?:display\s*:\s*none|visibility\s*:\s*hidden)\s*(?:!important)?\s*(?:;|$)', re.I)
+WHITESPACE_PATTERN = re.compile(r'[ \t\n\r\f]+')
+
+
+def parse_body_selector(selector):
+    """'.article-body p' / 'article p' / 'main p' → (컨테이너 태그, 컨테이너 클래스)
+
+    상세 본문 셀렉터는 '컨테이너 p' 형식만 지원 (소스 어댑터의 detail_body_selector).
+    """
+    container = selector.split()[0]
+    tag, _, css_class = container.partition('.')
+    return tag or None, css_class or None
+
+
+def is_hidden(attrs):
+    """렌더링되지 않는 요소 (hidden 속성 또는 인라인 스타일로 숨김)"""
+    values = dict(attrs)
+    return 'hidden' in values or bool(HIDDEN_STYLE_PATTERN.search(values.get('style') or ''))
+
+
+def visible_text(fragments):
+    """문단 조각 → Selenium `.text`와 같은 문자열
+
+    원문 줄바꿈을 포함한 공백은 한 칸으로 합치고 <br>(None 조각)에서만 줄을 나눔.
+    줄마다 앞뒤 공백 제거, nbsp는 공백, 폭 없는 공백은 삭제.
+    """
+    lines = [[]]
+    for fragment in fragments:
+        if fragment is None:
+            lines.append([])
+        else:
+            lines[-1].append(fragment)
+    text = '\n'.join(WHITESPACE_PATTERN.sub(' ', ''.join(line).replace('\u200b', '')).strip(' ') for line in lines)
+    return text.replace('\xa0', ' ').strip()
+
+
+class ArticleParser(HTMLParser):
+    """컨테이너 안 <p> 텍스트 + 메타 태그 추출 (중첩 태그의 텍스트 포함, 스크립트/숨김 요소 제외)"""
+
+    def __init__(self, container_tag, container_class):
+        super().__init__(convert_charrefs=True)
+        self.container_tag = container_tag
+        self.container_class = container_class
+        self.stack = []  # 열린 태그 (태그명, 컨테이너 여부, 숨김 여부)
+        self.container_depth = 0
+        self.skip_depth = 0
+        self.paragraph = None
+        self.paragraphs = []
+        self.meta = {}
+
+    def _is_container(self, tag, attrs):
+        if self.container_tag and tag != self.container_tag:
+            return False
+        if self.container_class:
+            classes = (dict(attrs).get('class') or '').split()
+            return self.container_class in classes
+        return True
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'meta':
+            values = dict(attrs)
+            key = values.get('property') or values.get('name')
+            if key and 'content' in values:
+                self.meta.setdefault(key, values['content'])
+            return
+        if tag in VOID_TAGS:
+            if tag == 'br' and self.paragraph is not None and not self.skip_depth:
+                self.paragraph.append(None)  # 줄바꿈
+            return
+        is_container = self._is_container(tag, attrs)
+        skipped = tag in SKIP_TAGS or is_hidden(attrs)
+        self.stack.append((tag, is_container, skipped))
+        if is_container:
+            self.container_depth += 1
+        if skipped:
+            self.skip_depth += 1
+        if tag == 'p' and self.container_depth and self.paragraph is None:
+            self.paragraph = []
+
+    def handle_endtag(self, tag):
+        # 닫히지 않은 태그가 있어도 같은 이름의 가장 가까운 태그까지 정리
+        for i in range(len(self.stack) - 1, -1, -1):
+            if self.stack[i][0] == tag:
+                break
+        else:
+            return
+        while len(self.stack) > i:
+            name, is_container, skipped = self.stack.pop()
+            if name == 'p' and self.paragraph is not None:
+                text = visible_text(self.paragraph)
+                if text:
+                    self.paragraphs.append(text)
+                self.paragraph = None
+            if is_container:
+                self.container_depth -= 1
+            if skipped:
+                self.skip_depth -= 1
+
+    def handle_data(self, data):
+        if self.paragraph is not None and not self.skip_depth:
+            self.paragraph.append(data)
+
+
+def parse_html(html, body_selector):
+    """HTML → {'body', 'thumbnail', 'published_time'}"""
+    parser = ArticleParser(*parse_body_selector(body_selector))
+    parser.feed(html)
+    parser.close()
+    return {
+        'body': '\n'.join(parser.paragraphs),
+        'thumbnail': parser.meta.get('og:image', ''),
+        'published_time': parser.meta.get('article:published_time', '')
+    }
+
+
+def load_samples(sample_dir=PARSER_SAMPLE_DIR):
+    """저장된 페이지 목록 [(경로, 본문 셀렉터)] (parser_samples/index.json: 파일명 → 셀렉터)"""
+    with open(os.path.join(sample_dir, 'index.json'), 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    return [(os.path.join(sample_dir, name), selector) for name, selector in sorted(index.items())]
+
+
+def selenium_body_text(driver, path, body_selector):
+    """예전 크롤러의 본문 추출 (문단마다 WebDriver `.text`)"""
+    driver.get('file://' + os.path.abspath(path))
+    paragraphs = driver.find_elements(By.CSS_SELECTOR, body_selector)
+    return '\n'.join([p.text.strip() for p in paragraphs if p.text.strip()])
+
+
+def check_samples(driver, sample_dir=PARSER_SAMPLE_DIR):
+    """저장된 페이지마다 `.text` 추출과 parse_html 본문 비교 → 불일치 [(경로, `.text`, parse_html)]"""
+    mismatches = []
+    for path, selector in load_samples(sample_dir):
+        expected = selenium_body_text(driver, path, selector)
+        with open(path, 'r', encoding='utf-8') as f:
+            actual = parse_html(f.read(), selector)['body']
+        status = '일치' if actual == expected else '불일치'
+        print(f'   {os.path.basename(path)} ({selector}): {status} ({len(expected)}자)')
+        if actual != expected:
+            mismatches.append((path, expected, actual))
+    sys.stdout.flush()
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description='상세 페이지 파서 회귀 검사 (Selenium `.text`와 비교)')
+    parser.add_argument('--check', action='store_true', help='저장된 페이지로 `.text` 추출 결과와 비교')
+    parser.add_argument('--dir', default=PARSER_SAMPLE_DIR, help='저장된 페이지 폴더 (index.json 포함)')
+    args = parser.parse_args()
+    if not args.check:
+        parser.print_help()
+        return
+
+    options = webdriver.ChromeOptions()
+    for argument in ('--headless=new', '--no-sandbox', '--disable-dev-shm-usage', '--disable-gpu'):
+        options.add_argument(argument)
+    driver = webdriver.Chrome(options=options)
+    try:
+        print(f'>> 파서 회귀 검사: {args.dir}')
+        mismatches = check_samples(driver, args.dir)
+    finally:
+        driver.quit()
+
+    for path, expected, actual in mismatches:
+        print(f'\n[{path}]\n--- .text\n{expected}\n--- parse_html\n{actual}')
+    if mismatches:
+        sys.exit(1)
+    print('>> 모든 페이지 일치')
+
+
+if __name__ == '__main__':
+    main()
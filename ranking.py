@@ -0,0 +1,113 @@
+"""HOT TREND 랭킹 (댓글 속도, 매체 교차 보도, 중요도, 최신성 가중 합)
+
+댓글 수만으로 고르면 댓글이 없는 Gamelook 기사는 HOT TREND에 오를 수 없고, 여러 매체가 함께 다룬
+기사도 한 곳만 다룬 기사와 같은 점수를 받습니다. 각 항목을 0~1로 맞춘 뒤 가중 합으로 점수를 매기고
+heapq로 상위 k개만 뽑습니다.
+"""
+import heapq
+import math
+import os
+from datetime import datetime
+
+from article_table import np
+from trends import KNOWN_COMPANIES, extract_names
+
+DEFAULT_HOT_WEIGHTS = {
+    'velocity': 0.4,    # 발행 후 시간당 댓글 수
+    'coverage': 0.2,    # 같은 게임/IP를 다룬 다른 매체 수
+    'importance': 0.25, # 1단계 중요도
+    'recency': 0.15     # 발행 시각 (HOT_RECENCY_HALF_LIFE 시간마다 절반)
+}
+HOT_RECENCY_HALF_LIFE = float(os.getenv('HOT_RECENCY_HALF_LIFE', '12'))
+HOT_MIN_AGE_HOURS = 1.0  # 막 올라온 기사의 속도가 과대평가되지 않도록 최소 경과 시간
+
+
+def parse_weights(value, defaults=DEFAULT_HOT_WEIGHTS):
+    """'velocity=0.5,coverage=0.3' 형식 → 가중치 dict (지정하지 않은 항목은 기본값)"""
+    weights = dict(defaults)
+    for part in value.split(','):
+        if '=' not in part:
+            continue
+        name, _, number = part.partition('=')
+        name = name.strip()
+        if name not in weights:
+            print(f"[WARN] 알 수 없는 HOT_WEIGHTS 항목: {name}")
+            continue
+        try:
+            weights[name] = float(number)
+        except ValueError:
+            print(f"[WARN] HOT_WEIGHTS 값 오류: {part}")
+    return weights
+
+
+HOT_WEIGHTS = parse_weights(os.getenv('HOT_WEIGHTS', ''))
+
+
+def coverage_counts(articles):
+    """기사별로 같은 게임/IP 이름이 등장한 매체 수 (자기 매체 포함, 회사명은 너무 넓어서 제외)"""
+    names_per_article = []
+    media_by_name = {}
+    for article in articles:
+        names = [n for n in extract_names(article) if n not in KNOWN_COMPANIES]
+        names_per_article.append(names)
+        for name in names:
+            media_by_name.setdefault(name, set()).add(article.get('media', ''))
+    counts = []
+    for article, names in zip(articles, names_per_article):
+        media = {article.get('media', '')}
+        for name in names:
+            media |= media_by_name[name]
+        counts.append(len(media))
+    return counts
+
+
+def _age_hours(table, indices, now):
+    """발행 후 경과 시간 (날짜 없으면 None)"""
+    dates = table['date']
+    if np is not None:
+        hours = (np.datetime64(now.strftime('%Y-%m-%dT%H:%M'), 'm') - dates[indices]) / np.timedelta64(1, 'h')
+        return [None if math.isnan(h) else h for h in hours.tolist()]
+    ages = []
+    for i in indices:
+        try:
+            ages.append((now - datetime.strptime(dates[i], '%Y-%m-%d %H:%M')).total_seconds() / 3600)
+        except ValueError:
+            ages.append(None)
+    return ages
+
+
+def score_components(table, indices, now):
+    """후보별 항목 점수 [{'velocity', 'coverage', 'importance', 'recency'}] (각 0~1)"""
+    indices = list(indices)
+    if not indices:
+        return []
+    articles = table['articles']
+    candidates = [articles[i] for i in indices]
+    comments = [float(table['comments'][i]) for i in indices]
+    importance = [float(table['importance'][i]) for i in indices]
+    ages = _age_hours(table, indices, now)
+    coverage = coverage_counts(candidates)
+
+    velocity = [c / max(age if age is not None else 24.0, HOT_MIN_AGE_HOURS) for c, age in zip(comments, ages)]
+    max_log_velocity = math.log1p(max(velocity)) or 1.0
+    max_media = max(len({a.get('media', '') for a in candidates}), 2)
+
+    components = []
+    for v, cov, imp, age in zip(velocity, coverage, importance, ages):
+        components.append({
+            'velocity': math.log1p(v) / max_log_velocity,
+            'coverage': (cov - 1) / (max_media - 1),
+            'importance': min(max(imp, 0.0), 1.0),
+            'recency': 0.5 ** (max(age, 0.0) / HOT_RECENCY_HALF_LIFE) if age is not None else 0.0
+        })
+    return components
+
+
+def rank_hot_articles(table, mask, now, k=5, weights=None):
+    """마스크 안 후보 중 가중 합 점수 상위 k개 (인덱스 목록, 점수 목록)"""
+    weights = HOT_WEIGHTS if weights is None else weights
+    indices = [int(i) for i, flag in enumerate(mask) if flag] if np is None else np.flatnonzero(mask).tolist()
+    components = score_components(table, indices, now)
+    scores = [sum(weights[name] * value for name, value in c.items()) for c in components]
+    top = heapq.nlargest(k, range(len(indices)), key=lambda j: (scores[j], -j))
+    return [indices[j] for j in top], [(scores[j], components[j]) for j in top]
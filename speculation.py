@@ -0,0 +1,87 @@
+"""2단계 투기 실행 (1단계 결과를 기다리지 않고 통과가 거의 확실한 기사를 미리 번역)
+
+매체 + URL 첫 경로(예: IGN /articles)별 과거 1단계 통과율과 로컬 모델 사전 점수로 통과 확률을
+추정해 기준 이상이면 quick_filter와 동시에 translate_and_summarize를 시작합니다.
+필터가 제외하거나 토큰 예산에서 빠진 기사의 결과는 버리고, 실행 끝에 적중률과 버려진 토큰을 보고합니다.
+통과율은 stage1_labels.jsonl에 쌓인 Claude 평가(매체/URL 포함 라벨)로 계산합니다.
+"""
+import os
+import sys
+import threading
+from urllib.parse import urlparse
+
+from local_scorer import IMPORTANCE_THRESHOLD, RELEVANCE_THRESHOLD
+
+SPECULATIVE_STAGE2 = os.getenv('SPECULATIVE_STAGE2', '0') == '1'
+SPECULATIVE_THRESHOLD = float(os.getenv('SPECULATIVE_THRESHOLD', '0.85'))  # 예상 통과 확률이 이 이상이면 미리 번역
+SPECULATIVE_MIN_SAMPLES = 20  # 이보다 라벨이 적은 매체/경로는 통과율을 믿지 않음
+
+SPECULATION_STATS = {'speculated': 0, 'hits': 0, 'wasted': 0, 'cancelled': 0, 'wasted_tokens': 0}
+_stats_lock = threading.Lock()
+
+
+def url_section(url):
+    """URL 첫 경로 (숫자로 시작하는 날짜/ID 경로는 '')"""
+    segments = [s for s in urlparse(url or '').path.split('/') if s]
+    if not segments or segments[0][0].isdigit():
+        return ''
+    return segments[0].lower()
+
+
+def source_pass_rates(labels):
+    """라벨 → {(매체, 경로): (통과 수, 전체 수)} (경로 ''는 매체 전체)"""
+    counts = {}
+    for label in labels:
+        media = label.get('media')
+        if not media:
+            continue
+        passed = (label['game_relevance'] >= RELEVANCE_THRESHOLD and label['importance'] >= IMPORTANCE_THRESHOLD)
+        keys = {(media, ''), (media, url_section(label.get('url')))}
+        for key in keys:
+            passes, total = counts.get(key, (0, 0))
+            counts[key] = (passes + passed, total + 1)
+    return counts
+
+
+def pass_confidence(media, url, rates, local_probs=None):
+    """예상 통과 확률 (근거가 없으면 None)
+
+    매체/경로 통과율(라플라스 보정, 가장 구체적인 키 우선)과 로컬 모델의 통과 확률
+    (관련성 p × 중요도 p)을 평균합니다.
+    """
+    signals = []
+    for key in ((media, url_section(url)), (media, '')):
+        passes, total = rates.get(key, (0, 0))
+        if total >= SPECULATIVE_MIN_SAMPLES:
+            signals.append((passes + 1) / (total + 2))
+            break
+    if local_probs is not None:
+        signals.append(local_probs[0] * local_probs[1])
+    if not signals:
+        return None
+    return sum(signals) / len(signals)
+
+
+def should_speculate(media, url, rates, local_probs=None, threshold=SPECULATIVE_THRESHOLD):
+    confidence = pass_confidence(media, url, rates, local_probs)
+    return confidence is not None and confidence >= threshold
+
+
+def record_speculation(outcome, tokens=0):
+    """outcome: 'speculated' / 'hits' / 'wasted' / 'cancelled'"""
+    with _stats_lock:
+        SPECULATION_STATS[outcome] += 1
+        if outcome == 'wasted':
+            SPECULATION_STATS['wasted_tokens'] += tokens
+
+
+def print_speculation_report():
+    """적중률 + 버려진 결과의 토큰 비용"""
+    with _stats_lock:
+        stats = dict(SPECULATION_STATS)
+    if not stats['speculated']:
+        return
+    hit_rate = stats['hits'] / stats['speculated'] * 100
+    print(f'\n>> 2단계 투기 실행: {stats["speculated"]}개 미리 번역, 적중 {stats["hits"]}개 ({hit_rate:.0f}%)')
+    print(f'   버려진 번역 {stats["wasted"]}개 (약 {stats["wasted_tokens"]:,} 토큰), 시작 전 취소 {stats["cancelled"]}개')
+    sys.stdout.flush()
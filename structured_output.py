@@ -0,0 +1,158 @@
+"""Claude 응답 구조화 파싱 (tool use 스키마 강제 + 검증 + 형식 오류 시 재시도)"""
+import json
+import threading
+
+# 단계별 파싱 통계 (파싱 실패로 버려진 토큰 집계용)
+PARSE_STATS = {}
+_stats_lock = threading.Lock()
+
+
+class StructuredOutputError(ValueError):
+    """응답이 스키마에 맞지 않음"""
+
+
+def _record(stage, key, amount=1):
+    with _stats_lock:
+        stats = PARSE_STATS.setdefault(stage, {
+            'calls': 0,
+            'parse_failures': 0,
+            'retries': 0,
+            'failed': 0,
+            'wasted_tokens': 0
+        })
+        stats[key] += amount
+
+
+def make_tool(name, description, schema):
+    """스키마를 tool 정의로 변환"""
+    return {'name': name, 'description': description, 'input_schema': schema}
+
+
+def validate(data, schema, path='$'):
+    """JSON 스키마 일부(type, required, properties, enum, minimum/maximum, minLength, items) 엄격 검증"""
+    expected = schema.get('type')
+    type_checks = {
+        'object': lambda v: isinstance(v, dict),
+        'array': lambda v: isinstance(v, list),
+        'string': lambda v: isinstance(v, str),
+        'number': lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+        'integer': lambda v: isinstance(v, int) and not isinstance(v, bool),
+        'boolean': lambda v: isinstance(v, bool),
+    }
+    if expected and not type_checks[expected](data):
+        raise StructuredOutputError(f'{path}: {expected} 타입이 아님 ({type(data).__name__})')
+
+    if 'enum' in schema and data not in schema['enum']:
+        raise StructuredOutputError(f'{path}: 허용되지 않은 값 {data!r}')
+    if 'minimum' in schema and data < schema['minimum']:
+        raise StructuredOutputError(f'{path}: {data} < {schema["minimum"]}')
+    if 'maximum' in schema and data > schema['maximum']:
+        raise StructuredOutputError(f'{path}: {data} > {schema["maximum"]}')
+    if 'minLength' in schema and len(data) < schema['minLength']:
+        raise StructuredOutputError(f'{path}: 길이 {len(data)} < {schema["minLength"]}')
+
+    if expected == 'object':
+        for key in schema.get('required', []):
+            if key not in data:
+                raise StructuredOutputError(f'{path}: 필수 필드 누락 "{key}"')
+        for key, sub_schema in schema.get('properties', {}).items():
+            if key in data:
+                validate(data[key], sub_schema, f'{path}.{key}')
+    elif expected == 'array' and 'items' in schema:
+        for i, item in enumerate(data):
+            validate(item, schema['items'], f'{path}[{i}]')
+    return data
+
+
+def extract_json_text(response_text):
+    """텍스트 응답에서 JSON 추출 (```json 코드 블록 처리)"""
+    if '```json' in response_text:
+        json_start = response_text.find('```json') + 7
+        json_end = response_text.find('```', json_start)
+        response_text = response_text[json_start:json_end].strip()
+    elif '```' in response_text:
+        json_start = response_text.find('```') + 3
+        json_end = response_text.find('```', json_start)
+        response_text = response_text[json_start:json_end].strip()
+    try:
+        return json.loads(response_text)
+    except ValueError as e:
+        raise StructuredOutputError(f'JSON 파싱 실패: {e}')
+
+
+def parse_message(message, tool_name, schema):
+    """메시지에서 tool_use 입력(없으면 텍스트 JSON)을 꺼내 스키마 검증"""
+    data = None
+    for block in message.content:
+        if block.type == 'tool_use' and block.name == tool_name:
+            data = block.input
+            break
+    else:
+        texts = [block.text for block in message.content if block.type == 'text']
+        if not texts:
+            raise StructuredOutputError('tool_use/텍스트 블록 없음')
+        data = extract_json_text(''.join(texts))
+    return validate(data, schema)
+
+
+def _usage_tokens(message):
+    usage = getattr(message, 'usage', None)
+    if not usage:
+        return 0
+    return (usage.input_tokens or 0) + (usage.output_tokens or 0)
+
+
+def request_structured(client, stage, model, max_tokens, prompt, tool, max_retries=1, validate_schema=None):
+    """tool use로 출력 형식을 강제해 호출하고, 형식 오류일 때만 오류 내용을 알려주고 재시도
+
+    API 오류(네트워크, 429 등)는 그대로 예외로 올림. 재시도 후에도 형식이 맞지 않으면
+    StructuredOutputError를 올림.
+    validate_schema: 응답 검증에 쓸 스키마 (기본은 tool 스키마, 묶음 응답에서 항목별로 따로 검증할 때 느슨한 스키마 지정)
+    """
+    validate_schema = validate_schema or tool['input_schema']
+    messages = [{'role': 'user', 'content': prompt}]
+    last_error = None
+    for attempt in range(max_retries + 1):
+        _record(stage, 'calls')
+        if attempt > 0:
+            _record(stage, 'retries')
+        message = client.messages.create(
+            model=model,
+            max_tokens=max_tokens,
+            tools=[tool],
+            tool_choice={'type': 'tool', 'name': tool['name']},
+            messages=messages
+        )
+        try:
+            return parse_message(message, tool['name'], validate_schema)
+        except StructuredOutputError as e:
+            last_error = e
+            _record(stage, 'parse_failures')
+            _record(stage, 'wasted_tokens', _usage_tokens(message))
+            messages = [
+                {'role': 'user', 'content': prompt},
+                {'role': 'user', 'content': f'이전 응답이 형식 검증에 실패했습니다: {e}\n{tool["name"]} 도구 스키마에 정확히 맞게 다시 응답하세요.'}
+            ]
+    _record(stage, 'failed')
+    raise last_error
+
+
+def record_external_result(stage, message, error=None):
+    """배치 결과처럼 request_structured 밖에서 파싱한 응답 집계"""
+    _record(stage, 'calls')
+    if error is not None:
+        _record(stage, 'parse_failures')
+        _record(stage, 'wasted_tokens', _usage_tokens(message))
+
+
+def print_parse_stats():
+    """단계별 파싱 실패율 출력"""
+    with _stats_lock:
+        snapshot = {stage: dict(stats) for stage, stats in PARSE_STATS.items()}
+    if not snapshot:
+        return
+    print('\n>> 응답 파싱 통계')
+    for stage, stats in snapshot.items():
+        rate = stats['parse_failures'] / stats['calls'] * 100 if stats['calls'] else 0
+        print(f'   {stage}: 호출 {stats["calls"]}회, 파싱 실패 {stats["parse_failures"]}회 ({rate:.1f}%), '
+              f'재시도 {stats["retries"]}회, 최종 실패 {stats["failed"]}건, 낭비 토큰 {stats["wasted_tokens"]}')
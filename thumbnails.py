@@ -0,0 +1,149 @@
+"""뉴스레터 썸네일 축소 캐시
+
+원본 og:image(IGN ?width=1280 등)를 한 번만 받아 메일 표시 크기로 줄인 JPEG를 만들고,
+내용 해시 파일명으로 로컬 캐시에 저장합니다. 캐시 폴더는 THUMBNAIL_BASE_URL로 공개되어
+있어야 하며(워크플로는 actions/cache로 보관하고 GitHub Pages로 배포, Git에는 커밋하지 않음),
+설정이 없으면 원본 URL을 그대로 사용합니다.
+"""
+import hashlib
+import json
+import os
+import time
+from io import BytesIO
+
+import requests
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Pillow 미설치 시 원본 URL 사용
+    Image = None
+
+THUMBNAIL_DIR = os.getenv('THUMBNAIL_DIR', 'thumbnails')
+THUMBNAIL_BASE_URL = os.getenv('THUMBNAIL_BASE_URL', '').rstrip('/')
+THUMBNAIL_CACHE_MAX_BYTES = int(os.getenv('THUMBNAIL_CACHE_MAX_BYTES', str(20 * 1024 * 1024)))
+THUMBNAIL_QUALITY = 80
+THUMBNAIL_OFFLINE = False  # True면 캐시에 없는 이미지는 받지 않고 원본 URL 사용 (백필)
+INDEX_FILE = os.path.join(THUMBNAIL_DIR, 'index.json')
+
+# generate_html 레이아웃의 표시 크기 (가로, 세로), 고해상도 화면 대응으로 2배 저장
+THUMBNAIL_SIZES = {
+    'hot_large': (450, 200),  # HOT TREND 1, 2번 (2단)
+    'hot_row': (250, 200),    # HOT TREND 3~5번
+    'list': (120, 80),        # 카테고리 섹션
+}
+PIXEL_RATIO = 2
+
+_index = None
+
+
+def is_enabled():
+    """Pillow 설치 + 공개 URL 설정 시에만 사용"""
+    return Image is not None and bool(THUMBNAIL_BASE_URL)
+
+
+def load_index():
+    """{원본 URL|크기: {'file': 파일명, 'last_used': 사용 시각}} 인덱스 로드
+
+    체크아웃하면 파일 mtime이 초기화되므로 최근 사용 시각은 인덱스에 기록함.
+    """
+    global _index
+    if _index is None:
+        try:
+            with open(INDEX_FILE, 'r', encoding='utf-8') as f:
+                _index = json.load(f)
+        except (FileNotFoundError, ValueError):
+            _index = {}
+    return _index
+
+
+def save_index():
+    """인덱스 저장"""
+    if _index is None:
+        return
+    os.makedirs(THUMBNAIL_DIR, exist_ok=True)
+    with open(INDEX_FILE, 'w', encoding='utf-8') as f:
+        json.dump(_index, f, ensure_ascii=False, indent=2)
+
+
+def resize_image(image_bytes, size_name):
+    """표시 크기에 맞게 가운데 기준으로 잘라 축소한 JPEG 바이트"""
+    width, height = THUMBNAIL_SIZES[size_name]
+    image = Image.open(BytesIO(image_bytes)).convert('RGB')
+    image = ImageOps.fit(image, (width * PIXEL_RATIO, height * PIXEL_RATIO), Image.LANCZOS)
+    output = BytesIO()
+    image.save(output, 'JPEG', quality=THUMBNAIL_QUALITY, optimize=True, progressive=True)
+    return output.getvalue()
+
+
+def get_thumbnail_url(url, size_name):
+    """축소 썸네일 URL 반환 (실패하거나 비활성화면 원본 URL)"""
+    if not url or not is_enabled():
+        return url
+
+    index = load_index()
+    key = f'{url}|{size_name}'
+    entry = index.get(key)
+    if entry and os.path.exists(os.path.join(THUMBNAIL_DIR, entry['file'])):
+        entry['last_used'] = time.time()  # 최근 사용 표시 (LRU 정리용)
+        return f'{THUMBNAIL_BASE_URL}/{entry["file"]}'
+    if THUMBNAIL_OFFLINE:
+        return url
+
+    try:
+        response = requests.get(
+            url,
+            headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'},
+            timeout=10
+        )
+        response.raise_for_status()
+        thumbnail_bytes = resize_image(response.content, size_name)
+    except Exception as e:
+        print(f"   [WARN] 썸네일 축소 실패 ({url[:50]}...): {e}")
+        return url
+
+    # 같은 이미지는 같은 파일을 공유하도록 내용 해시로 파일명 지정
+    filename = hashlib.sha256(thumbnail_bytes).hexdigest()[:20] + '.jpg'
+    os.makedirs(THUMBNAIL_DIR, exist_ok=True)
+    path = os.path.join(THUMBNAIL_DIR, filename)
+    if not os.path.exists(path):
+        with open(path, 'wb') as f:
+            f.write(thumbnail_bytes)
+    index[key] = {'file': filename, 'last_used': time.time()}
+    return f'{THUMBNAIL_BASE_URL}/{filename}'
+
+
+def evict_cache(max_bytes=THUMBNAIL_CACHE_MAX_BYTES):
+    """캐시가 용량을 넘으면 오래 사용하지 않은 파일부터 삭제"""
+    if not os.path.isdir(THUMBNAIL_DIR):
+        return
+    index = load_index()
+    last_used = {}
+    for entry in index.values():
+        last_used[entry['file']] = max(last_used.get(entry['file'], 0), entry['last_used'])
+
+    files = []
+    for name in os.listdir(THUMBNAIL_DIR):
+        if name.endswith('.jpg'):
+            files.append((last_used.get(name, 0), os.path.getsize(os.path.join(THUMBNAIL_DIR, name)), name))
+
+    total = sum(size for _, size, _ in files)
+    removed = set()
+    for _, size, name in sorted(files):
+        if total <= max_bytes:
+            break
+        os.remove(os.path.join(THUMBNAIL_DIR, name))
+        removed.add(name)
+        total -= size
+
+    if removed:
+        for key in [k for k, v in index.items() if v['file'] in removed]:
+            del index[key]
+        print(f">> 썸네일 캐시 정리: {len(removed)}개 삭제 (현재 {total:,}B)")
+
+
+def finalize_cache():
+    """캐시 정리 + 인덱스 저장 (렌더링 끝난 뒤 한 번 호출)"""
+    if not is_enabled():
+        return
+    evict_cache()
+    save_index()
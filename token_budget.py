@@ -0,0 +1,127 @@
+"""2단계 전 토큰 예산 관리
+
+- 언어별 토큰 수 추정 (중국어/한국어는 글자당, 영어는 약 4글자당 1토큰)
+- 기사별 예산 안에서 정보량 많은 문단(리드 문단, 고유명사/숫자 포함 문장) 우선 유지
+- 실행 전체 상한을 넘으면 1단계 점수가 낮은 기사부터 제외
+"""
+import os
+import re
+
+from article_table import stage1_scores
+
+ARTICLE_TOKEN_BUDGET = int(os.getenv('ARTICLE_TOKEN_BUDGET', '400'))  # 기사별 본문 토큰 예산
+STAGE2_TOKEN_CEILING = int(os.getenv('STAGE2_TOKEN_CEILING', '100000'))  # 실행당 2단계 토큰 상한 (0이면 무제한)
+STAGE2_PROMPT_OVERHEAD = 700  # 프롬프트 지시문 + 제목 + 응답 토큰 추정치
+
+CJK_PATTERN = re.compile(r'[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff]')
+NAME_PATTERN = re.compile(r'\b[A-Z][a-zA-Z0-9]+(?:\s+[A-Z0-9][a-zA-Z0-9]*)*|《[^》]+》|「[^」]+」')
+NUMBER_PATTERN = re.compile(r'\d')
+
+
+def estimate_tokens(text):
+    """언어별 토큰 수 추정"""
+    if not text:
+        return 0
+    cjk_count = len(CJK_PATTERN.findall(text))
+    other_count = len(text) - cjk_count
+    return int(cjk_count * 1.1 + other_count / 4) + 1
+
+
+def detect_language(text):
+    """본문 주 언어 (zh/ko/en)"""
+    sample = text[:500]
+    if not sample:
+        return 'en'
+    hangul = len(re.findall(r'[\uac00-\ud7af]', sample))
+    han = len(re.findall(r'[\u4e00-\u9fff]', sample))
+    if max(hangul, han) < len(sample) * 0.2:
+        return 'en'
+    return 'ko' if hangul > han else 'zh'
+
+
+def score_paragraph(paragraph, position):
+    """문단 정보량 점수 (리드 문단, 고유명사, 숫자 가산 / 짧은 문단 감산)"""
+    score = 0.0
+    if position == 0:
+        score += 3.0
+    elif position == 1:
+        score += 1.5
+    score += min(len(NAME_PATTERN.findall(paragraph)), 5) * 0.5
+    score += min(len(NUMBER_PATTERN.findall(paragraph)), 6) * 0.3
+    if len(paragraph) < 40:
+        score -= 1.0
+    return score
+
+
+def trim_to_tokens(text, max_tokens):
+    """앞에서부터 예산만큼 자르기 (한 문단이 예산보다 긴 경우)"""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if estimate_tokens(text[:mid]) <= max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low]
+
+
+def select_informative_text(body, max_tokens=ARTICLE_TOKEN_BUDGET):
+    """예산 안에서 점수 높은 문단을 골라 원래 순서대로 이어 붙임"""
+    if estimate_tokens(body) <= max_tokens:
+        return body
+
+    paragraphs = [p.strip() for p in body.split('\n') if p.strip()]
+    ranked = sorted(range(len(paragraphs)), key=lambda i: score_paragraph(paragraphs[i], i), reverse=True)
+
+    chosen = set()
+    used = 0
+    for i in ranked:
+        cost = estimate_tokens(paragraphs[i])
+        if used + cost <= max_tokens:
+            chosen.add(i)
+            used += cost
+
+    if not chosen:
+        return trim_to_tokens(paragraphs[0], max_tokens)
+    return '\n'.join(paragraphs[i] for i in sorted(chosen))
+
+
+def article_priority(article):
+    """실행 상한 초과 시 제외 순서 (1단계 점수가 낮을수록 먼저 제외)"""
+    relevance, importance = stage1_scores(article)
+    return importance * relevance
+
+
+def apply_token_budget(articles, article_budget=ARTICLE_TOKEN_BUDGET, ceiling=STAGE2_TOKEN_CEILING):
+    """기사별 본문 예산 적용 후 실행 상한 안에 드는 기사만 반환 (kept, dropped)"""
+    for article in articles:
+        article['body'] = select_informative_text(article.get('body', ''), article_budget)
+        article['language'] = detect_language(article['body'])
+
+    costs = {id(a): stage2_cost(a) for a in articles}
+    total = sum(costs.values())
+    if not ceiling or total <= ceiling:
+        return articles, []
+
+    dropped_ids = set()
+    for article in sorted(articles, key=article_priority):
+        if total <= ceiling:
+            break
+        dropped_ids.add(id(article))
+        total -= costs[id(article)]
+
+    kept = [a for a in articles if id(a) not in dropped_ids]
+    dropped = [a for a in articles if id(a) in dropped_ids]
+    return kept, dropped
+
+
+def stage2_cost(article):
+    """기사 하나의 2단계 예상 토큰"""
+    return STAGE2_PROMPT_OVERHEAD + estimate_tokens(article['title']) + estimate_tokens(article['body'])
+
+
+def total_stage2_tokens(articles):
+    """2단계 예상 토큰 합계"""
+    return sum(stage2_cost(a) for a in articles)
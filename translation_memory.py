@@ -0,0 +1,190 @@
+"""번역 메모리 (반복 기사 재사용 + 유사 제목 참고 + 고유명사 표기 저장소)
+
+- 정확 일치: 정규화한 제목 + 본문이 같으면 이전 번역/요약/카테고리를 그대로 사용 (Claude 호출 없음)
+- 유사 일치: 제목 글자 3-gram 색인(숫자 무시)으로 비슷한 이전 제목을 찾아 프롬프트에 표기 참고로 제공
+- 고유명사: 원문 《게임명》과 번역 제목의 《》/'' 표기를 짝지어 저장하고 용어집과 함께 프롬프트에 주입
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import unicodedata
+
+from glossary import ZH_GLOSSARY
+
+TRANSLATION_MEMORY_FILE = os.getenv('TRANSLATION_MEMORY_FILE', 'translation_memory.json')
+TM_MAX_ENTRIES = int(os.getenv('TM_MAX_ENTRIES', '5000'))  # 초과 시 오래 사용하지 않은 항목부터 삭제
+TM_FUZZY_THRESHOLD = float(os.getenv('TM_FUZZY_THRESHOLD', '0.6'))  # 제목 3-gram Jaccard 유사도 기준
+
+PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+DIGIT_PATTERN = re.compile(r'\d')
+ZH_NAME_PATTERN = re.compile(r'《([^》]{1,40})》')
+KR_NAME_PATTERN = re.compile(r"《([^》]{1,60})》|'([^']{1,60})'|‘([^’]{1,60})’")
+
+_memory = None
+_ngram_index = None
+_load_lock = threading.Lock()  # 1단계 투기 실행/2단계 번역 스레드가 동시에 처음 로드할 수 있음
+
+
+def normalize_text(text):
+    """비교용 정규화 (NFKC, 소문자, 구두점 제거, 공백 통일)"""
+    text = unicodedata.normalize('NFKC', text or '').lower()
+    text = PUNCTUATION_PATTERN.sub(' ', text)
+    return ' '.join(text.split())
+
+
+def memory_key(title, body):
+    """정확 일치 키 (정규화 제목 + 정규화 본문 해시, 중국어 띄어쓰기 차이를 무시하도록 공백 제거)"""
+    source = normalize_text(title).replace(' ', '') + '\n' + normalize_text(body).replace(' ', '')
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()[:24]
+
+
+def title_ngrams(title, n=3):
+    """제목 글자 n-gram 집합 (공백 제거, 숫자는 #으로 통일해 회차/버전만 다른 제목끼리 일치)"""
+    text = DIGIT_PATTERN.sub('#', normalize_text(title).replace(' ', ''))
+    if len(text) <= n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def load_memory():
+    """{'entries': {키: 번역 항목}, 'entities': {원문 표기: 번역 표기}}
+
+    색인까지 다 만든 뒤 _memory를 마지막에 지정하므로, 다른 스레드는 완성된 메모리와 색인만 봄.
+    """
+    global _memory, _ngram_index
+    if _memory is not None:
+        return _memory
+    with _load_lock:
+        if _memory is None:
+            try:
+                with open(TRANSLATION_MEMORY_FILE, 'r', encoding='utf-8') as f:
+                    memory = json.load(f)
+            except (FileNotFoundError, ValueError):
+                memory = {}
+            memory.setdefault('entries', {})
+            memory.setdefault('entities', {})
+            index = {}
+            for key, entry in memory['entries'].items():
+                _index_entry(index, key, entry)
+            _ngram_index = index
+            _memory = memory
+    return _memory
+
+
+def _index_entry(index, key, entry):
+    for gram in title_ngrams(entry['source_title']):
+        index.setdefault(gram, set()).add(key)
+
+
+def save_memory():
+    """오래 사용하지 않은 항목 정리 후 저장"""
+    if _memory is None:
+        return
+    entries = _memory['entries']
+    if len(entries) > TM_MAX_ENTRIES:
+        for key in sorted(entries, key=lambda k: entries[k]['last_used'])[:len(entries) - TM_MAX_ENTRIES]:
+            del entries[key]
+    with open(TRANSLATION_MEMORY_FILE, 'w', encoding='utf-8') as f:
+        json.dump(_memory, f, ensure_ascii=False, indent=1)
+
+
+def has_exact(title, body):
+    """정확 일치 항목 존재 여부 (사용 기록은 남기지 않음)"""
+    return memory_key(title, body) in load_memory()['entries']
+
+
+def lookup_exact(title, body):
+    """정확 일치 번역 항목 (없으면 None)"""
+    entry = load_memory()['entries'].get(memory_key(title, body))
+    if entry:
+        entry['last_used'] = time.time()
+        entry['hits'] = entry.get('hits', 0) + 1
+    return entry
+
+
+def find_similar(title, threshold=TM_FUZZY_THRESHOLD):
+    """제목 3-gram Jaccard 유사도가 가장 높은 이전 번역 항목 (기준 미달이면 None)"""
+    memory = load_memory()
+    grams = title_ngrams(title)
+    if not grams:
+        return None
+    shared = {}
+    for gram in grams:
+        for key in _ngram_index.get(gram, ()):
+            shared[key] = shared.get(key, 0) + 1
+
+    best_key, best_score = None, 0.0
+    for key, count in shared.items():
+        other = len(title_ngrams(memory['entries'][key]['source_title']))
+        score = count / (len(grams) + other - count)
+        if score > best_score:
+            best_key, best_score = key, score
+    if best_key is None or best_score < threshold:
+        return None
+    return dict(memory['entries'][best_key], similarity=round(best_score, 2))
+
+
+def learn_entities(source_title, title_kr):
+    """원문 《》 이름과 번역 제목의 《》/'' 이름이 같은 개수로 나오면 순서대로 짝지어 저장"""
+    source_names = ZH_NAME_PATTERN.findall(source_title)
+    target_names = [''.join(groups) for groups in KR_NAME_PATTERN.findall(title_kr)]
+    if not source_names or len(source_names) != len(target_names):
+        return
+    entities = load_memory()['entities']
+    for source, target in zip(source_names, target_names):
+        if source != target and source not in ZH_GLOSSARY:
+            entities[source] = target
+
+
+def remember(article):
+    """번역 성공한 기사를 메모리에 저장"""
+    memory = load_memory()
+    key = memory_key(article['title'], article['body'])
+    is_new = key not in memory['entries']
+    entry = {
+        'source_title': article['title'],
+        'title_kr': article['title_kr'],
+        'content_summary_kr': article['content_summary_kr'],
+        'category': article['category'],
+        'last_used': time.time(),
+        'hits': memory['entries'].get(key, {}).get('hits', 0)
+    }
+    memory['entries'][key] = entry
+    if is_new:
+        _index_entry(_ngram_index, key, entry)
+    learn_entities(article['title'], article['title_kr'])
+
+
+def entity_glossary():
+    """기본 용어집 + 학습한 고유명사 표기 (기본 용어집 우선)"""
+    return {**load_memory()['entities'], **ZH_GLOSSARY}
+
+
+def apply_translation_memory(articles):
+    """정확 일치 기사는 이전 번역을 채우고, 번역이 필요한 기사 목록 반환"""
+    pending = []
+    hits = 0
+    for article in articles:
+        entry = lookup_exact(article['title'], article['body'])
+        if entry is None:
+            pending.append(article)
+            continue
+        article['title_kr'] = entry['title_kr']
+        article['content_summary_kr'] = entry['content_summary_kr']
+        article['category'] = entry['category']
+        article['translation_memory'] = True
+        hits += 1
+    if hits:
+        print(f'   ♻️  번역 메모리 재사용: {hits}개 (2단계 호출 생략)')
+    return pending
+
+
+def remember_translations(articles, categories):
+    """번역에 성공한 기사(실패 기본값 제외)를 메모리에 저장하고 파일 갱신"""
+    for article in articles:
+        if article.get('category') in categories and article.get('title_kr') != article['title']:
+            remember(article)
+    save_memory()
@@ -0,0 +1,213 @@
+"""여러 날에 걸친 트렌드 집계 (게임/회사명, 카테고리, 매체의 7일/30일 누적 건수)
+
+매 실행은 그날 기사에서 뽑은 건수(일별 버킷)만 더하고, 창 밖으로 밀려난 날의 버킷을 빼는 방식으로
+누적값을 갱신합니다. 지난 기사 원문은 다시 읽지 않습니다. 같은 날 다시 실행하면 그날 기사 URL별 엔티티를
+병합해 버킷을 다시 계산하므로, since_last_run 모드처럼 새 기사만 들어와도 앞선 실행의 건수가 유지됩니다.
+"""
+import json
+import os
+import re
+from datetime import datetime
+
+TREND_STATE_FILE = os.getenv('TREND_STATE_FILE', 'trend_state.json')
+TREND_WINDOWS = (7, 30)
+TREND_MIN_COUNT = int(os.getenv('TREND_MIN_COUNT', '3'))  # 급상승 판단 최소 7일 건수
+TREND_MIN_RATIO = 2.0  # 7일 건수 / (30일 기준 주평균 + 1)
+TREND_MIN_BASELINE_DAYS = int(os.getenv('TREND_MIN_BASELINE_DAYS', '7'))  # 기준선(7일 이전) 날짜가 이보다 적으면 급상승 판단 안 함
+TREND_TOP_N = 5
+
+# 번역된 제목(title_kr)은 고유명사만 라틴 문자로 남으므로 그 구간을 엔티티로 사용
+LATIN_RUN_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9:'’&.\- ]*[A-Za-z0-9]")
+QUOTED_PATTERN = re.compile(r"《([^》]{2,40})》|「([^」]{2,40})」|‘([^’]{2,40})’|“([^”]{2,40})”|(?<![A-Za-z])'([^']{2,40})'(?![A-Za-z])")
+ENTITY_STOPWORDS = {
+    'CEO', 'CFO', 'COO', 'CTO', 'TOP', 'DLC', 'AI', 'VOD', 'PC', 'VR', 'AR', 'MMO', 'RPG', 'FPS',
+    'OTT', 'IP', 'TV', 'NPC', 'UI', 'API', 'PVP', 'PVE', 'AAA', 'IGN', 'GameSpot', 'Gamelook',
+}
+KNOWN_COMPANIES = {
+    'Activision', 'Blizzard', 'Bandai Namco', 'Bungie', 'Capcom', 'CD Projekt', 'EA', 'Electronic Arts',
+    'Epic Games', 'IO Interactive', 'Krafton', 'Konami', 'Larian', 'Microsoft', 'miHoYo', 'HoYoverse',
+    'NCSoft', 'Netmarble', 'Nexon', 'NetEase', 'Netflix', 'Nintendo', 'Paramount', 'PlayStation',
+    'Riot Games', 'Sega', 'Sony', 'Square Enix', 'Take-Two', 'Tencent', 'Ubisoft', 'Valve', 'Xbox',
+}
+
+
+def load_trend_state(path=TREND_STATE_FILE):
+    """{'days': {날짜: {엔티티 키: 건수}}, 'day_articles': {날짜: {URL: [엔티티 키...]}},
+    'totals': {'7': {...}, '30': {...}}, 'included': {'7': [날짜...], ...}}"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (FileNotFoundError, ValueError):
+        state = {}
+    state.setdefault('days', {})
+    state.setdefault('day_articles', {})
+    state.setdefault('totals', {})
+    state.setdefault('included', {})
+    for window in TREND_WINDOWS:
+        state['totals'].setdefault(str(window), {})
+        state['included'].setdefault(str(window), [])
+    return state
+
+
+def save_trend_state(state, path=TREND_STATE_FILE):
+    """트렌드 상태 저장"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def extract_names(article):
+    """번역 제목에서 게임/회사명 후보 추출 (인용부호 안 이름 우선, 그다음 라틴 문자 구간)"""
+    title = article.get('title_kr') or article.get('title', '')
+    names = [''.join(groups).strip() for groups in QUOTED_PATTERN.findall(title)]
+    covered = ' '.join(names)
+    for run in LATIN_RUN_PATTERN.findall(title):
+        run = run.strip(" .:-'’")
+        if run and run not in covered:
+            names.append(run)
+
+    result = []
+    for name in names:
+        # 'Larian CEO' → 'Larian', 'TOP 3'처럼 일반 단어/숫자뿐이면 제외
+        words = name.split()
+        while words and (words[-1] in ENTITY_STOPWORDS or words[-1].isdigit() and len(words) > 1 and words[-2] in ENTITY_STOPWORDS):
+            words.pop()
+        name = ' '.join(words)
+        if len(name) < 2 or name.isdigit() or name in ENTITY_STOPWORDS:
+            continue
+        if name not in result:
+            result.append(name)
+    return result
+
+
+def extract_entities(article):
+    """기사 하나의 엔티티 키 목록 ('game:이름', 'company:이름', 'category:…', 'source:…')"""
+    keys = []
+    for name in extract_names(article):
+        kind = 'company' if name in KNOWN_COMPANIES else 'game'
+        keys.append(f'{kind}:{name}')
+    if article.get('category'):
+        keys.append(f'category:{article["category"]}')
+    if article.get('media'):
+        keys.append(f'source:{article["media"]}')
+    return keys
+
+
+def count_article_entities(article_entities):
+    """{URL: [엔티티 키...]} → 엔티티별 건수"""
+    counts = {}
+    for keys in article_entities.values():
+        for key in set(keys):
+            counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def _apply_bucket(totals, bucket, sign):
+    for key, count in bucket.items():
+        value = totals.get(key, 0) + sign * count
+        if value > 0:
+            totals[key] = value
+        else:
+            totals.pop(key, None)
+
+
+def update_trend_state(state, day, articles):
+    """그날 버킷을 넣고 창에서 벗어난 날을 빼서 7일/30일 누적값을 갱신
+
+    같은 날 재실행이면 이전 버킷을 되돌린 뒤 그날 기사(URL 기준, 같은 URL은 이번 실행 결과 우선)를
+    병합해 버킷을 다시 계산함.
+    """
+    day_str = day.strftime('%Y-%m-%d')
+    day_date = datetime.strptime(day_str, '%Y-%m-%d').date()
+
+    # 같은 날 재실행이면 이전 버킷을 먼저 되돌림
+    previous = state['days'].pop(day_str, None)
+    for window in TREND_WINDOWS:
+        included = state['included'][str(window)]
+        if previous is not None and day_str in included:
+            _apply_bucket(state['totals'][str(window)], previous, -1)
+            included.remove(day_str)
+
+    legacy_bucket = previous is not None and day_str not in state['day_articles']
+    day_articles = state['day_articles'].setdefault(day_str, {})
+    for i, article in enumerate(articles):
+        day_articles[article.get('url') or f'{day_str}#{i}'] = extract_entities(article)
+    bucket = count_article_entities(day_articles)
+    if legacy_bucket:
+        # URL 목록이 없던 이전 형식의 버킷은 URL로 병합할 수 없으므로 그대로 더함
+        for key, count in previous.items():
+            bucket[key] = bucket.get(key, 0) + count
+    state['days'][day_str] = bucket
+    for window in TREND_WINDOWS:
+        _apply_bucket(state['totals'][str(window)], bucket, 1)
+        state['included'][str(window)].append(day_str)
+
+    # 창 밖으로 밀려난 날의 버킷을 해당 창 누적값에서 제거 (실행을 건너뛴 날이 있어도 나이로 판단)
+    for window in TREND_WINDOWS:
+        included = state['included'][str(window)]
+        for stored_day in list(included):
+            age = (day_date - datetime.strptime(stored_day, '%Y-%m-%d').date()).days
+            if age >= window:
+                _apply_bucket(state['totals'][str(window)], state['days'].get(stored_day, {}), -1)
+                included.remove(stored_day)
+        included.sort()
+
+    # 어느 창에도 속하지 않는 버킷은 삭제
+    live_days = set().union(*(state['included'][str(w)] for w in TREND_WINDOWS))
+    for stored_day in list(state['days']):
+        if stored_day not in live_days:
+            del state['days'][stored_day]
+    for stored_day in list(state['day_articles']):
+        if stored_day not in live_days:
+            del state['day_articles'][stored_day]
+
+    state['last_updated'] = day_str
+    return state
+
+
+def get_rising_entities(state, top_n=TREND_TOP_N, min_count=TREND_MIN_COUNT, min_ratio=TREND_MIN_RATIO,
+                        kinds=('game', 'company'), min_baseline_days=TREND_MIN_BASELINE_DAYS):
+    """최근 7일 건수가 30일 기준선(7일 환산)보다 크게 늘어난 엔티티
+
+    기준선이 되는 7일 이전 날짜가 min_baseline_days보다 적으면 (처음 실행, 짧은 기록) 빈 목록.
+
+    반환: [{'name', 'kind', 'count_7d', 'count_30d', 'baseline_7d', 'ratio'}] (ratio 내림차순)
+    """
+    today = state.get('last_updated')
+    if not today:
+        return []
+    week = state['totals']['7']
+    month = state['totals']['30']
+    recent_days = len(state['included']['7'])
+    older_days = len(state['included']['30']) - recent_days
+    if older_days < max(min_baseline_days, 1):
+        return []
+
+    rising = []
+    for key, count_7d in week.items():
+        kind, _, name = key.partition(':')
+        if kind not in kinds or count_7d < min_count:
+            continue
+        count_30d = month.get(key, count_7d)
+        baseline = (count_30d - count_7d) / older_days * recent_days
+        ratio = count_7d / (baseline + 1)
+        if ratio < min_ratio:
+            continue
+        rising.append({
+            'name': name,
+            'kind': kind,
+            'count_7d': count_7d,
+            'count_30d': count_30d,
+            'baseline_7d': round(baseline, 1),
+            'ratio': round(ratio, 2)
+        })
+    rising.sort(key=lambda e: (e['ratio'], e['count_7d']), reverse=True)
+    return rising[:top_n]
+
+
+def format_trend_signals(rising):
+    """AI Summary 프롬프트에 넣을 급상승 목록 텍스트"""
+    lines = []
+    for entity in rising:
+        lines.append(f"- {entity['name']}: 최근 7일 {entity['count_7d']}건 "
+                     f"(30일 기준 주평균 {entity['baseline_7d']}건)")
+    return '\n'.join(lines)